@@ -0,0 +1,201 @@
+from datetime import datetime, timedelta
+from flask import request, jsonify
+from sqlalchemy import func, case, select
+from extensions import db
+from models import Site, Worker, Attendance
+
+
+def _parse_date(value):
+    return datetime.strptime(value, '%Y-%m-%d').date() if value else None
+
+
+def _day_number(column):
+    """Integer day number of a DATE column, used to find consecutive days"""
+    if db.engine.dialect.name == 'sqlite':
+        return func.julianday(column)
+    return func.extract('epoch', column) / 86400
+
+
+def _attendance_filters(args):
+    """Build WHERE clauses shared by every attendance analytics query"""
+    filters = []
+    if args.get('site_id'):
+        filters.append(Attendance.worker_id.in_(
+            select(Worker.id).where(Worker.site_id == int(args['site_id']))
+        ))
+    if args.get('worker_id'):
+        filters.append(Attendance.worker_id == int(args['worker_id']))
+    if args.get('start_date'):
+        filters.append(Attendance.date >= _parse_date(args['start_date']))
+    if args.get('end_date'):
+        filters.append(Attendance.date <= _parse_date(args['end_date']))
+    return filters
+
+
+def _present_count():
+    return func.sum(case((Attendance.is_present == True, 1), else_=0))  # noqa: E712
+
+
+def _rolling_rate(present, total, window):
+    """Rolling attendance rate over `window` days using prefix sums"""
+    present_prefix = [0]
+    total_prefix = [0]
+    for p, t in zip(present, total):
+        present_prefix.append(present_prefix[-1] + p)
+        total_prefix.append(total_prefix[-1] + t)
+
+    rates = []
+    for i in range(1, len(present_prefix)):
+        lo = max(0, i - window)
+        window_total = total_prefix[i] - total_prefix[lo]
+        window_present = present_prefix[i] - present_prefix[lo]
+        rates.append(round(window_present / window_total, 4) if window_total else None)
+    return rates
+
+
+def _percentiles(values, points):
+    """Nearest-rank percentiles of a list of numbers"""
+    ordered = sorted(values)
+    if not ordered:
+        return {f'p{p}': None for p in points}
+    return {
+        f'p{p}': ordered[max(0, -(-p * len(ordered) // 100) - 1)]
+        for p in points
+    }
+
+
+def register_analytics_routes(app):
+    # Attendance Analytics Routes
+    @app.route('/api/analytics/attendance/trends', methods=['GET'])
+    def get_attendance_trends():
+        """Get daily attendance counts, rates and a rolling rate as compact series"""
+        try:
+            window = int(request.args.get('window', 7))
+            if window < 1:
+                return jsonify({'success': False, 'error': 'window must be at least 1'}), 400
+
+            stmt = (
+                select(Attendance.date, _present_count(), func.count(Attendance.id))
+                .where(*_attendance_filters(request.args))
+                .group_by(Attendance.date)
+                .order_by(Attendance.date)
+            )
+            rows = db.session.execute(stmt).all()
+
+            # Fill calendar gaps so the rolling window spans days, not rows
+            by_date = {row[0]: (int(row[1] or 0), row[2]) for row in rows}
+            dates, present, total = [], [], []
+            if rows:
+                day = rows[0][0]
+                while day <= rows[-1][0]:
+                    p, t = by_date.get(day, (0, 0))
+                    dates.append(day.isoformat())
+                    present.append(p)
+                    total.append(t)
+                    day += timedelta(days=1)
+
+            return jsonify({
+                'success': True,
+                'data': {
+                    'dates': dates,
+                    'present': present,
+                    'total': total,
+                    'rate': [round(p / t, 4) if t else None for p, t in zip(present, total)],
+                    'rolling_rate': _rolling_rate(present, total, window),
+                    'window': window
+                }
+            }), 200
+        except Exception as e:
+            return jsonify({'success': False, 'error': str(e)}), 500
+
+    @app.route('/api/analytics/attendance/workers', methods=['GET'])
+    def get_attendance_worker_stats():
+        """Get per-worker days present, hours and longest absence streak"""
+        try:
+            filters = _attendance_filters(request.args)
+
+            totals_stmt = (
+                select(
+                    Attendance.worker_id,
+                    _present_count(),
+                    func.count(Attendance.id),
+                    func.coalesce(func.sum(Attendance.hours_worked), 0.0)
+                )
+                .where(*filters)
+                .group_by(Attendance.worker_id)
+                .order_by(Attendance.worker_id)
+            )
+            totals = db.session.execute(totals_stmt).all()
+
+            # Gaps and islands: consecutive absent days share (day number - dense rank)
+            absent = (
+                select(
+                    Attendance.worker_id.label('worker_id'),
+                    Attendance.date.label('date'),
+                    (_day_number(Attendance.date) - func.dense_rank().over(
+                        partition_by=Attendance.worker_id,
+                        order_by=Attendance.date
+                    )).label('island')
+                )
+                .where(Attendance.is_present == False, *filters)  # noqa: E712
+                .subquery()
+            )
+            runs = (
+                select(absent.c.worker_id, func.count(func.distinct(absent.c.date)).label('length'))
+                .group_by(absent.c.worker_id, absent.c.island)
+                .subquery()
+            )
+            streaks = dict(db.session.execute(
+                select(runs.c.worker_id, func.max(runs.c.length)).group_by(runs.c.worker_id)
+            ).all())
+
+            worker_ids = [row[0] for row in totals]
+            days_present = [int(row[1] or 0) for row in totals]
+            avg_hours = [round(row[3] / present, 2) if present else 0.0
+                         for row, present in zip(totals, days_present)]
+            return jsonify({
+                'success': True,
+                'data': {
+                    'worker_id': worker_ids,
+                    'days_present': days_present,
+                    'days_absent': [row[2] - present for row, present in zip(totals, days_present)],
+                    'total_hours': [round(row[3], 2) for row in totals],
+                    'avg_hours': avg_hours,
+                    'longest_absence_streak': [streaks.get(worker_id, 0) for worker_id in worker_ids],
+                    'avg_hours_percentiles': _percentiles(avg_hours, [50, 90, 99])
+                }
+            }), 200
+        except Exception as e:
+            return jsonify({'success': False, 'error': str(e)}), 500
+
+    @app.route('/api/analytics/attendance/headcount', methods=['GET'])
+    def get_attendance_headcount():
+        """Get present headcount per site per day as compact series"""
+        try:
+            stmt = (
+                select(Worker.site_id, Attendance.date, _present_count())
+                .join(Worker, Worker.id == Attendance.worker_id)
+                .where(*_attendance_filters(request.args))
+                .group_by(Worker.site_id, Attendance.date)
+                .order_by(Worker.site_id, Attendance.date)
+            )
+            rows = db.session.execute(stmt).all()
+
+            series = {}
+            for site_id, day, present in rows:
+                site_series = series.setdefault(site_id, {'site_id': site_id, 'dates': [], 'headcount': []})
+                site_series['dates'].append(day.isoformat())
+                site_series['headcount'].append(int(present or 0))
+
+            names = dict(db.session.execute(
+                select(Site.id, Site.name).where(Site.id.in_(list(series)))
+            ).all()) if series else {}
+            for site_id, site_series in series.items():
+                site_series['site_name'] = names.get(site_id)
+
+            return jsonify({
+                'success': True,
+                'data': list(series.values())
+            }), 200
+        except Exception as e:
+            return jsonify({'success': False, 'error': str(e)}), 500
@@ -3,9 +3,8 @@ import sys
 import logging
 from flask import Flask, jsonify, request
 from flask_cors import CORS
-from flask_migrate import Migrate
-from datetime import datetime
-from extensions import db  # Import db from extensions
+from flask_migrate import Migrate, stamp, upgrade
+from extensions import db, enable_sqlite_foreign_keys  # Import db from extensions
 
 # -------------------------------------------------
 # Setup logging so it always prints to stdout
@@ -28,25 +27,82 @@ instance_path = os.path.join(basedir, 'instance')
 if not os.path.exists(instance_path):
     os.makedirs(instance_path)
 
-app.config['SQLALCHEMY_DATABASE_URI'] = 'sqlite:///' + os.path.join(instance_path, 'peakstart.db')
+# DATABASE_URL points the app at another database (benchmarks use a scratch file)
+app.config['SQLALCHEMY_DATABASE_URI'] = os.environ.get(
+    'DATABASE_URL', 'sqlite:///' + os.path.join(instance_path, 'peakstart.db'))
 app.config['SQLALCHEMY_TRACK_MODIFICATIONS'] = False
 app.config['SECRET_KEY'] = 'your-secret-key-here'
+# Optional read replica (any SQLAlchemy URL); replicas.py routes GET traffic to it
+if os.environ.get('DATABASE_REPLICA_URL'):
+    app.config['SQLALCHEMY_BINDS'] = {'replica': os.environ['DATABASE_REPLICA_URL']}
+# Optional multi-tenancy: one SQLite file per tenant in this directory (tenants.py)
+if os.environ.get('TENANT_DATABASE_DIR'):
+    app.config['TENANT_DATABASE_DIR'] = os.environ['TENANT_DATABASE_DIR']
 
 # Initialize extensions
 db.init_app(app)
-migrate = Migrate(app, db)
+with app.app_context():
+    enable_sqlite_foreign_keys(db.engine)
+migrate = Migrate(app, db, directory=os.path.join(basedir, 'migrations'))
 CORS(app, resources={r"/api/*": {"origins": "*"}}, supports_credentials=True,
      methods=["GET", "POST", "PUT", "DELETE", "OPTIONS"],
-     allow_headers=["Content-Type", "Authorization"])
+     allow_headers=["Content-Type", "Authorization", "X-Read-Primary-Until"],
+     expose_headers=["X-Read-Primary-Until", "X-Read-Source"])
 
 # Import models and routes after app and db are defined
 import models
 from routes import register_routes
+from health import register_health_routes
+from analytics import register_analytics_routes
+from forecasting import register_forecasting
+from audits import register_audit_commands
+from archive import register_archive
+from batch import register_batch_routes
+from uploads import register_upload_routes
+from media import register_media_routes
+from compression import register_compression
+from contact_intake import register_contact_intake
+from contact_inbox import register_contact_inbox
+from roster import register_roster
+from sync import register_sync
+from site_events import register_site_events
+from tenants import register_tenants
+from replicas import register_read_replicas
+from public_bundle import register_public_bundle
+from snapshots import register_snapshots
 register_routes(app)
+register_health_routes(app)
+register_analytics_routes(app)
+register_forecasting(app)
+register_audit_commands(app)
+register_archive(app)
+register_batch_routes(app)
+register_upload_routes(app)
+register_media_routes(app)
+register_compression(app)
+register_contact_intake(app)
+register_contact_inbox(app)
+register_roster(app)
+register_sync(app)
+register_site_events(app)
+register_tenants(app)
+register_read_replicas(app)
+register_public_bundle(app)
+register_snapshots(app)
+
+# Create database tables, or bring an existing database up to the migration head
+BASELINE_REVISION = '0001'
 
-# Create database tables
 with app.app_context():
-    db.create_all()
+    existing_tables = db.inspect(db.engine).get_table_names()
+    if not existing_tables:
+        db.create_all()
+        stamp()
+    else:
+        if 'alembic_version' not in existing_tables:
+            # Created by db.create_all() before migrations were introduced
+            stamp(revision=BASELINE_REVISION)
+        upgrade()
 
 # -------------------------------------------------
 # Logging middleware for requests & responses
@@ -68,14 +124,5 @@ def handle_exception(e):
     logger.exception("🔥 Internal Server Error")
     return jsonify({"error": "Internal Server Error"}), 500
 
-# Health check
-@app.route('/health')
-def health_check():
-    return jsonify({
-        "status": "healthy",
-        "timestamp": datetime.utcnow().isoformat(),
-        "database": "connected" if db.engine.pool.checkedin() > 0 else "disconnected"
-    })
-
 if __name__ == '__main__':
     app.run(debug=True, host='0.0.0.0', port=5000)
@@ -0,0 +1,209 @@
+import json
+import logging
+import queue
+import threading
+import time
+from collections import defaultdict
+from datetime import datetime
+import click
+from flask import request, jsonify, current_app
+from sqlalchemy import select
+from extensions import db
+from roster import mark_roster_stale
+from sync import record_tombstones
+from tenants import command_tenants, current_tenant, tenant_option, tenant_scope
+from models import (Site, Worker, Attendance, DailyActivity, ActivityWorker, Cost,
+                    ArchivedAttendance, ArchivedDailyActivity, ArchivedCost)
+
+logger = logging.getLogger(__name__)
+
+
+def _take_batch(table, condition, batch_size):
+    return db.session.execute(
+        select(table).where(condition).order_by(table.c.id).limit(batch_size)
+    ).mappings().all()
+
+
+def _archive_costs(site_id, batch_size, archived_at):
+    table = Cost.__table__
+    rows = _take_batch(table, table.c.site_id == site_id, batch_size)
+    if rows:
+        db.session.execute(ArchivedCost.__table__.insert(), [
+            dict(row, archived_at=archived_at) for row in rows
+        ])
+        ids = [row['id'] for row in rows]
+        db.session.execute(table.delete().where(table.c.id.in_(ids)))
+        record_tombstones('cost', ids)
+    return len(rows)
+
+
+def _archive_daily_activities(site_id, batch_size, archived_at):
+    table = DailyActivity.__table__
+    links = ActivityWorker.__table__
+    rows = _take_batch(table, table.c.site_id == site_id, batch_size)
+    if rows:
+        ids = [row['id'] for row in rows]
+        involved = defaultdict(list)
+        for activity_id, worker_id in db.session.execute(
+            select(links.c.activity_id, links.c.worker_id)
+            .where(links.c.activity_id.in_(ids))
+            .order_by(links.c.activity_id, links.c.worker_id)
+        ):
+            involved[activity_id].append(worker_id)
+
+        db.session.execute(ArchivedDailyActivity.__table__.insert(), [
+            dict(row, workers_involved=json.dumps(involved[row['id']]), archived_at=archived_at)
+            for row in rows
+        ])
+        db.session.execute(links.delete().where(links.c.activity_id.in_(ids)))
+        db.session.execute(table.delete().where(table.c.id.in_(ids)))
+        record_tombstones('daily_activity', ids)
+    return len(rows)
+
+
+def _archive_attendance(site_id, batch_size, archived_at):
+    table = Attendance.__table__
+    site_workers = select(Worker.id).where(Worker.site_id == site_id)
+    rows = _take_batch(table, table.c.worker_id.in_(site_workers), batch_size)
+    if rows:
+        db.session.execute(ArchivedAttendance.__table__.insert(), [
+            dict(row, site_id=site_id, archived_at=archived_at) for row in rows
+        ])
+        ids = [row['id'] for row in rows]
+        db.session.execute(table.delete().where(table.c.id.in_(ids)))
+        record_tombstones('attendance', ids)
+    return len(rows)
+
+
+# Costs go first because they reference daily activities
+_ARCHIVE_STEPS = [_archive_costs, _archive_daily_activities, _archive_attendance]
+
+
+def archive_site(site_id, batch_size=None, pause=None):
+    """Move a site's costs, activities and attendance into the archive tables.
+
+    Each batch is its own short transaction, with a pause in between, so
+    the SQLite write lock is never held for long. Rows are copied and
+    deleted in the same transaction, so an interrupted run can be resumed.
+    The site_daily_total rollup is left alone and keeps the site's totals.
+    """
+    batch_size = batch_size or current_app.config['ARCHIVE_BATCH_SIZE']
+    pause = current_app.config['ARCHIVE_BATCH_PAUSE_SECONDS'] if pause is None else pause
+
+    moved = 0
+    for step in _ARCHIVE_STEPS:
+        while True:
+            count = step(site_id, batch_size, datetime.utcnow())
+            db.session.commit()
+            moved += count
+            if count < batch_size:
+                break
+            if pause:
+                time.sleep(pause)
+
+    site = db.session.get(Site, site_id)
+    if site is not None:
+        site.archived_at = datetime.utcnow()
+        # Archived attendance and costs no longer count towards the roster
+        mark_roster_stale(db.session.execute(select(Worker.id).where(Worker.site_id == site_id)).scalars())
+        db.session.commit()
+    logger.info(f"Archived {moved} rows for site {site_id}")
+    return moved
+
+
+class ArchiveWorker:
+    """Single background thread that archives queued sites one at a time"""
+
+    def __init__(self, app):
+        self.app = app
+        self.queue = queue.Queue()
+        self.pending = set()
+        self._lock = threading.Lock()
+        self._thread = None
+
+    def enqueue(self, site_id):
+        # Site ids repeat across tenant databases
+        job = (current_tenant(), site_id)
+        with self._lock:
+            if job in self.pending:
+                return
+            self.pending.add(job)
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(target=self._run, name='site-archiver', daemon=True)
+                self._thread.start()
+        self.queue.put(job)
+
+    def _run(self):
+        with self.app.app_context():
+            while True:
+                tenant, site_id = job = self.queue.get()
+                try:
+                    with tenant_scope(tenant):
+                        archive_site(site_id)
+                except Exception:
+                    db.session.rollback()
+                    logger.exception(f"Archiving site {site_id} failed")
+                finally:
+                    db.session.remove()
+                    with self._lock:
+                        self.pending.discard(job)
+                    self.queue.task_done()
+
+
+_ARCHIVED_MODELS = {
+    'attendance': ArchivedAttendance,
+    'daily_activities': ArchivedDailyActivity,
+    'costs': ArchivedCost
+}
+
+
+def register_archive(app):
+    app.config.setdefault('ARCHIVE_BATCH_SIZE', 500)
+    app.config.setdefault('ARCHIVE_BATCH_PAUSE_SECONDS', 0.05)
+    app.extensions['archive_worker'] = ArchiveWorker(app)
+
+    @app.cli.command('archive-sites')
+    @click.option('--batch-size', type=int, default=None, help='Rows moved per transaction.')
+    @tenant_option
+    def archive_sites_command(batch_size, tenant):
+        """Archive every completed or deleted site with live data."""
+        for name in command_tenants(tenant):
+            with tenant_scope(name):
+                sites = Site.query.filter(db.or_(Site.status == 'completed', Site.deleted_at.isnot(None))).all()
+                for site in sites:
+                    moved = archive_site(site.id, batch_size)
+                    click.echo(f'Site {site.id}: archived {moved} rows')
+
+    # Site Archive Routes
+    @app.route('/api/sites/<int:site_id>/archive', methods=['POST'])
+    def archive_site_data(site_id):
+        """Queue a completed or deleted site for background archival"""
+        try:
+            site = Site.query.get_or_404(site_id)
+            if site.status != 'completed' and site.deleted_at is None:
+                return jsonify({'success': False, 'error': 'Only completed or deleted sites can be archived'}), 400
+
+            current_app.extensions['archive_worker'].enqueue(site.id)
+            return jsonify({
+                'success': True,
+                'message': 'Site archival started'
+            }), 202
+        except Exception as e:
+            return jsonify({'success': False, 'error': str(e)}), 500
+
+    @app.route('/api/sites/<int:site_id>/archive', methods=['GET'])
+    def get_site_archive(site_id):
+        """Get archived attendance, activities or costs of a site"""
+        try:
+            kind = request.args.get('type', 'costs')
+            model = _ARCHIVED_MODELS.get(kind)
+            if model is None:
+                return jsonify({'success': False, 'error': f'Unknown archive type {kind}'}), 400
+
+            records = model.query.filter_by(site_id=site_id).order_by(model.date.desc()).all()
+            return jsonify({
+                'success': True,
+                'data': [record.to_dict() for record in records]
+            }), 200
+        except Exception as e:
+            return jsonify({'success': False, 'error': str(e)}), 500
@@ -0,0 +1,210 @@
+import asyncio
+import io
+import queue
+import re
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from tempfile import SpooledTemporaryFile
+from urllib.parse import parse_qs
+from flask import Response
+from app import app
+from extensions import db
+from models import Site
+from site_events import STREAM_HEADERS, STREAM_PREAMBLE, site_channel
+
+# ASGI serving mode: `uvicorn asgi:asgi_app`
+#
+# Flask views and SQLAlchemy stay synchronous and run on a bounded thread
+# pool, so a slow export or analytics query occupies one pool thread
+# instead of a server worker. Site event streams are served natively on
+# the event loop and hold no thread at all while they wait for events.
+
+_SPOOL_MAX_SIZE = 1024 * 1024
+_DONE = object()
+
+
+def _environ(scope, body):
+    """WSGI environ for an ASGI HTTP scope"""
+    server = scope.get('server') or ('localhost', 80)
+    client = scope.get('client') or ('', 0)
+    environ = {
+        'REQUEST_METHOD': scope['method'],
+        'SCRIPT_NAME': scope.get('root_path', '').encode('utf-8').decode('latin-1'),
+        'PATH_INFO': scope['path'].encode('utf-8').decode('latin-1'),
+        'QUERY_STRING': scope['query_string'].decode('latin-1'),
+        'SERVER_NAME': server[0],
+        'SERVER_PORT': str(server[1]),
+        'SERVER_PROTOCOL': f"HTTP/{scope['http_version']}",
+        'REMOTE_ADDR': client[0],
+        'REMOTE_PORT': str(client[1]),
+        'wsgi.version': (1, 0),
+        'wsgi.url_scheme': scope.get('scheme', 'http'),
+        'wsgi.input': body,
+        'wsgi.errors': sys.stderr,
+        'wsgi.multithread': True,
+        'wsgi.multiprocess': False,
+        'wsgi.run_once': False,
+    }
+    for name, value in scope['headers']:
+        name = name.decode('latin-1')
+        value = value.decode('latin-1')
+        if name == 'content-type':
+            key = 'CONTENT_TYPE'
+        elif name == 'content-length':
+            key = 'CONTENT_LENGTH'
+        else:
+            key = 'HTTP_' + name.upper().replace('-', '_')
+        environ[key] = f'{environ[key]},{value}' if key in environ else value
+    return environ
+
+
+class AsgiApp:
+    """ASGI application serving the Flask app from a thread pool, with async site event streams"""
+
+    def __init__(self, flask_app):
+        flask_app.config.setdefault('ASGI_THREADS', 16)
+        self.flask_app = flask_app
+        self.executor = ThreadPoolExecutor(max_workers=flask_app.config['ASGI_THREADS'],
+                                           thread_name_prefix='asgi-wsgi')
+        self.routes = [(re.compile(r'^/api/sites/(\d+)/events$'), self.site_events)]
+
+    async def __call__(self, scope, receive, send):
+        if scope['type'] == 'lifespan':
+            await self.lifespan(receive, send)
+            return
+        if scope['type'] != 'http':
+            return
+        if scope['method'] == 'GET':
+            for pattern, handler in self.routes:
+                match = pattern.match(scope['path'])
+                if match:
+                    await handler(scope, receive, send, *match.groups())
+                    return
+        await self.call_wsgi(scope, receive, send)
+
+    async def lifespan(self, receive, send):
+        while True:
+            message = await receive()
+            if message['type'] == 'lifespan.startup':
+                await send({'type': 'lifespan.startup.complete'})
+            elif message['type'] == 'lifespan.shutdown':
+                # Requests still draining need the pool; its threads exit with the process
+                await send({'type': 'lifespan.shutdown.complete'})
+                return
+
+    async def run_sync(self, func, *args):
+        return await asyncio.get_running_loop().run_in_executor(self.executor, func, *args)
+
+    async def call_wsgi(self, scope, receive, send):
+        """Run the request through Flask on the thread pool, streaming the response back"""
+        body = SpooledTemporaryFile(max_size=_SPOOL_MAX_SIZE)
+        while True:
+            message = await receive()
+            if message['type'] == 'http.disconnect':
+                body.close()
+                return
+            body.write(message.get('body', b''))
+            if not message.get('more_body'):
+                break
+        body.seek(0)
+
+        started = {}
+
+        def start_response(status, headers, exc_info=None):
+            started['status'] = int(status.split(' ', 1)[0])
+            started['headers'] = [(name.lower().encode('latin-1'), value.encode('latin-1'))
+                                  for name, value in headers]
+
+        def call():
+            result = self.flask_app(_environ(scope, body), start_response)
+            return result, iter(result)
+
+        result, chunks = await self.run_sync(call)
+        try:
+            # start_response may be deferred until the first chunk
+            chunk = await self.run_sync(next, chunks, _DONE)
+            await send({'type': 'http.response.start', 'status': started['status'],
+                        'headers': started['headers']})
+            while chunk is not _DONE:
+                if chunk:
+                    await send({'type': 'http.response.body', 'body': chunk, 'more_body': True})
+                chunk = await self.run_sync(next, chunks, _DONE)
+            await send({'type': 'http.response.body', 'body': b''})
+        finally:
+            if hasattr(result, 'close'):
+                await self.run_sync(result.close)
+            body.close()
+
+    def _site_channel(self, scope, site_id):
+        """Bus channel of the requested site and the stream's response headers,
+        or (None, None) when Flask should answer instead"""
+        # before_request hooks resolve the tenant (and log the request)
+        with self.flask_app.request_context(_environ(scope, io.BytesIO())):
+            if self.flask_app.preprocess_request() is not None:
+                return None, None
+            if db.session.get(Site, site_id) is None:
+                return None, None
+            # after_request hooks (CORS, X-Read-Source, logging) see the same
+            # response the Flask route would return, minus its body
+            response = self.flask_app.process_response(
+                Response(mimetype='text/event-stream', headers=STREAM_HEADERS)
+            )
+            response.headers.pop('Content-Length', None)
+            headers = [(name.lower().encode('latin-1'), value.encode('latin-1'))
+                       for name, value in response.headers.to_wsgi_list()]
+            return site_channel(site_id), headers
+
+    async def site_events(self, scope, receive, send, site_id):
+        """Async twin of the /api/sites/<id>/events route"""
+        site_id = int(site_id)
+        bus = self.flask_app.extensions['site_events']
+        headers = dict(scope['headers'])
+        last_event_id = (headers.get(b'last-event-id', b'').decode('latin-1')
+                         or parse_qs(scope['query_string'].decode('latin-1')).get('last_event_id', [None])[0])
+
+        subscriber, reset_id = None, None
+        channel, start_headers = await self.run_sync(self._site_channel, scope, site_id)
+        if channel is not None:
+            subscriber, reset_id = bus.subscribe(channel, last_event_id)
+        if subscriber is None:
+            # Unknown tenant or site, or too many subscribers: let the Flask route answer
+            await self.call_wsgi(scope, receive, send)
+            return
+
+        loop = asyncio.get_running_loop()
+        wakeup = asyncio.Event()
+        subscriber.wakeup = lambda: loop.call_soon_threadsafe(wakeup.set)
+        disconnected = asyncio.ensure_future(self._wait_for_disconnect(receive))
+        heartbeat = self.flask_app.config['SITE_EVENTS_HEARTBEAT_SECONDS']
+        try:
+            await send({'type': 'http.response.start', 'status': 200, 'headers': start_headers})
+            preamble = STREAM_PREAMBLE + (bus.format_reset(reset_id) if reset_id else '')
+            await send({'type': 'http.response.body', 'body': preamble.encode('utf-8'), 'more_body': True})
+            while not subscriber.overflowed and not disconnected.done():
+                try:
+                    item = subscriber.queue.get_nowait()
+                except queue.Empty:
+                    wakeup.clear()
+                    if not subscriber.queue.empty():
+                        continue
+                    waiter = asyncio.ensure_future(wakeup.wait())
+                    done, _ = await asyncio.wait({waiter, disconnected}, timeout=heartbeat,
+                                                 return_when=asyncio.FIRST_COMPLETED)
+                    waiter.cancel()
+                    if not done:
+                        await send({'type': 'http.response.body', 'body': b': keep-alive\n\n', 'more_body': True})
+                    continue
+                await send({'type': 'http.response.body', 'body': bus.format(item).encode('utf-8'),
+                            'more_body': True})
+            if not disconnected.done():
+                await send({'type': 'http.response.body', 'body': b''})
+        finally:
+            bus.unsubscribe(subscriber)
+            disconnected.cancel()
+
+    async def _wait_for_disconnect(self, receive):
+        while (await receive())['type'] != 'http.disconnect':
+            pass
+
+
+asgi_app = AsgiApp(app)
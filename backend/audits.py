@@ -0,0 +1,81 @@
+import logging
+import click
+from sqlalchemy import select, update, bindparam
+from extensions import db
+from models import DailyActivity, compute_total_price
+from forecasting import rebuild_site_totals
+from tenants import command_tenants, tenant_option, tenant_scope
+
+logger = logging.getLogger(__name__)
+
+
+def audit_activity_totals(chunk_size=1000, repair=False):
+    """Scan daily_activity in id order and find rows whose stored total_price
+    differs from quantity x unit_price; optionally rewrite them chunk by chunk.
+    """
+    table = DailyActivity.__table__
+    repair_stmt = (
+        update(table)
+        .where(table.c.id == bindparam('activity_id'))
+        .values(total_price=bindparam('expected'))
+    )
+
+    scanned = 0
+    mismatches = []
+    last_id = 0
+    while True:
+        rows = db.session.execute(
+            select(table.c.id, table.c.site_id, table.c.quantity, table.c.unit_price, table.c.total_price)
+            .where(table.c.id > last_id)
+            .order_by(table.c.id)
+            .limit(chunk_size)
+        ).all()
+        if not rows:
+            break
+
+        chunk_mismatches = []
+        for activity_id, site_id, quantity, unit_price, total_price in rows:
+            expected = compute_total_price(quantity, unit_price)
+            if expected != total_price:
+                chunk_mismatches.append({
+                    'activity_id': activity_id,
+                    'site_id': site_id,
+                    'stored': total_price,
+                    'expected': expected
+                })
+
+        if repair and chunk_mismatches:
+            db.session.execute(repair_stmt, [
+                {'activity_id': m['activity_id'], 'expected': m['expected']} for m in chunk_mismatches
+            ])
+            db.session.commit()
+
+        scanned += len(rows)
+        mismatches.extend(chunk_mismatches)
+        last_id = rows[-1][0]
+
+    db.session.commit()
+    if repair and mismatches:
+        # Repairs bypass the ORM, so refresh the revenue rollup of affected sites
+        rebuild_site_totals(sorted({m['site_id'] for m in mismatches}))
+    if mismatches:
+        logger.warning(f"Found {len(mismatches)} daily activities with a mismatched total_price"
+                       f"{' (repaired)' if repair else ''}")
+    return scanned, mismatches
+
+
+def register_audit_commands(app):
+    @app.cli.command('audit-activity-totals')
+    @click.option('--chunk-size', default=1000, show_default=True, help='Rows read per query.')
+    @click.option('--repair', is_flag=True, help='Rewrite mismatched totals.')
+    @tenant_option
+    def audit_activity_totals_command(chunk_size, repair, tenant):
+        """Report (and optionally repair) DailyActivity.total_price mismatches."""
+        for name in command_tenants(tenant):
+            with tenant_scope(name):
+                scanned, mismatches = audit_activity_totals(chunk_size, repair)
+            for mismatch in mismatches:
+                click.echo(f"activity {mismatch['activity_id']}: stored {mismatch['stored']}, "
+                           f"expected {mismatch['expected']}")
+            click.echo(f"Scanned {scanned} activities, {len(mismatches)} mismatched"
+                       f"{', repaired' if repair and mismatches else ''}")
@@ -0,0 +1,142 @@
+from flask import request, jsonify, current_app
+from extensions import db
+from models import Service, Project, BlogPost, TeamMember, Testimonial, CompanyStat, Certification, Award
+
+# Entity name -> (model, {JSON key: column}); keys match the single-item routes
+_ENTITIES = {
+    'service': (Service, {
+        'title': 'title', 'description': 'description', 'image': 'image', 'icon_name': 'icon_name'
+    }),
+    'project': (Project, {
+        'title': 'title', 'category': 'category', 'location': 'location',
+        'completionDate': 'completion_date', 'image': 'image', 'description': 'description',
+        'client': 'client'
+    }),
+    'blog_post': (BlogPost, {
+        'title': 'title', 'excerpt': 'excerpt', 'content': 'content', 'author': 'author',
+        'publishDate': 'publish_date', 'category': 'category', 'image': 'image', 'readTime': 'read_time'
+    }),
+    'team_member': (TeamMember, {
+        'name': 'name', 'position': 'position', 'experience': 'experience', 'image': 'image', 'bio': 'bio'
+    }),
+    'testimonial': (Testimonial, {
+        'name': 'name', 'company': 'company', 'text': 'text', 'image': 'image'
+    }),
+    'company_stat': (CompanyStat, {
+        'number': 'number', 'label': 'label', 'icon_name': 'icon_name'
+    }),
+    'certification': (Certification, {'name': 'name'}),
+    'award': (Award, {'name': 'name', 'year': 'year'}),
+}
+
+
+class BatchOperationError(Exception):
+    def __init__(self, message, status=400):
+        super().__init__(message)
+        self.status = status
+
+
+def _get(model, op):
+    if 'id' not in op:
+        raise BatchOperationError("Missing 'id'")
+    instance = db.session.get(model, op['id'])
+    if instance is None:
+        raise BatchOperationError(f"{model.__name__} {op['id']} not found", 404)
+    return instance
+
+
+def _apply(op):
+    """Apply one operation to the session and return its result entry"""
+    entity = op.get('entity')
+    if entity not in _ENTITIES:
+        raise BatchOperationError(f'Unknown entity {entity}')
+    model, fields = _ENTITIES[entity]
+    action = op.get('op')
+    data = op.get('data') or {}
+
+    if action == 'create':
+        missing = [
+            key for key, column in fields.items()
+            if key not in data and not model.__table__.c[column].nullable
+        ]
+        if missing:
+            raise BatchOperationError(f"Missing field(s): {', '.join(missing)}")
+        instance = model(**{column: data[key] for key, column in fields.items() if key in data})
+        if entity == 'service' and 'features' in data:
+            instance.set_features(data['features'])
+        db.session.add(instance)
+        status = 201
+    elif action == 'update':
+        instance = _get(model, op)
+        for key, column in fields.items():
+            if key in data:
+                setattr(instance, column, data[key])
+        if entity == 'service' and 'features' in data:
+            instance.set_features(data['features'])
+        status = 200
+    elif action == 'delete':
+        instance = _get(model, op)
+        db.session.delete(instance)
+        db.session.flush()
+        return {'op': action, 'entity': entity, 'id': instance.id, 'status': 200}
+    else:
+        raise BatchOperationError(f'Unknown op {action}')
+
+    # Flush per operation so constraint errors point at the operation that caused them
+    db.session.flush()
+    return {'op': action, 'entity': entity, 'id': instance.id, 'status': status, 'instance': instance}
+
+
+def register_batch_routes(app):
+    app.config.setdefault('BATCH_MAX_OPERATIONS', 200)
+
+    # Batch Routes
+    @app.route('/api/batch', methods=['POST'])
+    def apply_batch():
+        """Apply a list of admin create/update/delete operations in one transaction"""
+        operations = (request.get_json(silent=True) or {}).get('operations')
+        if not isinstance(operations, list) or not operations:
+            return jsonify({'success': False, 'error': "'operations' must be a non-empty list"}), 400
+        if len(operations) > current_app.config['BATCH_MAX_OPERATIONS']:
+            return jsonify({
+                'success': False,
+                'error': f"At most {current_app.config['BATCH_MAX_OPERATIONS']} operations per batch"
+            }), 400
+
+        results = []
+        try:
+            for index, op in enumerate(operations):
+                try:
+                    results.append(_apply(op if isinstance(op, dict) else {}))
+                except Exception as e:
+                    db.session.rollback()
+                    status = e.status if isinstance(e, BatchOperationError) else 400
+                    op = op if isinstance(op, dict) else {}
+                    results.append({'op': op.get('op'), 'entity': op.get('entity'), 'id': op.get('id'),
+                                    'status': status, 'error': str(e)})
+                    # Nothing was written; earlier operations are reported as rolled back
+                    for result in results[:-1]:
+                        result.pop('instance', None)
+                        result['status'] = 'rolled_back'
+                        if result['op'] == 'create':
+                            result['id'] = None
+                    return jsonify({
+                        'success': False,
+                        'error': f'Operation {index} failed: {e}',
+                        'failed_index': index,
+                        'data': results
+                    }), status
+
+            db.session.commit()
+            for result in results:
+                instance = result.pop('instance', None)
+                if instance is not None:
+                    result['data'] = instance.to_dict()
+            return jsonify({
+                'success': True,
+                'data': results,
+                'message': f'{len(results)} operations applied successfully'
+            }), 200
+        except Exception as e:
+            db.session.rollback()
+            return jsonify({'success': False, 'error': str(e)}), 500
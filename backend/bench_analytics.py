@@ -0,0 +1,95 @@
+import argparse
+import os
+import random
+import tempfile
+import time
+from datetime import date, datetime, timedelta
+
+# Times the attendance analytics endpoints on a generated attendance table
+# (workers x days rows) in a scratch SQLite database:
+#
+#   python bench_analytics.py --workers 5000 --days 1000   # 5M rows
+#
+# The database is built once and kept, so later runs with the same size
+# only time the requests (--rebuild starts over).
+
+_ENDPOINTS = [
+    '/api/analytics/attendance/trends',
+    '/api/analytics/attendance/workers',
+    '/api/analytics/attendance/headcount',
+]
+
+
+def _seed(db, args):
+    from models import Site, Worker, Attendance
+    now = datetime.utcnow()
+    sites = max(1, args.workers // 100)
+    db.session.execute(Site.__table__.insert(), [
+        {'id': i + 1, 'name': f'Site {i + 1}', 'location': 'Bench', 'status': 'active',
+         'created_at': now, 'updated_at': now}
+        for i in range(sites)
+    ])
+    db.session.execute(Worker.__table__.insert(), [
+        {'id': i + 1, 'name': f'Worker {i + 1}', 'position': 'Laborer', 'daily_price': 10000,
+         'site_id': i % sites + 1, 'is_active': True, 'created_at': now, 'updated_at': now}
+        for i in range(args.workers)
+    ])
+    db.session.commit()
+
+    rng = random.Random(42)
+    first_day = date(2020, 1, 1)
+    table = Attendance.__table__
+    for day_offset in range(args.days):
+        day = first_day + timedelta(days=day_offset)
+        rows = []
+        for worker_id in range(1, args.workers + 1):
+            present = rng.random() < 0.9
+            rows.append({'worker_id': worker_id, 'date': day, 'hours_worked': 8.0 if present else 0.0,
+                         'is_present': present, 'created_at': now, 'updated_at': now})
+        db.session.execute(table.insert(), rows)
+        if day_offset % 50 == 49:
+            db.session.commit()
+            print(f'  seeded {(day_offset + 1) * args.workers} rows')
+    db.session.commit()
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Time the attendance analytics endpoints on a large table')
+    parser.add_argument('--workers', type=int, default=5000)
+    parser.add_argument('--days', type=int, default=1000)
+    parser.add_argument('--repeat', type=int, default=3, help='Timed requests per endpoint')
+    parser.add_argument('--rebuild', action='store_true', help='Regenerate the scratch database')
+    args = parser.parse_args()
+
+    path = os.path.join(tempfile.gettempdir(), f'peakstart_bench_{args.workers}x{args.days}.db')
+    if args.rebuild and os.path.exists(path):
+        os.remove(path)
+    fresh = not os.path.exists(path)
+    # Must be set before the app is imported
+    os.environ['DATABASE_URL'] = 'sqlite:///' + path
+
+    from app import app
+    from extensions import db
+
+    with app.app_context():
+        if fresh:
+            print(f'Seeding {args.workers * args.days} attendance rows into {path}')
+            started = time.perf_counter()
+            _seed(db, args)
+            print(f'Seeded in {time.perf_counter() - started:.1f}s')
+
+    client = app.test_client()
+    for endpoint in _ENDPOINTS:
+        timings = []
+        for _ in range(args.repeat):
+            started = time.perf_counter()
+            response = client.get(endpoint)
+            timings.append(time.perf_counter() - started)
+            if response.status_code != 200:
+                raise SystemExit(f'{endpoint} returned {response.status_code}: {response.get_data(as_text=True)[:200]}')
+        print(f'{endpoint:40} best={min(timings):7.2f}s median={sorted(timings)[len(timings) // 2]:7.2f}s '
+              f'payload={len(response.get_data()) / 1024:8.1f} KB')
+
+
+if __name__ == '__main__':
+    main()
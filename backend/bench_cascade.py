@@ -0,0 +1,93 @@
+import argparse
+import os
+import tempfile
+import time
+from datetime import date, datetime, timedelta
+
+# Times deleting a worker with many attendance rows in a scratch SQLite
+# database, counting the SQL statements the delete issues:
+#
+#   python bench_cascade.py --rows 10000
+#   python bench_cascade.py --rows 10000 --orm-cascade   # load and delete children in the session
+#
+# --orm-cascade turns passive_deletes off on the worker's relationships, so
+# the session loads and deletes the children itself as it did before
+# ON DELETE CASCADE.
+
+
+def _seed_worker(db, rows):
+    from models import Site, Worker, Attendance
+    now = datetime.utcnow()
+    site = Site.query.first()
+    if site is None:
+        site = Site(name='Bench site', location='Bench', status='active')
+        db.session.add(site)
+        db.session.flush()
+    worker = Worker(name='Bench worker', position='Laborer', daily_price=10000, site_id=site.id)
+    db.session.add(worker)
+    db.session.flush()
+    first_day = date(2000, 1, 1)
+    db.session.execute(Attendance.__table__.insert(), [
+        {'worker_id': worker.id, 'date': first_day + timedelta(days=i), 'hours_worked': 8.0,
+         'is_present': True, 'created_at': now, 'updated_at': now}
+        for i in range(rows)
+    ])
+    db.session.commit()
+    return worker.id
+
+
+def _disable_passive_deletes():
+    from sqlalchemy.orm import configure_mappers
+    from models import Worker
+    configure_mappers()
+    for relationship in (Worker.attendances, Worker.costs, Worker.activity_links, Worker.roster_stat):
+        relationship.property.passive_deletes = False
+        # The flush reads the flag from the dependency processor built at configure time
+        relationship.property._dependency_processor.passive_deletes = False
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Time deleting a worker with many attendance rows')
+    parser.add_argument('--rows', type=int, default=10000, help='Attendance rows of the deleted worker')
+    parser.add_argument('--repeat', type=int, default=3, help='Timed deletes')
+    parser.add_argument('--orm-cascade', action='store_true', help='Delete the children through the session')
+    args = parser.parse_args()
+
+    path = os.path.join(tempfile.gettempdir(), 'peakstart_bench_cascade.db')
+    if os.path.exists(path):
+        os.remove(path)
+    # Must be set before the app is imported
+    os.environ['DATABASE_URL'] = 'sqlite:///' + path
+
+    from sqlalchemy import event
+    from app import app
+    from extensions import db
+    from models import Worker
+
+    statements = []
+    with app.app_context():
+        event.listen(db.engine, 'before_cursor_execute',
+                     lambda conn, cursor, statement, *rest: statements.append(statement))
+
+        if args.orm_cascade:
+            _disable_passive_deletes()
+
+        timings = []
+        for _ in range(args.repeat):
+            worker_id = _seed_worker(db, args.rows)
+            db.session.remove()
+            statements.clear()
+            started = time.perf_counter()
+            db.session.delete(db.session.get(Worker, worker_id))
+            db.session.commit()
+            timings.append(time.perf_counter() - started)
+            db.session.remove()
+
+    deletes = sum(1 for statement in statements if statement.lstrip().upper().startswith('DELETE'))
+    mode = 'orm cascade' if args.orm_cascade else 'database cascade'
+    print(f'{mode}: best={min(timings) * 1000:.0f}ms median={sorted(timings)[len(timings) // 2] * 1000:.0f}ms '
+          f'statements={len(statements)} deletes={deletes}')
+
+
+if __name__ == '__main__':
+    main()
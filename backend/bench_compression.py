@@ -0,0 +1,93 @@
+import argparse
+import hashlib
+import os
+import shutil
+import tempfile
+import time
+from datetime import date, datetime, timedelta
+
+# Measures response compression on a scratch copy of the sample database:
+#
+#   python bench_compression.py                # sizes, levels on ~1.3 MB of attendance
+#   python bench_compression.py --rows 50000   # a larger attendance payload
+#
+# Prints the compressed size of a few endpoints, then the size and CPU
+# time of each gzip level (and brotli quality, when brotli is installed)
+# on the /api/attendance body, and what a compression cache hit costs.
+
+_ENDPOINTS = ['/api/attendance', '/api/costs', '/api/blog/posts']
+_GZIP_LEVELS = (1, 6, 9)
+_BROTLI_QUALITIES = (1, 4, 11)
+
+
+def _add_attendance(db, rows):
+    """Pad the attendance table with `rows` records on days before the sample data"""
+    from models import Worker, Attendance
+    now = datetime.utcnow()
+    worker_ids = [worker.id for worker in Worker.query.order_by(Worker.id)]
+    first_day = date(2000, 1, 1)
+    db.session.execute(Attendance.__table__.insert(), [
+        {'worker_id': worker_ids[i % len(worker_ids)], 'date': first_day + timedelta(days=i // len(worker_ids)),
+         'check_in_time': None, 'check_out_time': None, 'hours_worked': 8.0, 'is_present': True,
+         'notes': 'Regular shift', 'created_at': now, 'updated_at': now}
+        for i in range(rows)
+    ])
+    db.session.commit()
+
+
+def _time(function, repeat):
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        result = function()
+        timings.append(time.perf_counter() - started)
+    return result, min(timings)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Measure response compression sizes and CPU cost')
+    parser.add_argument('--rows', type=int, default=4000, help='Attendance rows added for the level comparison')
+    parser.add_argument('--repeat', type=int, default=5, help='Timed runs per level (best is reported)')
+    args = parser.parse_args()
+
+    basedir = os.path.abspath(os.path.dirname(__file__))
+    path = os.path.join(tempfile.gettempdir(), 'peakstart_bench_compression.db')
+    shutil.copyfile(os.path.join(basedir, 'instance', 'peakstart.db'), path)
+    # Must be set before the app is imported
+    os.environ['DATABASE_URL'] = 'sqlite:///' + path
+
+    from app import app
+    from extensions import db
+    from compression import brotli, _compress
+
+    client = app.test_client()
+    print('Sizes on the sample database:')
+    for endpoint in _ENDPOINTS:
+        plain = client.get(endpoint, headers={'Accept-Encoding': 'identity'}).get_data()
+        gzipped = client.get(endpoint, headers={'Accept-Encoding': 'gzip'}).get_data()
+        print(f'  {endpoint:18} {len(plain):8} -> {len(gzipped):6} bytes')
+
+    with app.app_context():
+        _add_attendance(db, args.rows)
+    data = client.get('/api/attendance', headers={'Accept-Encoding': 'identity'}).get_data()
+    megabytes = len(data) / 1024 / 1024
+    print(f'CPU cost vs bytes saved on a {megabytes:.1f} MB attendance payload:')
+    settings = [('gzip', 'COMPRESS_LEVEL', level) for level in _GZIP_LEVELS]
+    if brotli is not None:
+        settings += [('br', 'COMPRESS_BROTLI_QUALITY', quality) for quality in _BROTLI_QUALITIES]
+    for encoding, name, value in settings:
+        config = dict(app.config, **{name: value})
+        compressed, seconds = _time(lambda: _compress(data, encoding, config), args.repeat)
+        print(f'  {encoding:4} {value:2}: {len(compressed) / 1024:6.0f} KB {seconds * 1000:7.1f} ms '
+              f'({megabytes / seconds:5.0f} MB/s)')
+
+    cache = app.extensions['compression_cache']
+    key = ('gzip', app.config['COMPRESS_LEVEL'], hashlib.sha1(data).digest())
+    cache.put(key, _compress(data, 'gzip', app.config))
+    _, seconds = _time(lambda: cache.get(('gzip', app.config['COMPRESS_LEVEL'], hashlib.sha1(data).digest())),
+                       args.repeat)
+    print(f'A cache hit (sha1 + lookup) costs {seconds * 1000:.1f} ms for the same payload')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,173 @@
+import argparse
+import http.client
+import socket
+import statistics
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from werkzeug.serving import BaseWSGIServer
+from app import app
+from asgi import AsgiApp
+from models import Site
+
+try:
+    import uvicorn
+except ImportError:  # only needed for the ASGI side of the comparison
+    uvicorn = None
+
+# Compares the WSGI setup (a fixed pool of request threads, like gunicorn
+# gthread or waitress) with the ASGI serving mode under mixed traffic:
+# long-lived site event streams and analytics queries alongside many fast
+# requests whose latency is measured.
+#
+#   python bench_serving.py --threads 8 --streams 8 --slow 2 --requests 300
+
+
+class _PooledWSGIServer(BaseWSGIServer):
+    """Werkzeug server handing connections to a fixed-size thread pool"""
+
+    def __init__(self, host, port, wsgi_app, threads):
+        super().__init__(host, port, wsgi_app)
+        self.pool = ThreadPoolExecutor(max_workers=threads)
+
+    def process_request(self, request, client_address):
+        self.pool.submit(self._handle, request, client_address)
+
+    def _handle(self, request, client_address):
+        try:
+            self.finish_request(request, client_address)
+        except Exception:
+            self.handle_error(request, client_address)
+        finally:
+            self.shutdown_request(request)
+
+
+def _free_port():
+    with socket.socket() as sock:
+        sock.bind(('127.0.0.1', 0))
+        return sock.getsockname()[1]
+
+
+def _start_wsgi(port, threads):
+    server = _PooledWSGIServer('127.0.0.1', port, app, threads)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server.shutdown
+
+
+def _start_asgi(port, threads):
+    app.config['ASGI_THREADS'] = threads
+    server = uvicorn.Server(uvicorn.Config(AsgiApp(app), host='127.0.0.1', port=port, log_level='warning'))
+    threading.Thread(target=server.run, daemon=True).start()
+    while not server.started:
+        time.sleep(0.05)
+
+    def stop():
+        server.should_exit = True
+    return stop
+
+
+def _get(port, path, timeout):
+    connection = http.client.HTTPConnection('127.0.0.1', port, timeout=timeout)
+    try:
+        connection.request('GET', path)
+        response = connection.getresponse()
+        response.read()
+        return response.status
+    finally:
+        connection.close()
+
+
+def _hold_stream(port, path, stop):
+    """Keep one event stream open until the run ends"""
+    # Heartbeats arrive every second, well inside the timeout
+    connection = http.client.HTTPConnection('127.0.0.1', port, timeout=10)
+    try:
+        connection.request('GET', path)
+        response = connection.getresponse()
+        while not stop.is_set() and response.fp.readline():
+            pass
+    except OSError:
+        pass
+    finally:
+        connection.close()
+
+
+def _slow_loop(port, path, stop, timeout):
+    while not stop.is_set():
+        try:
+            _get(port, path, timeout)
+        except OSError:
+            time.sleep(0.1)
+
+
+def run(mode, args, site_id):
+    port = _free_port()
+    stop_server = (_start_wsgi if mode == 'wsgi' else _start_asgi)(port, args.threads)
+    time.sleep(0.3)
+    stop = threading.Event()
+    background = [
+        threading.Thread(target=_hold_stream, args=(port, f'/api/sites/{site_id}/events', stop), daemon=True)
+        for _ in range(args.streams)
+    ] + [
+        threading.Thread(target=_slow_loop, args=(port, args.slow_path, stop, args.timeout), daemon=True)
+        for _ in range(args.slow)
+    ]
+    for thread in background:
+        thread.start()
+    time.sleep(0.5)
+
+    def timed(_):
+        started = time.perf_counter()
+        try:
+            ok = _get(port, args.fast_path, args.timeout) == 200
+        except OSError:
+            ok = False
+        return ok, time.perf_counter() - started
+
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=args.concurrency) as clients:
+        results = list(clients.map(timed, range(args.requests)))
+    elapsed = time.perf_counter() - started
+    stop.set()
+    for thread in background:
+        thread.join(timeout=2)
+    stop_server()
+    time.sleep(0.5)
+
+    latencies = sorted(latency for ok, latency in results if ok)
+    failed = len(results) - len(latencies)
+    if latencies:
+        p50 = statistics.median(latencies) * 1000
+        p95 = latencies[min(len(latencies) - 1, int(len(latencies) * 0.95))] * 1000
+        print(f'{mode:5} ok={len(latencies):4} failed={failed:4} '
+              f'p50={p50:8.1f}ms p95={p95:8.1f}ms max={latencies[-1] * 1000:8.1f}ms '
+              f'throughput={len(latencies) / elapsed:7.1f} req/s')
+    else:
+        print(f'{mode:5} ok=   0 failed={failed:4} (every fast request timed out after {args.timeout}s)')
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Compare WSGI and ASGI serving under mixed slow and fast traffic')
+    parser.add_argument('--threads', type=int, default=8, help='Request threads (WSGI) / offload threads (ASGI)')
+    parser.add_argument('--streams', type=int, default=8, help='Open site event streams')
+    parser.add_argument('--slow', type=int, default=2, help='Clients looping on the slow endpoint')
+    parser.add_argument('--slow-path', default='/api/analytics/attendance/workers')
+    parser.add_argument('--fast-path', default='/api/sites')
+    parser.add_argument('--requests', type=int, default=300, help='Fast requests to time')
+    parser.add_argument('--concurrency', type=int, default=4, help='Concurrent fast clients')
+    parser.add_argument('--timeout', type=float, default=5.0)
+    parser.add_argument('--mode', choices=['wsgi', 'asgi', 'both'], default='both')
+    args = parser.parse_args()
+
+    with app.app_context():
+        site_id = Site.query.filter(Site.deleted_at.is_(None)).first().id
+    app.config['SITE_EVENTS_HEARTBEAT_SECONDS'] = 1
+    for mode in (['wsgi', 'asgi'] if args.mode == 'both' else [args.mode]):
+        if mode == 'asgi' and uvicorn is None:
+            print('asgi  skipped: pip install uvicorn')
+            continue
+        run(mode, args, site_id)
+
+
+if __name__ == '__main__':
+    main()
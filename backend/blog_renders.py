@@ -0,0 +1,37 @@
+import gzip
+import hashlib
+from flask import current_app
+from sqlalchemy import select
+from extensions import db, upsert
+from models import BlogPost, BlogPostRender
+
+
+def load_blog_post_render(post_id):
+    """(etag, gzipped body) of a post's detail response, or None when missing or stale"""
+    return db.session.execute(
+        select(BlogPostRender.etag, BlogPostRender.body_gzip)
+        .join(BlogPost, BlogPost.id == BlogPostRender.post_id)
+        .where(BlogPostRender.post_id == post_id, BlogPostRender.post_updated_at == BlogPost.updated_at)
+    ).first()
+
+
+def render_blog_post(post):
+    """Serialize and gzip a post's detail response once, storing it for later reads.
+
+    Renders are keyed on the post's updated_at, so an edit makes the old one
+    stale without any invalidation step.
+    """
+    body = current_app.json.dumps({'success': True, 'data': post.to_dict()}).encode('utf-8')
+    etag = hashlib.sha1(body).hexdigest()
+    # Compressed once per edit, so spend the time on the smallest output
+    body_gzip = gzip.compress(body, compresslevel=9, mtime=0)
+    if post.updated_at is not None:
+        try:
+            db.session.execute(upsert(BlogPostRender.__table__, {
+                'post_id': post.id, 'post_updated_at': post.updated_at, 'etag': etag, 'body_gzip': body_gzip
+            }, ['post_id']))
+            db.session.commit()
+        except Exception:
+            # Serving the post matters more than keeping its render
+            db.session.rollback()
+    return etag, body_gzip
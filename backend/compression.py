@@ -0,0 +1,124 @@
+import hashlib
+import threading
+import zlib
+from collections import OrderedDict
+from flask import request
+
+try:
+    import brotli
+except ImportError:  # brotli is optional; gzip is always available
+    brotli = None
+
+
+class _CompressedCache:
+    """LRU of compressed bodies keyed by (encoding, level, sha1 of the body), bounded in bytes"""
+
+    def __init__(self, max_bytes):
+        self.max_bytes = max_bytes
+        self.size = 0
+        self.entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            value = self.entries.get(key)
+            if value is not None:
+                self.entries.move_to_end(key)
+            return value
+
+    def put(self, key, value):
+        if len(value) > self.max_bytes:
+            return
+        with self._lock:
+            if key in self.entries:
+                return
+            self.entries[key] = value
+            self.size += len(value)
+            while self.size > self.max_bytes:
+                _, evicted = self.entries.popitem(last=False)
+                self.size -= len(evicted)
+
+
+def _compress(data, encoding, config):
+    if encoding == 'br':
+        return brotli.compress(data, quality=config['COMPRESS_BROTLI_QUALITY'])
+    # wbits=31 writes a gzip header and trailer
+    compressor = zlib.compressobj(config['COMPRESS_LEVEL'], zlib.DEFLATED, 31)
+    return compressor.compress(data) + compressor.flush()
+
+
+def _compress_stream(chunks, encoding, config):
+    """Compress a generator response chunk by chunk, flushing after each one
+    so clients still receive data as soon as it is produced"""
+    if encoding == 'br':
+        compressor = brotli.Compressor(quality=config['COMPRESS_BROTLI_QUALITY'])
+        for chunk in chunks:
+            yield compressor.process(chunk) + compressor.flush()
+        yield compressor.finish()
+    else:
+        compressor = zlib.compressobj(config['COMPRESS_LEVEL'], zlib.DEFLATED, 31)
+        for chunk in chunks:
+            yield compressor.compress(chunk) + compressor.flush(zlib.Z_SYNC_FLUSH)
+        yield compressor.flush()
+
+
+def _encode_chunks(chunks):
+    for chunk in chunks:
+        yield chunk.encode('utf-8') if isinstance(chunk, str) else chunk
+
+
+def register_compression(app):
+    app.config.setdefault('COMPRESS_MIN_SIZE', 1024)
+    app.config.setdefault('COMPRESS_LEVEL', 6)
+    app.config.setdefault('COMPRESS_BROTLI_QUALITY', 4)
+    app.config.setdefault('COMPRESS_MIMETYPES', {
+        'application/json', 'text/html', 'text/css', 'text/plain', 'text/csv',
+        'application/javascript', 'image/svg+xml'
+    })
+    app.config.setdefault('COMPRESS_CACHE_MAX_BYTES', 16 * 1024 * 1024)
+    cache = _CompressedCache(app.config['COMPRESS_CACHE_MAX_BYTES'])
+    app.extensions['compression_cache'] = cache
+
+    @app.after_request
+    def compress_response(response):
+        config = app.config
+        if (response.mimetype not in config['COMPRESS_MIMETYPES']
+                or response.direct_passthrough
+                or response.status_code < 200 or response.status_code in (204, 206, 304)
+                or 'Content-Encoding' in response.headers):
+            return response
+
+        response.vary.add('Accept-Encoding')
+        offered = ['br', 'gzip'] if brotli is not None else ['gzip']
+        encoding = request.accept_encodings.best_match(offered)
+        if encoding is None:
+            return response
+
+        if response.is_streamed:
+            response.response = _compress_stream(_encode_chunks(response.response), encoding, config)
+            response.headers.pop('Content-Length', None)
+        else:
+            data = response.get_data()
+            if len(data) < config['COMPRESS_MIN_SIZE']:
+                return response
+
+            # Hot GET responses (same body for every client) are compressed once
+            key = None
+            if request.method == 'GET' and 'no-store' not in response.headers.get('Cache-Control', ''):
+                level = config['COMPRESS_BROTLI_QUALITY'] if encoding == 'br' else config['COMPRESS_LEVEL']
+                key = (encoding, level, hashlib.sha1(data).digest())
+                compressed = cache.get(key)
+            else:
+                compressed = None
+            if compressed is None:
+                compressed = _compress(data, encoding, config)
+                if key is not None:
+                    cache.put(key, compressed)
+            response.set_data(compressed)
+
+        response.headers['Content-Encoding'] = encoding
+        etag, weak = response.get_etag()
+        if etag:
+            # The compressed bytes are a different representation
+            response.set_etag(f'{etag}-{encoding}', weak)
+        return response
@@ -0,0 +1,157 @@
+from datetime import datetime
+import click
+from flask import request, jsonify
+from sqlalchemy import func, select, tuple_, update
+from extensions import db, upsert
+from models import ContactSubmission, ContactStatusCount
+from tenants import command_tenants, tenant_option, tenant_scope
+
+CONTACT_STATUSES = ('new', 'contacted', 'quoted', 'closed')
+
+
+def adjust_status_counts(deltas):
+    """Apply {status: delta} to contact_status_count in the current transaction"""
+    table = ContactStatusCount.__table__
+    for status, delta in deltas.items():
+        if delta:
+            db.session.execute(upsert(
+                table,
+                {'status': status, 'count': delta},
+                ['status'],
+                lambda excluded: {'count': table.c.count + excluded.count}
+            ))
+
+
+def rebuild_status_counts():
+    """Recount submissions per status from scratch"""
+    db.session.execute(ContactStatusCount.__table__.delete())
+    counts = db.session.execute(
+        select(ContactSubmission.status, func.count(ContactSubmission.id)).group_by(ContactSubmission.status)
+    ).all()
+    if counts:
+        db.session.execute(ContactStatusCount.__table__.insert(), [
+            {'status': status, 'count': count} for status, count in counts
+        ])
+    db.session.commit()
+    return dict(counts)
+
+
+def _encode_cursor(submission):
+    return f'{submission.created_at.isoformat()}_{submission.id}'
+
+
+def _decode_cursor(cursor):
+    created_at, submission_id = cursor.rsplit('_', 1)
+    return datetime.fromisoformat(created_at), int(submission_id)
+
+
+def register_contact_inbox(app):
+    app.config.setdefault('CONTACT_PAGE_SIZE', 50)
+    app.config.setdefault('CONTACT_MAX_PAGE_SIZE', 200)
+
+    @app.cli.command('rebuild-contact-counts')
+    @tenant_option
+    def rebuild_contact_counts_command(tenant):
+        """Recompute the per-status contact submission counters."""
+        for name in command_tenants(tenant):
+            with tenant_scope(name):
+                counts = rebuild_status_counts()
+            for status, count in sorted(counts.items()):
+                click.echo(f'{status}: {count}')
+
+    # Contact Inbox Routes
+    @app.route('/api/contact/submissions', methods=['GET'])
+    def get_contact_submissions():
+        """Get one page of contact submissions, newest first, optionally filtered by status (admin only)"""
+        try:
+            status = request.args.get('status')
+            cursor = request.args.get('cursor')
+            limit = min(int(request.args.get('limit', app.config['CONTACT_PAGE_SIZE'])),
+                        app.config['CONTACT_MAX_PAGE_SIZE'])
+
+            query = ContactSubmission.query
+            if status and status != 'All':
+                query = query.filter(ContactSubmission.status == status)
+            if cursor:
+                # Keyset paging: continue strictly after the last row of the previous page
+                query = query.filter(
+                    tuple_(ContactSubmission.created_at, ContactSubmission.id) < tuple_(*_decode_cursor(cursor))
+                )
+            submissions = query.order_by(
+                ContactSubmission.created_at.desc(), ContactSubmission.id.desc()
+            ).limit(limit + 1).all()
+
+            has_more = len(submissions) > limit
+            submissions = submissions[:limit]
+            return jsonify({
+                'success': True,
+                'data': [submission.to_dict() for submission in submissions],
+                'next_cursor': _encode_cursor(submissions[-1]) if has_more else None
+            }), 200
+        except ValueError:
+            return jsonify({'success': False, 'error': 'Invalid cursor or limit'}), 400
+        except Exception as e:
+            return jsonify({'success': False, 'error': str(e)}), 500
+
+    @app.route('/api/contact/submissions/counts', methods=['GET'])
+    def get_contact_submission_counts():
+        """Get the number of contact submissions per status"""
+        try:
+            counts = dict.fromkeys(CONTACT_STATUSES, 0)
+            counts.update(db.session.execute(select(ContactStatusCount.status, ContactStatusCount.count)).all())
+            return jsonify({
+                'success': True,
+                'data': counts
+            }), 200
+        except Exception as e:
+            return jsonify({'success': False, 'error': str(e)}), 500
+
+    @app.route('/api/contact/submissions/status', methods=['PUT'])
+    def update_contact_submission_status():
+        """Move a set of contact submissions to a new status"""
+        try:
+            data = request.get_json(silent=True) or {}
+            status = data.get('status')
+            ids = data.get('ids') or []
+            if status not in CONTACT_STATUSES:
+                return jsonify({'success': False, 'error': f"status must be one of {', '.join(CONTACT_STATUSES)}"}), 400
+            if not ids:
+                return jsonify({'success': False, 'error': "'ids' must be a non-empty list"}), 400
+
+            to_change = (ContactSubmission.id.in_(ids), ContactSubmission.status != status)
+            previous = db.session.execute(
+                select(ContactSubmission.status, func.count(ContactSubmission.id))
+                .where(*to_change)
+                .group_by(ContactSubmission.status)
+            ).all()
+            changed = db.session.execute(
+                update(ContactSubmission.__table__)
+                .where(*to_change)
+                .values(status=status, updated_at=datetime.utcnow())
+            ).rowcount
+
+            deltas = {old_status: -count for old_status, count in previous}
+            deltas[status] = deltas.get(status, 0) + changed
+            adjust_status_counts(deltas)
+            db.session.commit()
+            return jsonify({
+                'success': True,
+                'data': {'updated': changed},
+                'message': f'{changed} contact submissions moved to {status}'
+            }), 200
+        except Exception as e:
+            db.session.rollback()
+            return jsonify({'success': False, 'error': str(e)}), 500
+
+    @app.route('/api/contact/submissions/<int:submission_id>', methods=['DELETE'])
+    def delete_contact_submission(submission_id):
+        """Delete a contact submission"""
+        try:
+            submission = ContactSubmission.query.get_or_404(submission_id)
+            adjust_status_counts({submission.status: -1})
+            db.session.delete(submission)
+            db.session.commit()
+            return jsonify({'success': True, 'message': 'Contact submission deleted successfully'}), 200
+        except Exception as e:
+            db.session.rollback()
+            return jsonify({'success': False, 'error': str(e)}), 500
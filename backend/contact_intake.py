@@ -0,0 +1,267 @@
+import atexit
+import hashlib
+import logging
+import queue
+import threading
+import time
+from collections import defaultdict
+from datetime import datetime, timedelta
+from flask import request, jsonify
+from sqlalchemy import select, tuple_
+from sqlalchemy.exc import OperationalError
+from extensions import db
+from models import ContactSubmission
+from contact_inbox import adjust_status_counts
+from tenants import TenantsBusy, current_tenant, tenant_scope
+
+logger = logging.getLogger(__name__)
+
+_REQUIRED_FIELDS = ('firstName', 'lastName', 'email', 'message')
+
+# Errors that clear up on their own, e.g. SQLite "database is locked" under write load
+_TRANSIENT_ERRORS = (OperationalError, TenantsBusy)
+
+# How often an idle writer checks whether flush() asked it to stop
+_IDLE_POLL_SECONDS = 0.5
+
+
+def message_hash(message):
+    """sha256 of a message with case and whitespace normalized"""
+    return hashlib.sha256(' '.join((message or '').lower().split()).encode('utf-8')).hexdigest()
+
+
+class TokenBucketLimiter:
+    """Per-key token buckets: `rate` tokens per second, holding at most `burst`"""
+
+    def __init__(self, rate, burst, max_keys=10000):
+        self.rate = rate
+        self.burst = burst
+        self.max_keys = max_keys
+        self.buckets = {}
+        self._lock = threading.Lock()
+
+    def _prune(self, now):
+        # Buckets that have refilled completely carry no state worth keeping
+        self.buckets = {
+            key: (tokens, updated) for key, (tokens, updated) in self.buckets.items()
+            if tokens + (now - updated) * self.rate < self.burst
+        }
+
+    def acquire(self, key):
+        """Take a token; returns 0 when allowed, otherwise seconds until the next token"""
+        now = time.monotonic()
+        with self._lock:
+            tokens, updated = self.buckets.get(key, (self.burst, now))
+            tokens = min(self.burst, tokens + (now - updated) * self.rate)
+            if tokens < 1:
+                self.buckets[key] = (tokens, now)
+                return (1 - tokens) / self.rate
+            if key not in self.buckets and len(self.buckets) >= self.max_keys:
+                self._prune(now)
+            self.buckets[key] = (tokens - 1, now)
+            return 0
+
+
+class ContactIntake:
+    """Buffers contact submissions and group-commits them from one writer thread.
+
+    Clients already got a 202, so a batch is never dropped on a transient
+    error: it is retried with backoff and then kept at the head of the
+    next batch until it is written.
+    """
+
+    def __init__(self, app):
+        self.app = app
+        self.queue = queue.Queue(maxsize=app.config['CONTACT_QUEUE_SIZE'])
+        self._lock = threading.Lock()
+        self._thread = None
+        # (tenant, row) pairs taken off the queue but not written yet
+        self._unwritten = []
+        self._closing = False
+
+    def submit(self, row):
+        """Queue a submission; returns False when the buffer is full"""
+        with self._lock:
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(target=self._run, name='contact-intake', daemon=True)
+                self._thread.start()
+        try:
+            self.queue.put_nowait((current_tenant(), row))
+        except queue.Full:
+            return False
+        return True
+
+    def _next_batch(self):
+        """Unwritten pairs first, else block for one submission; then gather more
+        for up to CONTACT_BATCH_WAIT_SECONDS. Empty once flush() ran and nothing is left."""
+        batch, self._unwritten = self._unwritten, []
+        while not batch:
+            if self._closing and self.queue.empty():
+                return batch
+            try:
+                batch.append(self.queue.get(timeout=_IDLE_POLL_SECONDS))
+            except queue.Empty:
+                pass
+        deadline = time.monotonic() + self.app.config['CONTACT_BATCH_WAIT_SECONDS']
+        while len(batch) < self.app.config['CONTACT_BATCH_SIZE']:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                batch.append(self.queue.get(timeout=remaining))
+            except queue.Empty:
+                break
+        return batch
+
+    def write_batch(self, batch):
+        """Insert a batch in one transaction, skipping duplicates; returns rows written"""
+        window = timedelta(hours=self.app.config['CONTACT_DUPLICATE_WINDOW_HOURS'])
+        keys = {(row['email'], row['message_hash']) for row in batch}
+        table = ContactSubmission.__table__
+        seen = set(db.session.execute(
+            select(table.c.email, table.c.message_hash)
+            .where(tuple_(table.c.email, table.c.message_hash).in_(keys))
+            .where(table.c.created_at >= datetime.utcnow() - window)
+        ).all())
+
+        rows = []
+        for row in batch:
+            key = (row['email'], row['message_hash'])
+            if key not in seen:
+                seen.add(key)
+                rows.append(row)
+        if rows:
+            db.session.execute(table.insert(), rows)
+            adjust_status_counts({'new': len(rows)})
+        db.session.commit()
+        if len(rows) < len(batch):
+            logger.info(f"Dropped {len(batch) - len(rows)} duplicate contact submissions")
+        return len(rows)
+
+    def _write_rows(self, tenant, rows):
+        """Write one tenant's rows, retrying transient errors with backoff; returns the rows still unwritten"""
+        attempts = self.app.config['CONTACT_WRITE_ATTEMPTS']
+        for attempt in range(attempts):
+            if attempt:
+                time.sleep(self.app.config['CONTACT_RETRY_SECONDS'] * 2 ** (attempt - 1))
+            try:
+                with tenant_scope(tenant):
+                    self.write_batch(rows)
+                return []
+            except _TRANSIENT_ERRORS as e:
+                db.session.rollback()
+                logger.warning(f"Writing {len(rows)} contact submissions failed "
+                               f"(attempt {attempt + 1} of {attempts}): {e}")
+            except Exception:
+                db.session.rollback()
+                if len(rows) == 1:
+                    logger.exception(f"Dropped a contact submission from {rows[0]['email']} that cannot be written")
+                    return []
+                # One bad row should not sink the rest of the batch
+                return [unwritten for row in rows for unwritten in self._write_rows(tenant, [row])]
+            finally:
+                db.session.remove()
+        return rows
+
+    def write_queued(self, batch):
+        """Write a batch of queued (tenant, row) pairs, one transaction per tenant;
+        returns the pairs that could not be written yet"""
+        by_tenant = defaultdict(list)
+        for tenant, row in batch:
+            by_tenant[tenant].append(row)
+        unwritten = []
+        for tenant, rows in by_tenant.items():
+            unwritten.extend((tenant, row) for row in self._write_rows(tenant, rows))
+        return unwritten
+
+    def _run(self):
+        with self.app.app_context():
+            while True:
+                batch = self._next_batch()
+                if not batch:
+                    return
+                self._unwritten = self.write_queued(batch)
+                for _ in range(len(batch) - len(self._unwritten)):
+                    self.queue.task_done()
+
+    def flush(self):
+        """Write the in-flight batch and whatever is still buffered (used at interpreter exit)"""
+        self._closing = True
+        thread = self._thread
+        if thread is not None and thread.is_alive():
+            # The writer finishes its current batch, drains the queue and exits
+            thread.join(self.app.config['CONTACT_FLUSH_TIMEOUT_SECONDS'])
+        elif self._unwritten or not self.queue.empty():
+            batch, self._unwritten = self._unwritten, []
+            while True:
+                try:
+                    batch.append(self.queue.get_nowait())
+                except queue.Empty:
+                    break
+            with self.app.app_context():
+                self._unwritten = self.write_queued(batch)
+        left = len(self._unwritten) + self.queue.qsize()
+        if left:
+            logger.error(f"Exiting with {left} contact submissions not written")
+
+
+def register_contact_intake(app):
+    app.config.setdefault('CONTACT_QUEUE_SIZE', 10000)
+    app.config.setdefault('CONTACT_BATCH_SIZE', 50)
+    app.config.setdefault('CONTACT_BATCH_WAIT_SECONDS', 0.2)
+    app.config.setdefault('CONTACT_RATE_PER_MINUTE', 5)
+    app.config.setdefault('CONTACT_RATE_BURST', 5)
+    app.config.setdefault('CONTACT_DUPLICATE_WINDOW_HOURS', 24)
+    # Transient write failures are retried this many times, backing off from
+    # CONTACT_RETRY_SECONDS, before the batch goes back to wait for the next round
+    app.config.setdefault('CONTACT_WRITE_ATTEMPTS', 5)
+    app.config.setdefault('CONTACT_RETRY_SECONDS', 0.1)
+    app.config.setdefault('CONTACT_FLUSH_TIMEOUT_SECONDS', 10)
+
+    intake = ContactIntake(app)
+    limiter = TokenBucketLimiter(app.config['CONTACT_RATE_PER_MINUTE'] / 60, app.config['CONTACT_RATE_BURST'])
+    app.extensions['contact_intake'] = intake
+    app.extensions['contact_rate_limiter'] = limiter
+    atexit.register(intake.flush)
+
+    # Contact Routes
+    @app.route('/api/contact/submit', methods=['POST'])
+    def submit_contact_form():
+        """Submit a contact form (queued and written in batches)"""
+        try:
+            retry_after = limiter.acquire(request.remote_addr)
+            if retry_after:
+                response = jsonify({'success': False, 'error': 'Too many submissions, please try again later'})
+                response.headers['Retry-After'] = str(int(retry_after) + 1)
+                return response, 429
+
+            data = request.get_json(silent=True) or {}
+            missing = [field for field in _REQUIRED_FIELDS if not data.get(field)]
+            if missing:
+                return jsonify({'success': False, 'error': f"Missing field(s): {', '.join(missing)}"}), 400
+
+            now = datetime.utcnow()
+            queued = intake.submit({
+                'first_name': data['firstName'],
+                'last_name': data['lastName'],
+                'email': data['email'].strip().lower(),
+                'phone': data.get('phone'),
+                'project_type': data.get('projectType'),
+                'message': data['message'],
+                'budget': data.get('budget'),
+                'status': 'new',
+                'message_hash': message_hash(data['message']),
+                'created_at': now,
+                'updated_at': now
+            })
+            if not queued:
+                response = jsonify({'success': False, 'error': 'Service busy, please try again shortly'})
+                response.headers['Retry-After'] = '5'
+                return response, 503
+
+            return jsonify({
+                'success': True,
+                'message': 'Contact form submitted successfully'
+            }), 202
+        except Exception as e:
+            return jsonify({'success': False, 'error': str(e)}), 500
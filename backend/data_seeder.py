@@ -1,6 +1,6 @@
 from app import app
 from extensions import db
-from models import Service, ServiceFeature, Project, BlogPost, TeamMember, Testimonial, ContactSubmission, CompanyStat, Certification, Award, Site, Worker, Attendance, DailyActivity, Cost
+from models import Service, Project, BlogPost, TeamMember, Testimonial, ContactSubmission, CompanyStat, Certification, Award, Site, Worker, Attendance, DailyActivity, Cost
 from datetime import datetime, date, time, timedelta
 import json
 import sys
@@ -103,11 +103,8 @@ def seed_data():
                 image=s_data['image'],
                 icon_name=s_data['icon_name']
             )
+            service.set_features(s_data['features'])
             db.session.add(service)
-            db.session.flush()
-            for feature_text in s_data['features']:
-                feature = ServiceFeature(service_id=service.id, feature=feature_text)
-                db.session.add(feature)
         db.session.commit()
         print("✅ Services seeded successfully!", flush=True)
 
@@ -618,6 +615,7 @@ def seed_data():
             {"activity_name": "Concrete Deck Pouring", "description": "Bridge deck concrete work", "quantity": 80.0, "unit_price": 35.00, "site_index": 4, "workers_involved": [19]}
         ]
 
+        activities = []
         for a_data in activities_data:
             # Calculate total price
             total_price = a_data['quantity'] * a_data['unit_price']
@@ -633,10 +631,11 @@ def seed_data():
                 description=a_data['description'],
                 quantity=a_data['quantity'],
                 unit_price=a_data['unit_price'],
-                total_price=total_price,
-                workers_involved=json.dumps(a_data['workers_involved'])
+                total_price=total_price
             )
+            activity.set_worker_ids(workers[index].id for index in a_data['workers_involved'])
             db.session.add(activity)
+            activities.append(activity)
         db.session.commit()
         print("✅ Daily activities seeded successfully!", flush=True)
 
@@ -687,8 +686,9 @@ def seed_data():
             
             cost = Cost(
                 site_id=site_id,
-                worker_id=c_data.get('worker_id'),
-                daily_activity_id=c_data.get('activity_id'),
+                # worker_id/activity_id in costs_data index the lists seeded above
+                worker_id=workers[c_data['worker_id']].id if 'worker_id' in c_data else None,
+                daily_activity_id=activities[c_data['activity_id']].id if 'activity_id' in c_data else None,
                 cost_type=c_data['cost_type'],
                 description=c_data['description'],
                 amount=c_data['amount'],
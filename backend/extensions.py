@@ -1,3 +1,60 @@
+from flask import g
 from flask_sqlalchemy import SQLAlchemy
+from flask_sqlalchemy.session import Session
+from sqlalchemy import event
 
-db = SQLAlchemy()
+
+class RoutingSession(Session):
+    """Session that sends SELECTs to the 'replica' bind while info['use_replica'] is set.
+
+    Anything else (flushes, INSERT/UPDATE/DELETE, session.connection()) goes
+    to the primary and switches the rest of the session there too, so a
+    request always reads its own writes.
+
+    When the app context is bound to a tenant (tenants.py) everything goes
+    to that tenant's database instead; tenants have no replica.
+    """
+
+    def get_bind(self, mapper=None, clause=None, bind=None, **kwargs):
+        tenant_engine = g.get('tenant_engine')
+        if bind is None and tenant_engine is not None:
+            return tenant_engine
+        if bind is None and self.info.get('use_replica'):
+            if not self._flushing and getattr(clause, 'is_select', False):
+                return self._db.engines['replica']
+            self.info['use_replica'] = False
+        return super().get_bind(mapper=mapper, clause=clause, bind=bind, **kwargs)
+
+
+db = SQLAlchemy(session_options={'class_': RoutingSession})
+
+
+def upsert(table, values, index_elements, set_=None):
+    """INSERT ... ON CONFLICT (index_elements) DO UPDATE for SQLite and PostgreSQL.
+
+    `set_` is a callable receiving the `excluded` row and returning the
+    columns to update; by default every non-key column in `values` is
+    overwritten with the incoming value.
+    """
+    if db.engine.dialect.name == 'postgresql':
+        from sqlalchemy.dialects.postgresql import insert
+    else:
+        from sqlalchemy.dialects.sqlite import insert
+    stmt = insert(table).values(values)
+    if set_ is None:
+        updates = {key: stmt.excluded[key] for key in values if key not in index_elements}
+    else:
+        updates = set_(stmt.excluded)
+    return stmt.on_conflict_do_update(index_elements=index_elements, set_=updates)
+
+
+def enable_sqlite_foreign_keys(engine):
+    """Turn on foreign key enforcement (and ON DELETE actions) for every SQLite connection"""
+    if engine.dialect.name != 'sqlite':
+        return
+
+    @event.listens_for(engine, 'connect')
+    def _set_foreign_keys_pragma(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        cursor.execute('PRAGMA foreign_keys=ON')
+        cursor.close()
@@ -0,0 +1,312 @@
+import json
+from collections import defaultdict
+from datetime import date, datetime, timedelta
+from decimal import Decimal
+import click
+from flask import request, jsonify, current_app
+from sqlalchemy import event, func, inspect, select, update
+from extensions import db, upsert
+from models import Site, Worker, DailyActivity, Cost, SiteDailyTotal, SiteForecast, to_decimal
+from tenants import command_tenants, tenant_option, tenant_scope
+
+
+def _previous_value(obj, attr):
+    """Value of `attr` before the pending flush"""
+    history = inspect(obj).attrs[attr].history
+    if history.deleted:
+        return history.deleted[0]
+    if history.unchanged:
+        return history.unchanged[0]
+    return getattr(obj, attr)
+
+
+def _amount(value):
+    return to_decimal(value) if value is not None else Decimal(0)
+
+
+# Rollup maintenance: every flush that touches DailyActivity or Cost applies
+# its delta to site_daily_total, so totals never need a full re-scan.
+_TRACKED = {DailyActivity: ('total_price', 0), Cost: ('amount', 1)}
+
+
+def _capture_cascaded_costs(session, flush_context, instances):
+    """Costs removed by ON DELETE CASCADE never pass through the session,
+    so total them up before the workers that own them are deleted"""
+    worker_ids = [obj.id for obj in session.deleted if isinstance(obj, Worker)]
+    if not worker_ids:
+        return
+
+    stmt = (
+        select(Cost.site_id, Cost.date, func.sum(Cost.amount))
+        .where(Cost.worker_id.in_(worker_ids))
+        .group_by(Cost.site_id, Cost.date)
+    )
+    loaded = [obj.id for obj in session.deleted if isinstance(obj, Cost)]
+    if loaded:
+        stmt = stmt.where(Cost.id.not_in(loaded))
+    session.info['cascaded_costs'] = {
+        (site_id, day): amount for site_id, day, amount in session.execute(stmt)
+    }
+
+
+def _collect_deltas(session):
+    deltas = defaultdict(lambda: [Decimal(0), Decimal(0)])
+    touched_sites = set()
+    deleted_sites = {obj.id for obj in session.deleted if isinstance(obj, Site)}
+
+    for key, amount in session.info.pop('cascaded_costs', {}).items():
+        deltas[key][1] -= _amount(amount)
+
+    for obj in session.new:
+        if type(obj) in _TRACKED:
+            attr, slot = _TRACKED[type(obj)]
+            deltas[(obj.site_id, obj.date)][slot] += _amount(getattr(obj, attr))
+
+    for obj in session.deleted:
+        if type(obj) in _TRACKED:
+            attr, slot = _TRACKED[type(obj)]
+            deltas[(_previous_value(obj, 'site_id'), _previous_value(obj, 'date'))][slot] -= \
+                _amount(_previous_value(obj, attr))
+
+    for obj in session.dirty:
+        if isinstance(obj, Site) and session.is_modified(obj):
+            touched_sites.add(obj.id)
+        if type(obj) in _TRACKED and session.is_modified(obj):
+            attr, slot = _TRACKED[type(obj)]
+            deltas[(_previous_value(obj, 'site_id'), _previous_value(obj, 'date'))][slot] -= \
+                _amount(_previous_value(obj, attr))
+            deltas[(obj.site_id, obj.date)][slot] += _amount(getattr(obj, attr))
+
+    deltas = {
+        key: value for key, value in deltas.items()
+        if key[0] not in deleted_sites and (value[0] or value[1])
+    }
+    touched_sites.update(site_id for site_id, _ in deltas)
+    return deltas, touched_sites - deleted_sites
+
+
+def _apply_rollup_deltas(session, flush_context):
+    apply_rollup_deltas(session.connection(), *_collect_deltas(session))
+
+
+def apply_rollup_deltas(connection, deltas, touched_sites):
+    """Add {(site_id, date): [revenue, cost]} to site_daily_total and mark the sites' forecasts stale"""
+    table = SiteDailyTotal.__table__
+
+    for (site_id, day), (revenue, cost) in deltas.items():
+        connection.execute(upsert(
+            table,
+            {'site_id': site_id, 'date': day, 'revenue': revenue, 'cost': cost},
+            ['site_id', 'date'],
+            lambda excluded: {
+                'revenue': table.c.revenue + excluded.revenue,
+                'cost': table.c.cost + excluded.cost
+            }
+        ))
+
+    if touched_sites:
+        connection.execute(
+            update(SiteForecast.__table__)
+            .where(SiteForecast.__table__.c.site_id.in_(touched_sites))
+            .values(is_stale=True)
+        )
+
+
+def rebuild_site_totals(site_ids=None):
+    """Recompute site_daily_total from the source tables (full backfill)"""
+    table = SiteDailyTotal.__table__
+    delete_stmt = table.delete()
+    if site_ids is not None:
+        delete_stmt = delete_stmt.where(table.c.site_id.in_(site_ids))
+    db.session.execute(delete_stmt)
+
+    totals = defaultdict(lambda: [Decimal(0), Decimal(0)])
+    sources = [
+        (DailyActivity.site_id, DailyActivity.date, func.sum(DailyActivity.total_price), 0),
+        (Cost.site_id, Cost.date, func.sum(Cost.amount), 1)
+    ]
+    for site_col, date_col, sum_col, slot in sources:
+        stmt = select(site_col, date_col, sum_col).group_by(site_col, date_col)
+        if site_ids is not None:
+            stmt = stmt.where(site_col.in_(site_ids))
+        for site_id, day, amount in db.session.execute(stmt):
+            totals[(site_id, day)][slot] += amount or Decimal(0)
+
+    if totals:
+        db.session.execute(table.insert(), [
+            {'site_id': site_id, 'date': day, 'revenue': revenue, 'cost': cost}
+            for (site_id, day), (revenue, cost) in totals.items()
+        ])
+    db.session.execute(update(SiteForecast.__table__).values(is_stale=True))
+    db.session.commit()
+    return len(totals)
+
+
+def _linear_projection(xs, ys, x_target):
+    """Least-squares line through (xs, ys) evaluated at x_target"""
+    n = len(xs)
+    if n < 2:
+        return None
+    mean_x = sum(xs) / n
+    mean_y = sum(ys) / n
+    sxx = sum((x - mean_x) ** 2 for x in xs)
+    if not sxx:
+        return None
+    slope = sum((x - mean_x) * (y - mean_y) for x, y in zip(xs, ys)) / sxx
+    return mean_y + slope * (x_target - mean_x)
+
+
+def compute_site_forecast(site, rows, today, window, include_curves=False):
+    """Profitability summary for one site from its (date, revenue, cost) rollup rows"""
+    total_revenue = sum((row[1] for row in rows), Decimal(0))
+    total_cost = sum((row[2] for row in rows), Decimal(0))
+
+    as_of = min(today, site.end_date) if site.end_date else today
+    window_start = as_of - timedelta(days=window)
+    burn_rate = sum((row[2] for row in rows if window_start < row[0] <= as_of), Decimal(0)) / window
+
+    projected = {'moving_average': None, 'linear_trend': None}
+    remaining_days = None
+    if site.end_date:
+        remaining_days = max(0, (site.end_date - as_of).days)
+        projected['moving_average'] = float(round(total_cost + burn_rate * remaining_days, 2))
+
+        if rows:
+            origin = rows[0][0]
+            xs, ys, cumulative = [], [], Decimal(0)
+            for day, _, cost in rows:
+                cumulative += cost
+                xs.append((day - origin).days)
+                ys.append(float(cumulative))
+            trend = _linear_projection(xs, ys, (site.end_date - origin).days)
+            if trend is not None:
+                # The cumulative curve never goes down, so neither does its projection
+                projected['linear_trend'] = round(max(trend, float(total_cost)), 2)
+
+    result = {
+        'site_id': site.id,
+        'site_name': site.name,
+        'status': site.status,
+        'start_date': site.start_date.isoformat() if site.start_date else None,
+        'end_date': site.end_date.isoformat() if site.end_date else None,
+        'total_revenue': float(total_revenue),
+        'total_cost': float(total_cost),
+        'margin': float(total_revenue - total_cost),
+        'burn_rate': float(round(burn_rate, 2)),
+        'window_days': window,
+        'remaining_days': remaining_days,
+        'projected_cost': projected
+    }
+
+    if include_curves:
+        cumulative_revenue, cumulative_cost = [], []
+        revenue_sum = cost_sum = Decimal(0)
+        for _, revenue, cost in rows:
+            revenue_sum += revenue
+            cost_sum += cost
+            cumulative_revenue.append(float(revenue_sum))
+            cumulative_cost.append(float(cost_sum))
+        result['curves'] = {
+            'dates': [row[0].isoformat() for row in rows],
+            'cumulative_revenue': cumulative_revenue,
+            'cumulative_cost': cumulative_cost
+        }
+    return result
+
+
+def _site_rows(site_ids):
+    """Rollup rows grouped by site, ordered by date"""
+    rows = defaultdict(list)
+    stmt = (
+        select(SiteDailyTotal.site_id, SiteDailyTotal.date, SiteDailyTotal.revenue, SiteDailyTotal.cost)
+        .where(SiteDailyTotal.site_id.in_(site_ids))
+        .order_by(SiteDailyTotal.site_id, SiteDailyTotal.date)
+    )
+    for site_id, day, revenue, cost in db.session.execute(stmt):
+        rows[site_id].append((day, revenue, cost))
+    return rows
+
+
+def refresh_site_forecasts(today=None):
+    """Recompute forecasts that are stale or were computed on an earlier day"""
+    today = today or date.today()
+    window = current_app.config['FORECAST_WINDOW_DAYS']
+
+    fresh = select(SiteForecast.site_id).where(
+        SiteForecast.is_stale == False,  # noqa: E712
+        SiteForecast.computed_on == today
+    )
+    sites = Site.query.filter(Site.deleted_at.is_(None), Site.id.not_in(fresh)).all()
+    if not sites:
+        return 0
+
+    rows = _site_rows([site.id for site in sites])
+    table = SiteForecast.__table__
+    for site in sites:
+        summary = compute_site_forecast(site, rows.get(site.id, []), today, window)
+        db.session.execute(upsert(
+            table,
+            {'site_id': site.id, 'is_stale': False, 'computed_on': today,
+             'data': json.dumps(summary), 'updated_at': datetime.utcnow()},
+            ['site_id']
+        ))
+    db.session.commit()
+    return len(sites)
+
+
+def register_forecasting(app):
+    app.config.setdefault('FORECAST_WINDOW_DAYS', 14)
+
+    event.listen(db.session, 'before_flush', _capture_cascaded_costs)
+    event.listen(db.session, 'after_flush', _apply_rollup_deltas)
+
+    @app.cli.command('rebuild-site-totals')
+    @click.option('--site-id', type=int, multiple=True, help='Only rebuild these sites.')
+    @tenant_option
+    def rebuild_site_totals_command(site_id, tenant):
+        """Backfill the per-site daily revenue/cost rollup."""
+        for name in command_tenants(tenant):
+            with tenant_scope(name):
+                count = rebuild_site_totals(list(site_id) or None)
+            click.echo(f'Rebuilt {count} site daily totals')
+
+    # Site Forecast Routes
+    @app.route('/api/sites/forecasts', methods=['GET'])
+    def get_site_forecasts():
+        """Get precomputed profitability and burn-rate summaries for all sites"""
+        try:
+            refresh_site_forecasts()
+            status = request.args.get('status')
+
+            query = (
+                db.session.query(SiteForecast.data)
+                .join(Site, Site.id == SiteForecast.site_id)
+                .filter(Site.deleted_at.is_(None))
+            )
+            if status and status != 'All':
+                query = query.filter(Site.status == status)
+
+            return jsonify({
+                'success': True,
+                'data': [json.loads(row.data) for row in query.order_by(Site.id).all()]
+            }), 200
+        except Exception as e:
+            db.session.rollback()
+            return jsonify({'success': False, 'error': str(e)}), 500
+
+    @app.route('/api/sites/<int:site_id>/forecast', methods=['GET'])
+    def get_site_forecast(site_id):
+        """Get cumulative revenue/cost curves and cost projections for a site"""
+        # Outside the try so a missing or soft-deleted site is a 404, not a 500
+        site = Site.query.filter_by(id=site_id, deleted_at=None).first_or_404()
+        try:
+            window = int(request.args.get('window', current_app.config['FORECAST_WINDOW_DAYS']))
+            if window < 1:
+                return jsonify({'success': False, 'error': 'window must be at least 1'}), 400
+            rows = _site_rows([site.id]).get(site.id, [])
+            return jsonify({
+                'success': True,
+                'data': compute_site_forecast(site, rows, date.today(), window, include_curves=True)
+            }), 200
+        except Exception as e:
+            return jsonify({'success': False, 'error': str(e)}), 500
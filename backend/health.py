@@ -0,0 +1,144 @@
+import os
+import shutil
+import threading
+import time
+from datetime import datetime
+from flask import jsonify, current_app
+from sqlalchemy import text
+from extensions import db
+
+# Last readiness result, shared by all probes until it expires
+_ready_cache = {'expires_at': 0.0, 'result': None}
+_ready_lock = threading.Lock()
+
+
+def _check_database():
+    """Run a timed SELECT 1 against the database"""
+    started = time.perf_counter()
+    try:
+        with db.engine.connect() as connection:
+            connection.execute(text('SELECT 1'))
+    except Exception as e:
+        return {'status': 'fail', 'error': str(e)}
+    latency_ms = (time.perf_counter() - started) * 1000
+    max_latency_ms = current_app.config['HEALTH_MAX_DB_LATENCY_MS']
+    return {
+        'status': 'ok' if latency_ms <= max_latency_ms else 'fail',
+        'latency_ms': round(latency_ms, 2)
+    }
+
+
+def _check_migrations():
+    """Compare the database revision with the migration scripts head"""
+    migrate = current_app.extensions.get('migrate')
+    directory = migrate.directory if migrate else None
+    if not directory or not os.path.isdir(directory):
+        return {'status': 'skipped', 'reason': 'no migrations directory'}
+
+    from alembic.config import Config
+    from alembic.runtime.migration import MigrationContext
+    from alembic.script import ScriptDirectory
+
+    try:
+        config = Config()
+        config.set_main_option('script_location', directory)
+        heads = set(ScriptDirectory.from_config(config).get_heads())
+        with db.engine.connect() as connection:
+            current = set(MigrationContext.configure(connection).get_current_heads())
+    except Exception as e:
+        return {'status': 'fail', 'error': str(e)}
+    return {
+        'status': 'ok' if current == heads else 'fail',
+        'current': sorted(current),
+        'head': sorted(heads)
+    }
+
+
+def _check_disk():
+    """Check free space on the filesystem holding the SQLite file"""
+    database = db.engine.url.database
+    if db.engine.url.get_backend_name() != 'sqlite' or not database or database == ':memory:':
+        return {'status': 'skipped', 'reason': 'not a file-backed SQLite database'}
+
+    usage = shutil.disk_usage(os.path.dirname(os.path.abspath(database)))
+    free_mb = usage.free / (1024 * 1024)
+    return {
+        'status': 'ok' if free_mb >= current_app.config['HEALTH_MIN_FREE_DISK_MB'] else 'fail',
+        'free_mb': round(free_mb, 1)
+    }
+
+
+def _check_pool():
+    """Report connection pool saturation (checked out / capacity)"""
+    pool = db.engine.pool
+    if not hasattr(pool, 'size') or not hasattr(pool, 'checkedout'):
+        return {'status': 'skipped', 'reason': f'{type(pool).__name__} does not track usage'}
+
+    # A negative max_overflow means the pool can grow without bound
+    max_overflow = getattr(pool, '_max_overflow', 0)
+    checked_out = pool.checkedout()
+    if max_overflow < 0:
+        return {'status': 'ok', 'checked_out': checked_out, 'capacity': None}
+
+    capacity = pool.size() + max_overflow
+    saturation = checked_out / capacity if capacity else 1.0
+    return {
+        'status': 'ok' if saturation < current_app.config['HEALTH_MAX_POOL_SATURATION'] else 'fail',
+        'checked_out': checked_out,
+        'capacity': capacity,
+        'saturation': round(saturation, 2)
+    }
+
+
+def get_readiness():
+    """Run every readiness check, reusing a cached result while it is fresh"""
+    now = time.monotonic()
+    with _ready_lock:
+        if _ready_cache['result'] is not None and now < _ready_cache['expires_at']:
+            return _ready_cache['result']
+
+        checks = {
+            'database': _check_database(),
+            'migrations': _check_migrations(),
+            'disk': _check_disk(),
+            'pool': _check_pool()
+        }
+        result = {
+            'status': 'ready' if all(c['status'] != 'fail' for c in checks.values()) else 'not_ready',
+            'timestamp': datetime.utcnow().isoformat(),
+            'checks': checks
+        }
+        _ready_cache['result'] = result
+        _ready_cache['expires_at'] = now + current_app.config['HEALTH_CACHE_SECONDS']
+        return result
+
+
+def register_health_routes(app):
+    app.config.setdefault('HEALTH_CACHE_SECONDS', 5)
+    app.config.setdefault('HEALTH_MAX_DB_LATENCY_MS', 500)
+    app.config.setdefault('HEALTH_MIN_FREE_DISK_MB', 100)
+    app.config.setdefault('HEALTH_MAX_POOL_SATURATION', 0.9)
+
+    @app.route('/health/live')
+    def health_live():
+        """Liveness probe: the process is up and serving requests"""
+        return jsonify({
+            'status': 'alive',
+            'timestamp': datetime.utcnow().isoformat()
+        }), 200
+
+    @app.route('/health/ready')
+    def health_ready():
+        """Readiness probe: the database and its dependencies are usable"""
+        result = get_readiness()
+        return jsonify(result), 200 if result['status'] == 'ready' else 503
+
+    @app.route('/health')
+    def health_check():
+        """Legacy health check, backed by the readiness probe"""
+        result = get_readiness()
+        return jsonify({
+            'status': 'healthy' if result['status'] == 'ready' else 'unhealthy',
+            'timestamp': result['timestamp'],
+            'database': 'connected' if result['checks']['database']['status'] == 'ok' else 'disconnected'
+        }), 200 if result['status'] == 'ready' else 503
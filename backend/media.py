@@ -0,0 +1,189 @@
+import hashlib
+import mimetypes
+import os
+import time
+from urllib.parse import urlparse
+import click
+from flask import request, jsonify, current_app, send_file
+from werkzeug.security import safe_join
+from extensions import db
+from models import Service, Project, BlogPost, TeamMember, Testimonial, Upload
+from tenants import tenant_scope
+
+# Models whose `image` column may point at a file in the upload folder
+_IMAGE_MODELS = [Service, Project, BlogPost, TeamMember, Testimonial]
+
+# Content-addressed files never change, so they can be cached forever
+_HASHED_DIRS = ('originals', 'variants')
+
+# (path, mtime_ns, size) -> sha256, for legacy files without a hash in their name
+_etag_cache = {}
+
+
+def _is_hashed(filename):
+    return filename.split('/', 1)[0] in _HASHED_DIRS
+
+
+def _hash_from_path(filename):
+    """sha256 of the original behind originals/xx/<hash>.ext or variants/xx/<hash>/<w>.ext"""
+    parts = filename.split('/')
+    if len(parts) == 3 and parts[0] == 'originals':
+        return parts[2].split('.', 1)[0]
+    if len(parts) == 4 and parts[0] == 'variants':
+        return parts[2]
+    return None
+
+
+def _strong_etag(filename, full_path):
+    if _is_hashed(filename):
+        # The name already identifies the bytes; no need to read the file
+        return filename.split('/', 2)[2].replace('/', '-')
+
+    stat = os.stat(full_path)
+    key = (full_path, stat.st_mtime_ns, stat.st_size)
+    if key not in _etag_cache:
+        digest = hashlib.sha256()
+        with open(full_path, 'rb') as f:
+            for chunk in iter(lambda: f.read(64 * 1024), b''):
+                digest.update(chunk)
+        _etag_cache[key] = digest.hexdigest()
+    return _etag_cache[key]
+
+
+def _relative_upload_path(value):
+    """Path inside the upload folder referenced by an `image` value, if any"""
+    if not value:
+        return None
+    path = urlparse(value).path
+    for prefix in (current_app.config['MEDIA_URL_PREFIX'], current_app.config['UPLOAD_URL_PREFIX'], '/static/uploads'):
+        if path.startswith(prefix + '/'):
+            return path[len(prefix) + 1:]
+    return None
+
+
+def _databases():
+    """The default database plus every tenant's; they all share UPLOAD_FOLDER"""
+    cache = current_app.extensions.get('tenants')
+    return [None] + (cache.tenants() if cache is not None else [])
+
+
+def find_orphaned_uploads(grace_seconds=None):
+    """Files in the upload folder that no `image` column references.
+
+    A content-addressed file is kept while any of its original or variant
+    URLs is referenced, in any tenant's database. Files younger than the
+    grace period are always kept, because an admin form may not have been
+    saved yet.
+    """
+    folder = current_app.config['UPLOAD_FOLDER']
+    grace_seconds = current_app.config['MEDIA_GC_GRACE_SECONDS'] if grace_seconds is None else grace_seconds
+    cutoff = time.time() - grace_seconds
+
+    referenced_paths = set()
+    referenced_hashes = set()
+    for tenant in _databases():
+        with tenant_scope(tenant):
+            for model in _IMAGE_MODELS:
+                for (value,) in db.session.query(model.image).filter(model.image.isnot(None)):
+                    path = _relative_upload_path(value)
+                    if path:
+                        referenced_paths.add(path)
+                        upload_hash = _hash_from_path(path)
+                        if upload_hash:
+                            referenced_hashes.add(upload_hash)
+
+    orphans = []
+    for root, _, files in os.walk(folder):
+        for name in files:
+            full_path = os.path.join(root, name)
+            filename = os.path.relpath(full_path, folder).replace(os.sep, '/')
+            if os.path.getmtime(full_path) > cutoff:
+                continue
+            upload_hash = _hash_from_path(filename)
+            if upload_hash is not None:
+                if upload_hash not in referenced_hashes:
+                    orphans.append(filename)
+            elif filename not in referenced_paths:
+                orphans.append(filename)
+    return sorted(orphans)
+
+
+def delete_orphaned_uploads(orphans):
+    """Remove orphaned files, their Upload rows (in every database) and any emptied directories"""
+    folder = current_app.config['UPLOAD_FOLDER']
+    freed = 0
+    hashes = set()
+    for filename in orphans:
+        full_path = os.path.join(folder, filename)
+        freed += os.path.getsize(full_path)
+        os.remove(full_path)
+        upload_hash = _hash_from_path(filename)
+        if upload_hash:
+            hashes.add(upload_hash)
+
+    if hashes:
+        for tenant in _databases():
+            with tenant_scope(tenant):
+                Upload.query.filter(Upload.hash.in_(hashes)).delete(synchronize_session=False)
+                db.session.commit()
+
+    for root, dirs, files in os.walk(folder, topdown=False):
+        if root != folder and not dirs and not files:
+            os.rmdir(root)
+    return freed
+
+
+def register_media_routes(app):
+    app.config.setdefault('MEDIA_URL_PREFIX', '/media')
+    app.config.setdefault('MEDIA_IMMUTABLE_MAX_AGE', 365 * 24 * 60 * 60)
+    app.config.setdefault('MEDIA_MAX_AGE', 24 * 60 * 60)
+    # Internal nginx location mapped to UPLOAD_FOLDER, e.g. '/protected-media';
+    # Apache mod_xsendfile is covered by Flask's own USE_X_SENDFILE
+    app.config.setdefault('MEDIA_X_ACCEL_PREFIX', None)
+    app.config.setdefault('MEDIA_GC_GRACE_SECONDS', 24 * 60 * 60)
+
+    @app.cli.command('gc-uploads')
+    @click.option('--delete', is_flag=True, help='Delete the orphaned files instead of listing them.')
+    @click.option('--grace-seconds', type=int, default=None, help='Keep files younger than this.')
+    def gc_uploads_command(delete, grace_seconds):
+        """Find (and optionally delete) upload files no image column references."""
+        orphans = find_orphaned_uploads(grace_seconds)
+        for filename in orphans:
+            click.echo(filename)
+        if delete and orphans:
+            freed = delete_orphaned_uploads(orphans)
+            click.echo(f'Deleted {len(orphans)} orphaned files, freed {freed} bytes')
+        else:
+            click.echo(f'Found {len(orphans)} orphaned files')
+
+    # Media Routes
+    @app.route(app.config['MEDIA_URL_PREFIX'] + '/<path:filename>', methods=['GET'])
+    def get_media(filename):
+        """Serve an uploaded file with long-lived caching, strong ETags and Range support"""
+        full_path = safe_join(app.config['UPLOAD_FOLDER'], filename)
+        if full_path is None or filename.startswith('tmp/') or not os.path.isfile(full_path):
+            return jsonify({'success': False, 'error': 'File not found'}), 404
+
+        immutable = _is_hashed(filename)
+        max_age = app.config['MEDIA_IMMUTABLE_MAX_AGE'] if immutable else app.config['MEDIA_MAX_AGE']
+        etag = _strong_etag(filename, full_path)
+
+        accel_prefix = app.config['MEDIA_X_ACCEL_PREFIX']
+        if accel_prefix:
+            # nginx streams the file (and handles Range) from an internal location
+            if request.if_none_match.contains(etag):
+                response = app.response_class(status=304)
+            else:
+                response = app.response_class()
+                response.headers['X-Accel-Redirect'] = f'{accel_prefix}/{filename}'
+                response.content_type = mimetypes.guess_type(filename)[0] or 'application/octet-stream'
+            response.set_etag(etag)
+        else:
+            # conditional=True answers If-None-Match with 304 and Range with 206
+            response = send_file(full_path, conditional=True, etag=etag, max_age=max_age)
+            response.accept_ranges = 'bytes'
+
+        response.cache_control.public = True
+        response.cache_control.max_age = max_age
+        response.cache_control.immutable = immutable or None
+        return response
@@ -0,0 +1,54 @@
+"""unique attendance per worker and date
+
+Revision ID: 0004
+Revises: 0003
+Create Date: 2026-10-19 09:12:04.518327
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '0004'
+down_revision = '0003'
+branch_labels = None
+depends_on = None
+
+BATCH_SIZE = 5000
+
+
+def _dedupe_attendance(bind):
+    """Stream attendance in key order and delete all but the newest row per (worker_id, date)"""
+    rows = bind.execution_options(stream_results=True).execute(sa.text(
+        'SELECT id, worker_id, date FROM attendance '
+        'ORDER BY worker_id, date, updated_at DESC, id DESC'
+    ))
+    duplicate_ids = []
+    previous_key = None
+    while True:
+        batch = rows.fetchmany(BATCH_SIZE)
+        if not batch:
+            break
+        for attendance_id, worker_id, day in batch:
+            key = (worker_id, day)
+            if key == previous_key:
+                duplicate_ids.append(attendance_id)
+            previous_key = key
+    rows.close()
+
+    delete = sa.text('DELETE FROM attendance WHERE id IN :ids').bindparams(sa.bindparam('ids', expanding=True))
+    for start in range(0, len(duplicate_ids), BATCH_SIZE):
+        bind.execute(delete, {'ids': duplicate_ids[start:start + BATCH_SIZE]})
+
+
+def upgrade():
+    _dedupe_attendance(op.get_bind())
+
+    with op.batch_alter_table('attendance', schema=None) as batch_op:
+        batch_op.create_index('ix_attendance_worker_id_date', ['worker_id', 'date'], unique=True)
+
+
+def downgrade():
+    with op.batch_alter_table('attendance', schema=None) as batch_op:
+        batch_op.drop_index('ix_attendance_worker_id_date')
@@ -0,0 +1,62 @@
+"""store money as integer cents
+
+Revision ID: 0005
+Revises: 0004
+Create Date: 2026-10-19 10:02:37.904116
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '0005'
+down_revision = '0004'
+branch_labels = None
+depends_on = None
+
+MONEY_COLUMNS = {
+    'worker': ['daily_price'],
+    'daily_activity': ['unit_price', 'total_price'],
+    'cost': ['amount'],
+    'site_daily_total': ['revenue', 'cost'],
+}
+
+
+def upgrade():
+    for table, columns in MONEY_COLUMNS.items():
+        # Scale in place first so both SQLite (table copy) and PostgreSQL (USING) just cast
+        op.execute(
+            f"UPDATE {table} SET " + ', '.join(f"{column} = ROUND({column} * 100)" for column in columns)
+        )
+        with op.batch_alter_table(table, schema=None) as batch_op:
+            for column in columns:
+                batch_op.alter_column(
+                    column,
+                    existing_type=sa.Float(),
+                    type_=sa.Integer(),
+                    existing_nullable=False,
+                    postgresql_using=f'{column}::integer'
+                )
+
+    with op.batch_alter_table('cost', schema=None) as batch_op:
+        batch_op.create_index('ix_cost_site_id_date', ['site_id', 'date'], unique=False)
+
+
+def downgrade():
+    with op.batch_alter_table('cost', schema=None) as batch_op:
+        batch_op.drop_index('ix_cost_site_id_date')
+
+    for table, columns in MONEY_COLUMNS.items():
+        with op.batch_alter_table(table, schema=None) as batch_op:
+            for column in columns:
+                batch_op.alter_column(
+                    column,
+                    existing_type=sa.Integer(),
+                    type_=sa.Float(),
+                    existing_nullable=False,
+                    postgresql_using=f'{column}::double precision'
+                )
+        op.execute(
+            f"UPDATE {table} SET " + ', '.join(f"{column} = {column} / 100.0" for column in columns)
+        )
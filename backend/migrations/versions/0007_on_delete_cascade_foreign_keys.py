@@ -0,0 +1,64 @@
+"""on delete cascade foreign keys
+
+Revision ID: 0007
+Revises: 0006
+Create Date: 2026-10-19 06:02:11.418207
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '0007'
+down_revision = '0006'
+branch_labels = None
+depends_on = None
+
+# SQLite foreign keys created by db.create_all() have no name; batch mode
+# needs one to drop them, so reflected constraints get a conventional name
+NAMING_CONVENTION = {'fk': 'fk_%(table_name)s_%(column_0_name)s_%(referred_table_name)s'}
+
+# table -> [(column, referred table, ON DELETE action)]
+FOREIGN_KEYS = {
+    'worker': [('site_id', 'site', 'CASCADE')],
+    'attendance': [('worker_id', 'worker', 'CASCADE')],
+    'daily_activity': [('site_id', 'site', 'CASCADE')],
+    'activity_worker': [('activity_id', 'daily_activity', 'CASCADE'),
+                        ('worker_id', 'worker', 'CASCADE')],
+    'cost': [('site_id', 'site', 'CASCADE'),
+             ('worker_id', 'worker', 'CASCADE'),
+             ('daily_activity_id', 'daily_activity', 'SET NULL')],
+    'site_daily_total': [('site_id', 'site', 'CASCADE')],
+    'site_forecast': [('site_id', 'site', 'CASCADE')],
+}
+
+
+def _replace_foreign_keys(with_ondelete):
+    inspector = sa.inspect(op.get_bind())
+    for table, foreign_keys in FOREIGN_KEYS.items():
+        existing = {
+            tuple(fk['constrained_columns']): fk['name']
+            for fk in inspector.get_foreign_keys(table)
+        }
+        with op.batch_alter_table(table, naming_convention=NAMING_CONVENTION) as batch_op:
+            for column, referred_table, ondelete in foreign_keys:
+                name = f'fk_{table}_{column}_{referred_table}'
+                batch_op.drop_constraint(existing.get((column,)) or name, type_='foreignkey')
+                batch_op.create_foreign_key(name, referred_table, [column], ['id'],
+                                            ondelete=ondelete if with_ondelete else None)
+
+
+def upgrade():
+    # Costs can point at activities deleted while SQLite ignored foreign keys;
+    # give them the value ON DELETE SET NULL would have
+    op.execute(
+        'UPDATE cost SET daily_activity_id = NULL '
+        'WHERE daily_activity_id IS NOT NULL '
+        'AND daily_activity_id NOT IN (SELECT id FROM daily_activity)'
+    )
+    _replace_foreign_keys(with_ondelete=True)
+
+
+def downgrade():
+    _replace_foreign_keys(with_ondelete=False)
@@ -1,5 +1,35 @@
 from extensions import db
+from collections import defaultdict
 from datetime import datetime
+from decimal import Decimal, ROUND_HALF_UP
+import json
+
+# Money Column Type
+class Money(db.TypeDecorator):
+    """Monetary amount stored as integer minor units (cents).
+
+    Python code sees exact Decimal values rounded to the cent; SQL sees
+    integers, so SUM() and comparisons are exact and index-friendly.
+    """
+    impl = db.Integer
+    cache_ok = True
+
+    def process_bind_param(self, value, dialect):
+        if value is None:
+            return None
+        return int((to_decimal(value) * 100).to_integral_value(rounding=ROUND_HALF_UP))
+
+    def process_result_value(self, value, dialect):
+        if value is None:
+            return None
+        return Decimal(int(value)) / 100
+
+def to_decimal(value):
+    """Exact Decimal for a JSON number or string, rounded to the cent"""
+    return Decimal(str(value)).quantize(Decimal('0.01'), rounding=ROUND_HALF_UP)
+
+def money_to_json(value):
+    return float(value) if value is not None else None
 
 # Service Model
 class Service(db.Model):
@@ -8,7 +38,8 @@ class Service(db.Model):
     description = db.Column(db.Text, nullable=False)
     image = db.Column(db.String(500), nullable=False)
     icon_name = db.Column(db.String(100))
-    features = db.relationship('ServiceFeature', backref='service', lazy=True, cascade='all, delete-orphan')
+    features = db.relationship('ServiceFeature', backref='service', lazy='selectin', cascade='all, delete-orphan',
+                               order_by='ServiceFeature.position')
     created_at = db.Column(db.DateTime, default=datetime.utcnow)
     updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
 
@@ -24,11 +55,37 @@ class Service(db.Model):
             'updated_at': self.updated_at.isoformat() if self.updated_at else None
         }
 
+    def set_features(self, features):
+        """Replace the ordered feature list, touching only rows that changed"""
+        available = defaultdict(list)
+        for feature in self.features:
+            available[feature.feature].append(feature)
+
+        ordered = []
+        changed = False
+        for position, text in enumerate(features):
+            if available[text]:
+                feature = available[text].pop(0)
+                if feature.position != position:
+                    feature.position = position
+                    changed = True
+            else:
+                feature = ServiceFeature(feature=text, position=position)
+                changed = True
+            ordered.append(feature)
+        # Rows left out of the new list are orphans and get deleted on flush
+        if changed or any(available.values()):
+            self.updated_at = datetime.utcnow()
+        self.features = ordered
+
 # Service Feature Model
 class ServiceFeature(db.Model):
     id = db.Column(db.Integer, primary_key=True)
     service_id = db.Column(db.Integer, db.ForeignKey('service.id'), nullable=False)
     feature = db.Column(db.String(200), nullable=False)
+    position = db.Column(db.Integer, nullable=False, default=0)
+
+    __table_args__ = (db.Index('ix_service_feature_service_id_position', 'service_id', 'position'),)
 
 # Project/Portfolio Model
 class Project(db.Model):
@@ -71,12 +128,12 @@ class BlogPost(db.Model):
     created_at = db.Column(db.DateTime, default=datetime.utcnow)
     updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
 
-    def to_dict(self):
+    def to_summary_dict(self):
+        """Everything but the content, for list views that defer loading it"""
         return {
             'id': self.id,
             'title': self.title,
             'excerpt': self.excerpt,
-            'content': self.content,
             'author': self.author,
             'publishDate': self.publish_date,
             'category': self.category,
@@ -86,6 +143,18 @@ class BlogPost(db.Model):
             'updated_at': self.updated_at.isoformat() if self.updated_at else None
         }
 
+    def to_dict(self):
+        data = self.to_summary_dict()
+        data['content'] = self.content
+        return data
+
+# Blog Post Render Model (gzipped detail response, valid while post_updated_at matches the post)
+class BlogPostRender(db.Model):
+    post_id = db.Column(db.Integer, db.ForeignKey('blog_post.id', ondelete='CASCADE'), primary_key=True)
+    post_updated_at = db.Column(db.DateTime, nullable=False)
+    etag = db.Column(db.String(40), nullable=False)
+    body_gzip = db.Column(db.LargeBinary, nullable=False)
+
 # Team Member Model
 class TeamMember(db.Model):
     id = db.Column(db.Integer, primary_key=True)
@@ -141,9 +210,15 @@ class ContactSubmission(db.Model):
     message = db.Column(db.Text, nullable=False)
     budget = db.Column(db.String(100))
     status = db.Column(db.String(50), default='new')  # new, contacted, quoted, closed
+    message_hash = db.Column(db.String(64))  # sha256 of the normalized message, for duplicate detection
     created_at = db.Column(db.DateTime, default=datetime.utcnow)
     updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
 
+    __table_args__ = (
+        db.Index('ix_contact_submission_email_message_hash', 'email', 'message_hash'),
+        db.Index('ix_contact_submission_status_created_at', 'status', 'created_at'),
+    )
+
     def to_dict(self):
         return {
             'id': self.id,
@@ -159,6 +234,11 @@ class ContactSubmission(db.Model):
             'updated_at': self.updated_at.isoformat() if self.updated_at else None
         }
 
+# Contact Status Count Model (submissions per status, kept up to date on write)
+class ContactStatusCount(db.Model):
+    status = db.Column(db.String(50), primary_key=True)
+    count = db.Column(db.Integer, nullable=False, default=0)
+
 # Company Stats Model
 class CompanyStat(db.Model):
     id = db.Column(db.Integer, primary_key=True)
@@ -215,13 +295,18 @@ class Site(db.Model):
     start_date = db.Column(db.Date)
     end_date = db.Column(db.Date)
     status = db.Column(db.String(50), default='active')  # active, completed, on_hold
+    deleted_at = db.Column(db.DateTime)  # soft delete
+    archived_at = db.Column(db.DateTime)  # attendance, activities and costs moved to archive tables
     created_at = db.Column(db.DateTime, default=datetime.utcnow)
-    updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, index=True)
     
     # Relationships
-    workers = db.relationship('Worker', backref='site', lazy=True, cascade='all, delete-orphan')
-    daily_activities = db.relationship('DailyActivity', backref='site', lazy=True, cascade='all, delete-orphan')
-    costs = db.relationship('Cost', backref='site', lazy=True, cascade='all, delete-orphan')
+    # Child rows are removed by ON DELETE CASCADE, not loaded and deleted one by one
+    workers = db.relationship('Worker', backref='site', lazy=True, cascade='all, delete-orphan', passive_deletes=True)
+    daily_activities = db.relationship('DailyActivity', backref='site', lazy=True, cascade='all, delete-orphan', passive_deletes=True)
+    costs = db.relationship('Cost', backref='site', lazy=True, cascade='all, delete-orphan', passive_deletes=True)
+    daily_totals = db.relationship('SiteDailyTotal', backref='site', lazy=True, cascade='all, delete-orphan', passive_deletes=True)
+    forecast = db.relationship('SiteForecast', backref='site', lazy=True, uselist=False, cascade='all, delete-orphan', passive_deletes=True)
 
     def to_dict(self):
         return {
@@ -232,6 +317,7 @@ class Site(db.Model):
             'start_date': self.start_date.isoformat() if self.start_date else None,
             'end_date': self.end_date.isoformat() if self.end_date else None,
             'status': self.status,
+            'archived_at': self.archived_at.isoformat() if self.archived_at else None,
             'created_at': self.created_at.isoformat() if self.created_at else None,
             'updated_at': self.updated_at.isoformat() if self.updated_at else None
         }
@@ -243,15 +329,17 @@ class Worker(db.Model):
     phone = db.Column(db.String(50))
     email = db.Column(db.String(200))
     position = db.Column(db.String(100), nullable=False)
-    daily_price = db.Column(db.Float, nullable=False)
-    site_id = db.Column(db.Integer, db.ForeignKey('site.id'), nullable=False)
+    daily_price = db.Column(Money, nullable=False)
+    site_id = db.Column(db.Integer, db.ForeignKey('site.id', ondelete='CASCADE'), nullable=False)
     is_active = db.Column(db.Boolean, default=True)
     created_at = db.Column(db.DateTime, default=datetime.utcnow)
-    updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, index=True)
     
     # Relationships
-    attendances = db.relationship('Attendance', backref='worker', lazy=True, cascade='all, delete-orphan')
-    costs = db.relationship('Cost', backref='worker', lazy=True, cascade='all, delete-orphan')
+    attendances = db.relationship('Attendance', backref='worker', lazy=True, cascade='all, delete-orphan', passive_deletes=True)
+    costs = db.relationship('Cost', backref='worker', lazy=True, cascade='all, delete-orphan', passive_deletes=True)
+    activity_links = db.relationship('ActivityWorker', backref='worker', lazy=True, cascade='all, delete-orphan', passive_deletes=True)
+    roster_stat = db.relationship('WorkerRosterStat', backref='worker', lazy=True, uselist=False, cascade='all, delete-orphan', passive_deletes=True)
 
     def to_dict(self):
         return {
@@ -260,7 +348,7 @@ class Worker(db.Model):
             'phone': self.phone,
             'email': self.email,
             'position': self.position,
-            'daily_price': self.daily_price,
+            'daily_price': money_to_json(self.daily_price),
             'site_id': self.site_id,
             'site_name': self.site.name if self.site else None,
             'is_active': self.is_active,
@@ -271,7 +359,7 @@ class Worker(db.Model):
 # Attendance Model
 class Attendance(db.Model):
     id = db.Column(db.Integer, primary_key=True)
-    worker_id = db.Column(db.Integer, db.ForeignKey('worker.id'), nullable=False)
+    worker_id = db.Column(db.Integer, db.ForeignKey('worker.id', ondelete='CASCADE'), nullable=False)
     date = db.Column(db.Date, nullable=False)
     check_in_time = db.Column(db.Time)
     check_out_time = db.Column(db.Time)
@@ -279,7 +367,9 @@ class Attendance(db.Model):
     is_present = db.Column(db.Boolean, default=True)
     notes = db.Column(db.Text)
     created_at = db.Column(db.DateTime, default=datetime.utcnow)
-    updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, index=True)
+
+    __table_args__ = (db.Index('ix_attendance_worker_id_date', 'worker_id', 'date', unique=True),)
 
     def to_dict(self):
         return {
@@ -300,16 +390,32 @@ class Attendance(db.Model):
 # Daily Activity Model
 class DailyActivity(db.Model):
     id = db.Column(db.Integer, primary_key=True)
-    site_id = db.Column(db.Integer, db.ForeignKey('site.id'), nullable=False)
+    site_id = db.Column(db.Integer, db.ForeignKey('site.id', ondelete='CASCADE'), nullable=False)
     date = db.Column(db.Date, nullable=False)
     activity_name = db.Column(db.String(200), nullable=False)
     description = db.Column(db.Text)
     quantity = db.Column(db.Float, default=1.0)
-    unit_price = db.Column(db.Float, nullable=False)
-    total_price = db.Column(db.Float, nullable=False)
-    workers_involved = db.Column(db.Text)  # JSON string of worker IDs
+    unit_price = db.Column(Money, nullable=False)
+    total_price = db.Column(Money, nullable=False)
     created_at = db.Column(db.DateTime, default=datetime.utcnow)
-    updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, index=True)
+
+    # Relationships
+    worker_links = db.relationship('ActivityWorker', backref='activity', lazy='selectin', cascade='all, delete-orphan', passive_deletes=True)
+
+    @property
+    def worker_ids(self):
+        return sorted(link.worker_id for link in self.worker_links)
+
+    def set_worker_ids(self, worker_ids):
+        """Replace the involved workers, touching only links that changed"""
+        wanted = {int(worker_id) for worker_id in worker_ids}
+        for link in list(self.worker_links):
+            if link.worker_id not in wanted:
+                self.worker_links.remove(link)
+        existing = {link.worker_id for link in self.worker_links}
+        for worker_id in sorted(wanted - existing):
+            self.worker_links.append(ActivityWorker(worker_id=worker_id))
 
     def to_dict(self):
         return {
@@ -320,29 +426,146 @@ class DailyActivity(db.Model):
             'activity_name': self.activity_name,
             'description': self.description,
             'quantity': self.quantity,
-            'unit_price': self.unit_price,
-            'total_price': self.total_price,
-            'workers_involved': self.workers_involved,
+            'unit_price': money_to_json(self.unit_price),
+            'total_price': money_to_json(self.total_price),
+            'workers_involved': json.dumps(self.worker_ids),
             'created_at': self.created_at.isoformat() if self.created_at else None,
             'updated_at': self.updated_at.isoformat() if self.updated_at else None
         }
 
+def compute_total_price(quantity, unit_price):
+    """DailyActivity.total_price: quantity x unit price, rounded to the cent"""
+    if unit_price is None:
+        return None
+    quantity = 1.0 if quantity is None else quantity
+    return to_decimal(Decimal(str(quantity)) * to_decimal(unit_price))
+
+@db.event.listens_for(DailyActivity, 'before_insert')
+@db.event.listens_for(DailyActivity, 'before_update')
+def _derive_total_price(mapper, connection, target):
+    target.total_price = compute_total_price(target.quantity, target.unit_price)
+
+# Bulk writes read back their rows in chunks to keep IN lists small
+_BULK_CHUNK_SIZE = 500
+
+def _activity_rows(connection, ids, *columns):
+    table = DailyActivity.__table__
+    for start in range(0, len(ids), _BULK_CHUNK_SIZE):
+        yield from connection.execute(
+            db.select(table.c.id, *columns).where(table.c.id.in_(ids[start:start + _BULK_CHUNK_SIZE]))
+        )
+
+def _apply_bulk_rollup(connection, before, after):
+    """Move site_daily_total revenue from the (site_id, date, total_price) rows
+    before a bulk write to the rows after it; bulk writes never flush, so the
+    forecasting after_flush hook does not see them"""
+    # forecasting imports this module
+    from forecasting import apply_rollup_deltas
+    deltas = defaultdict(lambda: [Decimal(0), Decimal(0)])
+    for site_id, day, total in before:
+        deltas[(site_id, day)][0] -= total or Decimal(0)
+    for site_id, day, total in after:
+        deltas[(site_id, day)][0] += total or Decimal(0)
+    deltas = {key: value for key, value in deltas.items() if value[0]}
+    apply_rollup_deltas(connection, deltas, {site_id for site_id, _ in deltas})
+
+@db.event.listens_for(db.session, 'do_orm_execute')
+def _derive_bulk_total_price(orm_execute_state):
+    """Keep total_price derived, and the revenue rollup current, for ORM bulk INSERT and UPDATE statements"""
+    if orm_execute_state.bind_mapper is not DailyActivity.__mapper__:
+        return
+    if not (orm_execute_state.is_insert or orm_execute_state.is_update):
+        return
+
+    session = orm_execute_state.session
+    params = orm_execute_state.parameters
+    if orm_execute_state.is_insert:
+        if isinstance(params, dict) and params:
+            # Single-row insert; invoke_statement merges these into the original params
+            total = compute_total_price(params.get('quantity'), params.get('unit_price'))
+            result = orm_execute_state.invoke_statement(params={'total_price': total})
+            _apply_bulk_rollup(session.connection(), [], [(params.get('site_id'), params.get('date'), total)])
+            return result
+        if not isinstance(params, list):
+            return None
+        rows = [
+            dict(row, total_price=compute_total_price(row.get('quantity'), row.get('unit_price')))
+            for row in params
+        ]
+        result = orm_execute_state.invoke_statement(params=rows)
+        _apply_bulk_rollup(session.connection(), [],
+                           [(row.get('site_id'), row.get('date'), row['total_price']) for row in rows])
+        return result
+
+    table = DailyActivity.__table__
+    # Connection-level execute so these statements do not re-enter the hook
+    connection = session.connection()
+    # Find the matched rows before the UPDATE runs: it may change the very
+    # columns its WHERE clause filters on
+    if isinstance(params, list):
+        ids = [row['id'] for row in params]
+    else:
+        matched = db.select(table.c.id)
+        if orm_execute_state.statement.whereclause is not None:
+            matched = matched.where(orm_execute_state.statement.whereclause)
+        ids = connection.execute(matched).scalars().all()
+    before = [
+        (site_id, day, total)
+        for _, site_id, day, total in _activity_rows(connection, ids, table.c.site_id, table.c.date, table.c.total_price)
+    ]
+
+    result = orm_execute_state.invoke_statement()
+    if not ids:
+        return result
+
+    # Recompute with compute_total_price (Decimal, ROUND_HALF_UP) so bulk and
+    # per-row writes agree to the cent; SQL ROUND on the float product does not
+    after, totals = [], []
+    for row_id, site_id, day, quantity, unit_price in _activity_rows(
+            connection, ids, table.c.site_id, table.c.date, table.c.quantity, table.c.unit_price):
+        total = compute_total_price(quantity, unit_price)
+        after.append((site_id, day, total))
+        totals.append({'row_id': row_id, 'row_total': total})
+    connection.execute(
+        db.update(table).where(table.c.id == db.bindparam('row_id'))
+        .values(total_price=db.bindparam('row_total', type_=Money)),
+        totals
+    )
+    _apply_bulk_rollup(connection, before, after)
+
+    # Loaded activities still hold the old total
+    updated = set(ids)
+    for obj in list(session.identity_map.values()):
+        if isinstance(obj, DailyActivity) and obj.id in updated:
+            session.expire(obj, ['total_price'])
+    return result
+
+# Activity Worker Model (workers involved in a daily activity)
+class ActivityWorker(db.Model):
+    activity_id = db.Column(db.Integer, db.ForeignKey('daily_activity.id', ondelete='CASCADE'), primary_key=True)
+    worker_id = db.Column(db.Integer, db.ForeignKey('worker.id', ondelete='CASCADE'), primary_key=True, index=True)
+
 # Cost Model
 class Cost(db.Model):
     id = db.Column(db.Integer, primary_key=True)
-    site_id = db.Column(db.Integer, db.ForeignKey('site.id'), nullable=False)
-    worker_id = db.Column(db.Integer, db.ForeignKey('worker.id'), nullable=True)
-    daily_activity_id = db.Column(db.Integer, db.ForeignKey('daily_activity.id'), nullable=True)
+    site_id = db.Column(db.Integer, db.ForeignKey('site.id', ondelete='CASCADE'), nullable=False)
+    worker_id = db.Column(db.Integer, db.ForeignKey('worker.id', ondelete='CASCADE'), nullable=True)
+    daily_activity_id = db.Column(db.Integer, db.ForeignKey('daily_activity.id', ondelete='SET NULL'), nullable=True)
     cost_type = db.Column(db.String(50), nullable=False)  # worker, activity, material, equipment, other
     description = db.Column(db.Text, nullable=False)
-    amount = db.Column(db.Float, nullable=False)
+    amount = db.Column(Money, nullable=False)
     date = db.Column(db.Date, nullable=False)
     category = db.Column(db.String(100))  # labor, materials, equipment, overhead, etc.
     created_at = db.Column(db.DateTime, default=datetime.utcnow)
-    updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, index=True)
+
+    __table_args__ = (
+        db.Index('ix_cost_site_id_date', 'site_id', 'date'),
+        db.Index('ix_cost_worker_id', 'worker_id'),
+    )
     
     # Relationships
-    daily_activity = db.relationship('DailyActivity', backref='costs', lazy=True)
+    daily_activity = db.relationship('DailyActivity', backref=db.backref('costs', passive_deletes=True), lazy=True)
 
     def to_dict(self):
         return {
@@ -355,9 +578,189 @@ class Cost(db.Model):
             'activity_name': self.daily_activity.activity_name if self.daily_activity else None,
             'cost_type': self.cost_type,
             'description': self.description,
-            'amount': self.amount,
+            'amount': money_to_json(self.amount),
+            'date': self.date.isoformat() if self.date else None,
+            'category': self.category,
+            'created_at': self.created_at.isoformat() if self.created_at else None,
+            'updated_at': self.updated_at.isoformat() if self.updated_at else None
+        }
+# Site Daily Total Model (per-site per-day rollup of billable work and costs)
+class SiteDailyTotal(db.Model):
+    id = db.Column(db.Integer, primary_key=True)
+    site_id = db.Column(db.Integer, db.ForeignKey('site.id', ondelete='CASCADE'), nullable=False, index=True)
+    date = db.Column(db.Date, nullable=False)
+    revenue = db.Column(Money, nullable=False, default=0)
+    cost = db.Column(Money, nullable=False, default=0)
+
+    __table_args__ = (db.UniqueConstraint('site_id', 'date', name='uq_site_daily_total_site_date'),)
+
+    def to_dict(self):
+        return {
+            'site_id': self.site_id,
+            'date': self.date.isoformat() if self.date else None,
+            'revenue': money_to_json(self.revenue),
+            'cost': money_to_json(self.cost)
+        }
+
+# Site Forecast Model (precomputed profitability summary per site)
+class SiteForecast(db.Model):
+    site_id = db.Column(db.Integer, db.ForeignKey('site.id', ondelete='CASCADE'), primary_key=True)
+    is_stale = db.Column(db.Boolean, nullable=False, default=True)
+    computed_on = db.Column(db.Date)
+    data = db.Column(db.Text)  # JSON summary
+    updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+
+# Worker Roster Stat Model (precomputed attendance and cost figures per worker)
+class WorkerRosterStat(db.Model):
+    worker_id = db.Column(db.Integer, db.ForeignKey('worker.id', ondelete='CASCADE'), primary_key=True)
+    is_stale = db.Column(db.Boolean, nullable=False, default=True)
+    computed_on = db.Column(db.Date)
+    days_present_30 = db.Column(db.Integer, nullable=False, default=0)
+    days_present_90 = db.Column(db.Integer, nullable=False, default=0)
+    total_hours = db.Column(db.Float, nullable=False, default=0.0)
+    last_attendance_date = db.Column(db.Date)  # last day the worker was present
+    lifetime_cost = db.Column(Money, nullable=False, default=0)
+    updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+# Sync Tombstone Model (deleted site-management rows, reported to offline clients)
+class SyncTombstone(db.Model):
+    id = db.Column(db.Integer, primary_key=True)
+    entity = db.Column(db.String(50), nullable=False)  # site, worker, attendance, daily_activity, cost
+    entity_id = db.Column(db.Integer, nullable=False)
+    deleted_at = db.Column(db.DateTime, nullable=False, default=datetime.utcnow, index=True)
+
+# Replica Heartbeat Model (last primary commit, read back from the replica to measure lag)
+class ReplicaHeartbeat(db.Model):
+    id = db.Column(db.Integer, primary_key=True)
+    beat_at = db.Column(db.DateTime, nullable=False)
+
+# Public Content Version Model (bumped by every commit that changes public CMS content)
+class PublicContentVersion(db.Model):
+    id = db.Column(db.Integer, primary_key=True)
+    version = db.Column(db.Integer, nullable=False, default=0)
+    updated_at = db.Column(db.DateTime, nullable=False)
+
+# Archived Attendance Model (attendance moved out of the hot table)
+class ArchivedAttendance(db.Model):
+    id = db.Column(db.Integer, primary_key=True, autoincrement=False)
+    worker_id = db.Column(db.Integer, nullable=False)
+    site_id = db.Column(db.Integer, nullable=False, index=True)
+    date = db.Column(db.Date, nullable=False)
+    check_in_time = db.Column(db.Time)
+    check_out_time = db.Column(db.Time)
+    hours_worked = db.Column(db.Float, default=0.0)
+    is_present = db.Column(db.Boolean, default=True)
+    notes = db.Column(db.Text)
+    created_at = db.Column(db.DateTime)
+    updated_at = db.Column(db.DateTime)
+    archived_at = db.Column(db.DateTime, default=datetime.utcnow)
+
+    def to_dict(self):
+        return {
+            'id': self.id,
+            'worker_id': self.worker_id,
+            'site_id': self.site_id,
+            'date': self.date.isoformat() if self.date else None,
+            'check_in_time': self.check_in_time.strftime('%H:%M') if self.check_in_time else None,
+            'check_out_time': self.check_out_time.strftime('%H:%M') if self.check_out_time else None,
+            'hours_worked': self.hours_worked,
+            'is_present': self.is_present,
+            'notes': self.notes,
+            'created_at': self.created_at.isoformat() if self.created_at else None,
+            'updated_at': self.updated_at.isoformat() if self.updated_at else None,
+            'archived_at': self.archived_at.isoformat() if self.archived_at else None
+        }
+
+# Archived Daily Activity Model
+class ArchivedDailyActivity(db.Model):
+    id = db.Column(db.Integer, primary_key=True, autoincrement=False)
+    site_id = db.Column(db.Integer, nullable=False, index=True)
+    date = db.Column(db.Date, nullable=False)
+    activity_name = db.Column(db.String(200), nullable=False)
+    description = db.Column(db.Text)
+    quantity = db.Column(db.Float, default=1.0)
+    unit_price = db.Column(Money, nullable=False)
+    total_price = db.Column(Money, nullable=False)
+    workers_involved = db.Column(db.Text)  # JSON list of worker IDs at archive time
+    created_at = db.Column(db.DateTime)
+    updated_at = db.Column(db.DateTime)
+    archived_at = db.Column(db.DateTime, default=datetime.utcnow)
+
+    def to_dict(self):
+        return {
+            'id': self.id,
+            'site_id': self.site_id,
+            'date': self.date.isoformat() if self.date else None,
+            'activity_name': self.activity_name,
+            'description': self.description,
+            'quantity': self.quantity,
+            'unit_price': money_to_json(self.unit_price),
+            'total_price': money_to_json(self.total_price),
+            'workers_involved': self.workers_involved,
+            'created_at': self.created_at.isoformat() if self.created_at else None,
+            'updated_at': self.updated_at.isoformat() if self.updated_at else None,
+            'archived_at': self.archived_at.isoformat() if self.archived_at else None
+        }
+
+# Archived Cost Model
+class ArchivedCost(db.Model):
+    id = db.Column(db.Integer, primary_key=True, autoincrement=False)
+    site_id = db.Column(db.Integer, nullable=False, index=True)
+    worker_id = db.Column(db.Integer)
+    daily_activity_id = db.Column(db.Integer)
+    cost_type = db.Column(db.String(50), nullable=False)
+    description = db.Column(db.Text, nullable=False)
+    amount = db.Column(Money, nullable=False)
+    date = db.Column(db.Date, nullable=False)
+    category = db.Column(db.String(100))
+    created_at = db.Column(db.DateTime)
+    updated_at = db.Column(db.DateTime)
+    archived_at = db.Column(db.DateTime, default=datetime.utcnow)
+
+    def to_dict(self):
+        return {
+            'id': self.id,
+            'site_id': self.site_id,
+            'worker_id': self.worker_id,
+            'daily_activity_id': self.daily_activity_id,
+            'cost_type': self.cost_type,
+            'description': self.description,
+            'amount': money_to_json(self.amount),
             'date': self.date.isoformat() if self.date else None,
             'category': self.category,
             'created_at': self.created_at.isoformat() if self.created_at else None,
+            'updated_at': self.updated_at.isoformat() if self.updated_at else None,
+            'archived_at': self.archived_at.isoformat() if self.archived_at else None
+        }
+
+# Upload Model (content-addressed image with resized variants)
+class Upload(db.Model):
+    id = db.Column(db.Integer, primary_key=True)
+    hash = db.Column(db.String(64), nullable=False, unique=True)  # sha256 of the original bytes
+    original_name = db.Column(db.String(300))
+    content_type = db.Column(db.String(100), nullable=False)
+    path = db.Column(db.String(500), nullable=False)  # relative to the upload folder
+    size = db.Column(db.Integer, nullable=False)
+    width = db.Column(db.Integer)
+    height = db.Column(db.Integer)
+    status = db.Column(db.String(50), default='pending')  # pending, ready, failed
+    variants = db.Column(db.Text)  # JSON list of {width, format, path, size}
+    created_at = db.Column(db.DateTime, default=datetime.utcnow)
+    updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+    def to_dict(self):
+        return {
+            'id': self.id,
+            'hash': self.hash,
+            'original_name': self.original_name,
+            'content_type': self.content_type,
+            'path': self.path,
+            'size': self.size,
+            'width': self.width,
+            'height': self.height,
+            'status': self.status,
+            'variants': json.loads(self.variants) if self.variants else [],
+            'created_at': self.created_at.isoformat() if self.created_at else None,
             'updated_at': self.updated_at.isoformat() if self.updated_at else None
-        }
\ No newline at end of file
+        }
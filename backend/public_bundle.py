@@ -0,0 +1,155 @@
+import hashlib
+import json
+import threading
+import time
+from datetime import datetime
+from flask import request, jsonify, current_app
+from sqlalchemy import event, select
+from extensions import db, upsert
+from models import (Service, ServiceFeature, TeamMember, Testimonial, CompanyStat, Certification, Award,
+                    PublicContentVersion)
+from tenants import current_tenant
+
+# Bundle section -> model, serialized like the matching GET routes
+_SECTIONS = {
+    'stats': CompanyStat,
+    'testimonials': Testimonial,
+    'services': Service,
+    'team': TeamMember,
+    'certifications': Certification,
+    'awards': Award
+}
+_TRACKED = tuple(_SECTIONS.values()) + (ServiceFeature,)
+_TRACKED_TABLES = {model.__table__ for model in _TRACKED}
+
+
+class _Bundle:
+    def __init__(self, version, body):
+        self.version = version
+        self.body = body
+        self.etag = hashlib.sha1(body).hexdigest()
+        self.checked_at = 0.0
+
+
+class PublicBundle:
+    """Public CMS content serialized once per content version and served from memory.
+
+    Commits touching the content bump public_content_version. This process
+    drops its bundle right away; other processes see the new version within
+    PUBLIC_BUNDLE_CHECK_SECONDS.
+    """
+
+    def __init__(self, check_seconds):
+        self.check_seconds = check_seconds
+        self.bundles = {}  # tenant -> _Bundle
+        self.invalidated_at = {}
+        self._lock = threading.Lock()
+
+    def invalidate(self, tenant):
+        self.invalidated_at[tenant] = time.monotonic()
+
+    def _fresh(self, tenant, bundle, now):
+        return (bundle is not None and now - bundle.checked_at < self.check_seconds
+                and bundle.checked_at > self.invalidated_at.get(tenant, 0.0))
+
+    def _build(self, version):
+        data = {
+            section: [obj.to_dict() for obj in model.query.order_by(model.id)]
+            for section, model in _SECTIONS.items()
+        }
+        payload = {'success': True, 'version': version, 'data': data}
+        return _Bundle(version, json.dumps(payload, separators=(',', ':')).encode('utf-8'))
+
+    def get(self):
+        tenant = current_tenant()
+        bundle = self.bundles.get(tenant)
+        if self._fresh(tenant, bundle, time.monotonic()):
+            return bundle
+        with self._lock:
+            checked_at = time.monotonic()
+            bundle = self.bundles.get(tenant)
+            if self._fresh(tenant, bundle, checked_at):
+                return bundle
+            # Version first: content committed in between only causes one more rebuild
+            version = db.session.execute(
+                select(PublicContentVersion.version).where(PublicContentVersion.id == 1)
+            ).scalar() or 0
+            if bundle is None or bundle.version != version:
+                bundle = self._build(version)
+            bundle.checked_at = checked_at
+            self.bundles[tenant] = bundle
+            return bundle
+
+
+def _touches_public_content(session):
+    return any(isinstance(obj, _TRACKED) for obj in session.new) \
+        or any(isinstance(obj, _TRACKED) for obj in session.deleted) \
+        or any(isinstance(obj, _TRACKED) and session.is_modified(obj) for obj in session.dirty)
+
+
+def _note_bulk_write(orm_execute_state):
+    if ((orm_execute_state.is_insert or orm_execute_state.is_update or orm_execute_state.is_delete)
+            and getattr(orm_execute_state.statement, 'table', None) in _TRACKED_TABLES):
+        orm_execute_state.session.info['public_content_changed'] = True
+
+
+def _note_flush(session, flush_context):
+    if _touches_public_content(session):
+        session.info['public_content_changed'] = True
+
+
+def _bump_version(session):
+    # before_commit runs ahead of the final flush, so look at pending objects too
+    if session.info.get('public_content_changed') or _touches_public_content(session):
+        table = PublicContentVersion.__table__
+        session.execute(upsert(
+            table,
+            {'id': 1, 'version': 1, 'updated_at': datetime.utcnow()},
+            ['id'],
+            lambda excluded: {'version': table.c.version + 1, 'updated_at': excluded.updated_at}
+        ))
+        session.info['public_content_changed'] = True
+
+
+def _invalidate_committed(session):
+    if session.info.pop('public_content_changed', False):
+        current_app.extensions['public_bundle'].invalidate(current_tenant())
+
+
+def _discard_change(session):
+    session.info.pop('public_content_changed', None)
+
+
+def register_public_bundle(app):
+    app.config.setdefault('PUBLIC_BUNDLE_CHECK_SECONDS', 1)
+    bundle_cache = PublicBundle(app.config['PUBLIC_BUNDLE_CHECK_SECONDS'])
+    app.extensions['public_bundle'] = bundle_cache
+    event.listen(db.session, 'do_orm_execute', _note_bulk_write)
+    event.listen(db.session, 'after_flush', _note_flush)
+    event.listen(db.session, 'before_commit', _bump_version)
+    event.listen(db.session, 'after_commit', _invalidate_committed)
+    event.listen(db.session, 'after_rollback', _discard_change)
+
+    # Public Bundle Routes
+    @app.route('/api/public/bundle', methods=['GET'])
+    def get_public_bundle():
+        """Get stats, testimonials, services, team, certifications and awards in one pre-serialized response"""
+        try:
+            bundle = bundle_cache.get()
+        except Exception as e:
+            return jsonify({'success': False, 'error': str(e)}), 500
+
+        # compression.py tags encoded bodies '<etag>-<encoding>'; any of them is current
+        matched = next((tag for tag in request.if_none_match
+                        if tag.split('-', 1)[0] == bundle.etag), None)
+        if matched is not None:
+            response = app.response_class(status=304)
+            response.set_etag(matched)
+        else:
+            response = app.response_class(bundle.body, mimetype='application/json')
+            response.set_etag(bundle.etag)
+        response.headers['X-Content-Version'] = str(bundle.version)
+        # Revalidate on every view; unchanged content costs a 304
+        response.cache_control.public = True
+        response.cache_control.no_cache = True
+        return response
@@ -0,0 +1,143 @@
+import sqlite3
+import threading
+import time
+from datetime import datetime
+import click
+from flask import g, request
+from sqlalchemy import event, select
+from extensions import db, upsert
+from models import ReplicaHeartbeat
+
+
+class ReplicaMonitor:
+    """Replica lag, measured from the heartbeat row stamped by every primary commit"""
+
+    def __init__(self, app):
+        self.app = app
+        self._lag = None
+        self._checked_at = None
+        self._lock = threading.Lock()
+
+    def _read_beat(self, engine):
+        with engine.connect() as connection:
+            return connection.execute(select(ReplicaHeartbeat.beat_at).where(ReplicaHeartbeat.id == 1)).scalar()
+
+    def lag(self):
+        """Seconds the replica trails the primary, or None when it cannot be read"""
+        now = time.monotonic()
+        with self._lock:
+            if self._checked_at is not None and now - self._checked_at < self.app.config['REPLICA_LAG_CHECK_SECONDS']:
+                return self._lag
+            try:
+                primary = self._read_beat(db.engines[None])
+                replica = self._read_beat(db.engines['replica'])
+                if primary is None:
+                    self._lag = 0.0
+                elif replica is None:
+                    self._lag = float('inf')
+                else:
+                    self._lag = max(0.0, (primary - replica).total_seconds())
+            except Exception:
+                self._lag = None
+            self._checked_at = now
+            return self._lag
+
+    def usable(self):
+        lag = self.lag()
+        return lag is not None and lag <= self.app.config['REPLICA_MAX_LAG_SECONDS']
+
+
+def _note_write(orm_execute_state):
+    if orm_execute_state.is_insert or orm_execute_state.is_update or orm_execute_state.is_delete:
+        orm_execute_state.session.info['primary_write'] = True
+
+
+def _note_flush(session, flush_context):
+    session.info['primary_write'] = True
+
+
+def _stamp_heartbeat(session):
+    # before_commit runs ahead of the final flush, so pending objects count as writes too
+    if session.info.pop('primary_write', False) or session.new or session.dirty or session.deleted:
+        session.execute(upsert(ReplicaHeartbeat.__table__, {'id': 1, 'beat_at': datetime.utcnow()}, ['id']))
+
+
+def _clear_write(session):
+    session.info.pop('primary_write', None)
+
+
+def copy_sqlite_database(source_url, target_url):
+    """Snapshot one SQLite database into another (stands in for replication locally)"""
+    source = sqlite3.connect(source_url.database)
+    target = sqlite3.connect(target_url.database)
+    try:
+        source.backup(target)
+    finally:
+        target.close()
+        source.close()
+
+
+def register_read_replicas(app):
+    app.config.setdefault('REPLICA_READ_PATHS', ('/api/costs', '/api/attendance', '/api/analytics'))
+    app.config.setdefault('REPLICA_MAX_LAG_SECONDS', 5)
+    app.config.setdefault('REPLICA_LAG_CHECK_SECONDS', 1)
+    # After a write the client reads from the primary for this long
+    app.config.setdefault('REPLICA_STICKY_SECONDS', 10)
+    app.config.setdefault('REPLICA_STICKY_COOKIE', 'read_primary_until')
+    # The same deadline as a response header for clients to echo back;
+    # cross-origin fetch() does not send the cookie
+    app.config.setdefault('REPLICA_STICKY_HEADER', 'X-Read-Primary-Until')
+    if 'replica' not in (app.config.get('SQLALCHEMY_BINDS') or {}):
+        return
+
+    monitor = ReplicaMonitor(app)
+    app.extensions['replica_monitor'] = monitor
+    event.listen(db.session, 'do_orm_execute', _note_write)
+    event.listen(db.session, 'after_flush', _note_flush)
+    event.listen(db.session, 'before_commit', _stamp_heartbeat)
+    event.listen(db.session, 'after_commit', _clear_write)
+    event.listen(db.session, 'after_rollback', _clear_write)
+
+    @app.cli.command('copy-replica')
+    def copy_replica_command():
+        """Copy the primary SQLite database over the replica (local testing)."""
+        primary, replica = db.engines[None], db.engines['replica']
+        if primary.dialect.name != 'sqlite' or replica.dialect.name != 'sqlite':
+            raise click.ClickException('copy-replica only works with two SQLite databases')
+        replica.dispose()
+        copy_sqlite_database(primary.url, replica.url)
+        click.echo(f'Copied {primary.url.database} to {replica.url.database}')
+
+    def _read_source():
+        if request.method not in ('GET', 'HEAD') or g.get('tenant') is not None:
+            return None
+        if not request.path.startswith(tuple(app.config['REPLICA_READ_PATHS'])):
+            return None
+        now = time.time()
+        sticky = False
+        for value in (request.cookies.get(app.config['REPLICA_STICKY_COOKIE']),
+                      request.headers.get(app.config['REPLICA_STICKY_HEADER'])):
+            try:
+                # Deadlines further out than a write could have set are ignored
+                sticky = sticky or now < float(value or 0) <= now + app.config['REPLICA_STICKY_SECONDS']
+            except ValueError:
+                pass
+        return 'primary' if sticky or not monitor.usable() else 'replica'
+
+    @app.before_request
+    def route_reads_to_replica():
+        g.read_source = source = _read_source()
+        if source == 'replica':
+            db.session.info['use_replica'] = True
+
+    @app.after_request
+    def mark_read_your_writes(response):
+        if g.get('read_source'):
+            response.headers['X-Read-Source'] = g.read_source
+        if request.method in ('POST', 'PUT', 'PATCH', 'DELETE') and response.status_code < 400:
+            sticky = app.config['REPLICA_STICKY_SECONDS']
+            until = str(time.time() + sticky)
+            response.set_cookie(app.config['REPLICA_STICKY_COOKIE'], until,
+                                max_age=sticky, httponly=True, samesite='Lax')
+            response.headers[app.config['REPLICA_STICKY_HEADER']] = until
+        return response
@@ -0,0 +1,168 @@
+from datetime import date, datetime, timedelta
+import click
+from flask import request, jsonify
+from sqlalchemy import case, event, func, select, update
+from extensions import db
+from models import Site, Worker, Attendance, Cost, WorkerRosterStat, money_to_json
+from forecasting import _previous_value
+from tenants import command_tenants, tenant_option, tenant_scope
+
+# Stale rows are recomputed in chunks to keep IN lists small
+_REFRESH_CHUNK_SIZE = 500
+
+# Roster responses are column-wise series (one list per field), like analytics
+_ROSTER_FIELDS = (
+    'id', 'name', 'position', 'daily_price', 'is_active', 'site_id', 'site_name',
+    'days_present_30', 'days_present_90', 'total_hours', 'last_attendance_date', 'lifetime_cost'
+)
+
+
+def mark_roster_stale(worker_ids):
+    """Flag roster stats for recomputation (for writes that bypass the ORM)"""
+    worker_ids = {worker_id for worker_id in worker_ids if worker_id is not None}
+    if worker_ids:
+        db.session.execute(
+            update(WorkerRosterStat.__table__)
+            .where(WorkerRosterStat.__table__.c.worker_id.in_(worker_ids))
+            .values(is_stale=True)
+        )
+
+
+def _mark_touched_workers(session, flush_context):
+    touched = set()
+    for obj in session.new:
+        if isinstance(obj, (Attendance, Cost)):
+            touched.add(obj.worker_id)
+    # session.deleted builds a new set on every access, so read it once
+    deleted = session.deleted
+    for obj in list(session.dirty) + list(deleted):
+        if isinstance(obj, (Attendance, Cost)) and (obj in deleted or session.is_modified(obj)):
+            touched.add(obj.worker_id)
+            touched.add(_previous_value(obj, 'worker_id'))
+    touched.discard(None)
+    if touched:
+        session.connection().execute(
+            update(WorkerRosterStat.__table__)
+            .where(WorkerRosterStat.__table__.c.worker_id.in_(touched))
+            .values(is_stale=True)
+        )
+
+
+def _compute_stats(worker_ids, today):
+    """Roster figures for a set of workers from one grouped query per source table"""
+    since_30 = today - timedelta(days=30)
+    since_90 = today - timedelta(days=90)
+    present = Attendance.is_present == True  # noqa: E712
+
+    stats = {
+        worker_id: {'days_present_30': 0, 'days_present_90': 0, 'total_hours': 0.0,
+                    'last_attendance_date': None, 'lifetime_cost': 0}
+        for worker_id in worker_ids
+    }
+    attendance = db.session.execute(
+        select(
+            Attendance.worker_id,
+            func.sum(case((present & (Attendance.date > since_30), 1), else_=0)),
+            func.sum(case((present & (Attendance.date > since_90), 1), else_=0)),
+            func.coalesce(func.sum(Attendance.hours_worked), 0.0),
+            func.max(case((present, Attendance.date)))
+        )
+        .where(Attendance.worker_id.in_(worker_ids))
+        .group_by(Attendance.worker_id)
+    )
+    for worker_id, days_30, days_90, hours, last_date in attendance:
+        stats[worker_id].update({
+            'days_present_30': int(days_30 or 0),
+            'days_present_90': int(days_90 or 0),
+            'total_hours': float(hours),
+            'last_attendance_date': date.fromisoformat(last_date) if isinstance(last_date, str) else last_date
+        })
+
+    costs = db.session.execute(
+        select(Cost.worker_id, func.sum(Cost.amount))
+        .where(Cost.worker_id.in_(worker_ids))
+        .group_by(Cost.worker_id)
+    )
+    for worker_id, amount in costs:
+        stats[worker_id]['lifetime_cost'] = amount
+    return stats
+
+
+def refresh_roster_stats(today=None):
+    """Recompute roster stats that are stale, missing or computed on an earlier day"""
+    today = today or date.today()
+    fresh = select(WorkerRosterStat.worker_id).where(
+        WorkerRosterStat.is_stale == False,  # noqa: E712
+        WorkerRosterStat.computed_on == today
+    )
+    fresh_count = db.session.execute(select(func.count()).select_from(fresh.subquery())).scalar()
+    if fresh_count == db.session.execute(select(func.count(Worker.id))).scalar():
+        # Nothing to do: the common case on every roster read
+        return 0
+    worker_ids = db.session.execute(select(Worker.id).where(Worker.id.not_in(fresh))).scalars().all()
+
+    table = WorkerRosterStat.__table__
+    for start in range(0, len(worker_ids), _REFRESH_CHUNK_SIZE):
+        chunk = worker_ids[start:start + _REFRESH_CHUNK_SIZE]
+        now = datetime.utcnow()
+        db.session.execute(table.delete().where(table.c.worker_id.in_(chunk)))
+        db.session.execute(table.insert(), [
+            dict(values, worker_id=worker_id, is_stale=False, computed_on=today, updated_at=now)
+            for worker_id, values in _compute_stats(chunk, today).items()
+        ])
+    db.session.commit()
+    return len(worker_ids)
+
+
+def register_roster(app):
+    event.listen(db.session, 'after_flush', _mark_touched_workers)
+
+    @app.cli.command('refresh-roster')
+    @tenant_option
+    def refresh_roster_command(tenant):
+        """Recompute stale worker roster stats (run daily to roll the 30/90 day windows)."""
+        for name in command_tenants(tenant):
+            with tenant_scope(name):
+                click.echo(f'Refreshed roster stats for {refresh_roster_stats()} workers')
+
+    # Worker Roster Routes
+    @app.route('/api/workers/roster', methods=['GET'])
+    def get_worker_roster():
+        """Get every worker with days present, hours, last attendance and lifetime cost as compact series"""
+        try:
+            refresh_roster_stats()
+            site_id = request.args.get('site_id')
+            is_active = request.args.get('is_active')
+
+            stmt = (
+                select(
+                    Worker.id, Worker.name, Worker.position, Worker.daily_price, Worker.is_active,
+                    Worker.site_id, Site.name,
+                    WorkerRosterStat.days_present_30, WorkerRosterStat.days_present_90,
+                    WorkerRosterStat.total_hours, WorkerRosterStat.last_attendance_date,
+                    WorkerRosterStat.lifetime_cost
+                )
+                .join(Site, Site.id == Worker.site_id)
+                .join(WorkerRosterStat, WorkerRosterStat.worker_id == Worker.id)
+                .where(Site.deleted_at.is_(None))
+                .order_by(Worker.name)
+            )
+            if site_id:
+                stmt = stmt.where(Worker.site_id == int(site_id))
+            if is_active is not None:
+                stmt = stmt.where(Worker.is_active == (is_active.lower() == 'true'))
+
+            rows = db.session.execute(stmt).all()
+            columns = list(zip(*rows)) or [()] * len(_ROSTER_FIELDS)
+            data = dict(zip(_ROSTER_FIELDS, map(list, columns)))
+            data['daily_price'] = [money_to_json(value) for value in data['daily_price']]
+            data['total_hours'] = [round(value, 2) for value in data['total_hours']]
+            data['last_attendance_date'] = [value.isoformat() if value else None for value in data['last_attendance_date']]
+            data['lifetime_cost'] = [money_to_json(value) for value in data['lifetime_cost']]
+            return jsonify({
+                'success': True,
+                'data': data
+            }), 200
+        except Exception as e:
+            db.session.rollback()
+            return jsonify({'success': False, 'error': str(e)}), 500
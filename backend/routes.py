@@ -1,7 +1,14 @@
 from flask import request, jsonify
-from extensions import db
-from models import Service, ServiceFeature, Project, BlogPost, TeamMember, Testimonial, ContactSubmission, CompanyStat, Certification, Award, Site, Worker, Attendance, DailyActivity, Cost
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import defer
+from extensions import db, upsert
+from roster import mark_roster_stale
+from site_events import publish_site_event
+from blog_renders import load_blog_post_render, render_blog_post
+from models import Service, Project, BlogPost, TeamMember, Testimonial, CompanyStat, Certification, Award, Site, Worker, Attendance, DailyActivity, ActivityWorker, Cost, money_to_json
 from datetime import datetime, date, time
+from decimal import Decimal
+import gzip
 import json
 
 
@@ -82,18 +89,11 @@ def register_routes(app):
                 icon_name=data.get('icon_name')
             )
 
-            db.session.add(service)
-            db.session.flush()  # Get the service ID
-
             # Add features
             if 'features' in data:
-                for feature_text in data['features']:
-                    feature = ServiceFeature(
-                        service_id=service.id,
-                        feature=feature_text
-                    )
-                    db.session.add(feature)
+                service.set_features(data['features'])
 
+            db.session.add(service)
             db.session.commit()
 
             return jsonify(
@@ -119,14 +119,9 @@ def register_routes(app):
             service.image = data.get('image', service.image)
             service.icon_name = data.get('icon_name', service.icon_name)
 
-            # Update features
+            # Update features, only inserting, deleting or reordering what changed
             if 'features' in data:
-                # Delete existing features
-                ServiceFeature.query.filter_by(service_id=service.id).delete()
-                # Add new features
-                for feature_text in data['features']:
-                    feature = ServiceFeature(service_id=service.id, feature=feature_text)
-                    db.session.add(feature)
+                service.set_features(data['features'])
 
             db.session.commit()
 
@@ -246,7 +241,8 @@ def register_routes(app):
             category = request.args.get('category')
             search = request.args.get('search')
 
-            query = BlogPost.query
+            # The list shows excerpts only; content stays in the database
+            query = BlogPost.query.options(defer(BlogPost.content, raiseload=True))
 
             if category and category != 'All':
                 query = query.filter_by(category=category)
@@ -263,20 +259,30 @@ def register_routes(app):
 
             return jsonify({
                 'success': True,
-                'data': [post.to_dict() for post in posts]
+                'data': [post.to_summary_dict() for post in posts]
             }), 200
         except Exception as e:
             return jsonify({'success': False, 'error': str(e)}), 500
 
     @app.route('/api/blog/posts/<int:post_id>', methods=['GET'])
     def get_blog_post(post_id):
-        """Get a specific blog post by ID"""
-        try:
-            post = BlogPost.query.get_or_404(post_id)
-            return jsonify({
-                'success': True,
-                'data': post.to_dict()
-            }), 200
+        """Get a specific blog post by ID, served from its stored gzipped render"""
+        try:
+            render = load_blog_post_render(post_id)
+            if render is None:
+                render = render_blog_post(BlogPost.query.get_or_404(post_id))
+            etag, body_gzip = render
+
+            if request.accept_encodings['gzip']:
+                response = app.response_class(body_gzip, mimetype='application/json')
+                response.headers['Content-Encoding'] = 'gzip'
+                # Same tag compression.py gives gzipped bodies
+                response.set_etag(f'{etag}-gzip')
+            else:
+                response = app.response_class(gzip.decompress(body_gzip), mimetype='application/json')
+                response.set_etag(etag)
+            response.vary.add('Accept-Encoding')
+            return response.make_conditional(request)
         except Exception as e:
             return jsonify({'success': False, 'error': str(e)}), 500
 
@@ -679,58 +685,6 @@ def register_routes(app):
             db.session.rollback()
             return jsonify({'success': False, 'error': str(e)}), 500
 
-    # Contact Routes
-    @app.route('/api/contact/submit', methods=['POST'])
-    def submit_contact_form():
-        """Submit a contact form"""
-        try:
-            data = request.get_json()
-
-            submission = ContactSubmission(
-                first_name=data['firstName'],
-                last_name=data['lastName'],
-                email=data['email'],
-                phone=data.get('phone'),
-                project_type=data.get('projectType'),
-                message=data['message'],
-                budget=data.get('budget')
-            )
-
-            db.session.add(submission)
-            db.session.commit()
-
-            return jsonify({
-                'success': True,
-                'message': 'Contact form submitted successfully'
-            }), 201
-        except Exception as e:
-            db.session.rollback()
-            return jsonify({'success': False, 'error': str(e)}), 500
-
-    @app.route('/api/contact/submissions', methods=['GET'])
-    def get_contact_submissions():
-        """Get all contact submissions (admin only)"""
-        try:
-            submissions = ContactSubmission.query.order_by(ContactSubmission.created_at.desc()).all()
-            return jsonify({
-                'success': True,
-                'data': [submission.to_dict() for submission in submissions]
-            }), 200
-        except Exception as e:
-            return jsonify({'success': False, 'error': str(e)}), 500
-
-    @app.route('/api/contact/submissions/<int:submission_id>', methods=['DELETE'])
-    def delete_contact_submission(submission_id):
-        """Delete a contact submission"""
-        try:
-            submission = ContactSubmission.query.get_or_404(submission_id)
-            db.session.delete(submission)
-            db.session.commit()
-            return jsonify({'success': True, 'message': 'Contact submission deleted successfully'}), 200
-        except Exception as e:
-            db.session.rollback()
-            return jsonify({'success': False, 'error': str(e)}), 500
-
     # Admin Routes for Data Management
     @app.route('/api/admin/upload-fake-data', methods=['POST'])
     def upload_fake_data():
@@ -754,7 +708,7 @@ def register_routes(app):
             start_date = request.args.get('start_date')
             end_date = request.args.get('end_date')
             
-            query = Site.query
+            query = Site.query.filter(Site.deleted_at.is_(None))
             
             if status and status != 'All':
                 query = query.filter_by(status=status)
@@ -780,7 +734,7 @@ def register_routes(app):
     def get_site(site_id):
         """Get a specific site by ID"""
         try:
-            site = Site.query.get_or_404(site_id)
+            site = Site.query.filter_by(id=site_id, deleted_at=None).first_or_404()
             return jsonify({
                 'success': True,
                 'data': site.to_dict()
@@ -845,11 +799,12 @@ def register_routes(app):
 
     @app.route('/api/sites/<int:site_id>', methods=['DELETE'])
     def delete_site(site_id):
-        """Delete a site"""
+        """Soft-delete a site and move its data to the archive in the background"""
         try:
-            site = Site.query.get_or_404(site_id)
-            db.session.delete(site)
+            site = Site.query.filter_by(id=site_id, deleted_at=None).first_or_404()
+            site.deleted_at = datetime.utcnow()
             db.session.commit()
+            app.extensions['archive_worker'].enqueue(site.id)
             return jsonify({
                 'success': True,
                 'message': 'Site deleted successfully'
@@ -858,6 +813,22 @@ def register_routes(app):
             db.session.rollback()
             return jsonify({'success': False, 'error': str(e)}), 500
 
+    @app.route('/api/sites/<int:site_id>/restore', methods=['POST'])
+    def restore_site(site_id):
+        """Undo a soft delete; archived data stays in the archive"""
+        try:
+            site = Site.query.filter(Site.id == site_id, Site.deleted_at.isnot(None)).first_or_404()
+            site.deleted_at = None
+            db.session.commit()
+            return jsonify({
+                'success': True,
+                'data': site.to_dict(),
+                'message': 'Site restored successfully'
+            }), 200
+        except Exception as e:
+            db.session.rollback()
+            return jsonify({'success': False, 'error': str(e)}), 500
+
     # Worker Routes
     @app.route('/api/workers', methods=['GET'])
     def get_workers():
@@ -866,13 +837,13 @@ def register_routes(app):
             site_id = request.args.get('site_id')
             is_active = request.args.get('is_active')
             
-            query = Worker.query
+            query = Worker.query.join(Site, Site.id == Worker.site_id).filter(Site.deleted_at.is_(None))
             
             if site_id:
-                query = query.filter_by(site_id=site_id)
+                query = query.filter(Worker.site_id == site_id)
             
             if is_active is not None:
-                query = query.filter_by(is_active=is_active.lower() == 'true')
+                query = query.filter(Worker.is_active == (is_active.lower() == 'true'))
             
             workers = query.order_by(Worker.created_at.desc()).all()
             
@@ -964,6 +935,26 @@ def register_routes(app):
             db.session.rollback()
             return jsonify({'success': False, 'error': str(e)}), 500
 
+    @app.route('/api/workers/<int:worker_id>/activities', methods=['GET'])
+    def get_worker_activities(worker_id):
+        """Get the daily activities a worker took part in"""
+        try:
+            Worker.query.get_or_404(worker_id)
+            activities = (
+                DailyActivity.query
+                .join(ActivityWorker, ActivityWorker.activity_id == DailyActivity.id)
+                .filter(ActivityWorker.worker_id == worker_id)
+                .options(db.joinedload(DailyActivity.site))
+                .order_by(DailyActivity.date.desc())
+                .all()
+            )
+            return jsonify({
+                'success': True,
+                'data': [activity.to_dict() for activity in activities]
+            }), 200
+        except Exception as e:
+            return jsonify({'success': False, 'error': str(e)}), 500
+
     # Attendance Routes
     @app.route('/api/attendance', methods=['GET'])
     def get_attendance():
@@ -1040,6 +1031,47 @@ def register_routes(app):
                 'data': attendance.to_dict(),
                 'message': 'Attendance record created successfully'
             }), 201
+        except IntegrityError:
+            db.session.rollback()
+            return jsonify({
+                'success': False,
+                'error': 'Attendance for this worker and date already exists; use PUT /api/attendance/by-key'
+            }), 409
+        except Exception as e:
+            db.session.rollback()
+            return jsonify({'success': False, 'error': str(e)}), 500
+
+    @app.route('/api/attendance/by-key', methods=['PUT'])
+    def upsert_attendance():
+        """Create or update the attendance record for a (worker_id, date) pair"""
+        try:
+            data = request.get_json()
+            
+            values = {
+                'worker_id': data['worker_id'],
+                'date': datetime.strptime(data['date'], '%Y-%m-%d').date(),
+                'updated_at': datetime.utcnow()
+            }
+            for field in ('check_in_time', 'check_out_time'):
+                if field in data:
+                    values[field] = datetime.strptime(data[field], '%H:%M').time() if data[field] else None
+            for field in ('hours_worked', 'is_present', 'notes'):
+                if field in data:
+                    values[field] = data[field]
+            
+            # Only the fields present in the request overwrite an existing record
+            db.session.execute(upsert(Attendance.__table__, values, ['worker_id', 'date']))
+            mark_roster_stale([values['worker_id']])
+            db.session.commit()
+            
+            attendance = Attendance.query.filter_by(worker_id=values['worker_id'], date=values['date']).one()
+            # The upsert bypasses the ORM, so the site event is published here
+            publish_site_event(attendance.worker.site_id, 'attendance.updated', attendance.to_dict())
+            return jsonify({
+                'success': True,
+                'data': attendance.to_dict(),
+                'message': 'Attendance record saved successfully'
+            }), 200
         except Exception as e:
             db.session.rollback()
             return jsonify({'success': False, 'error': str(e)}), 500
@@ -1149,10 +1181,9 @@ def register_routes(app):
                 activity_name=data['activity_name'],
                 description=data.get('description'),
                 quantity=data.get('quantity', 1.0),
-                unit_price=data['unit_price'],
-                total_price=data['total_price'],
-                workers_involved=json.dumps(data.get('workers_involved', []))
+                unit_price=data['unit_price']
             )
+            activity.set_worker_ids(data.get('workers_involved', []))
             
             db.session.add(activity)
             db.session.commit()
@@ -1178,8 +1209,7 @@ def register_routes(app):
             activity.description = data.get('description', activity.description)
             activity.quantity = data.get('quantity', activity.quantity)
             activity.unit_price = data.get('unit_price', activity.unit_price)
-            activity.total_price = data.get('total_price', activity.total_price)
-            activity.workers_involved = json.dumps(data.get('workers_involved', []))
+            activity.set_worker_ids(data.get('workers_involved', []))
             
             if data.get('date'):
                 activity.date = datetime.strptime(data['date'], '%Y-%m-%d').date()
@@ -1258,6 +1288,59 @@ def register_routes(app):
         except Exception as e:
             return jsonify({'success': False, 'error': str(e)}), 500
 
+    @app.route('/api/costs/summary', methods=['GET'])
+    def get_costs_summary():
+        """Get exact cost totals, overall and grouped by cost type or category"""
+        try:
+            site_id = request.args.get('site_id')
+            worker_id = request.args.get('worker_id')
+            start_date = request.args.get('start_date')
+            end_date = request.args.get('end_date')
+            group_by = request.args.get('group_by', 'cost_type')
+
+            if group_by not in ('cost_type', 'category', 'site_id', 'date'):
+                return jsonify({'success': False, 'error': f'Cannot group costs by {group_by}'}), 400
+            group_column = getattr(Cost, group_by)
+
+            # SUM runs over integer cents, so totals are exact
+            query = db.session.query(group_column, db.func.count(Cost.id), db.func.sum(Cost.amount))
+
+            if site_id:
+                query = query.filter(Cost.site_id == site_id)
+
+            if worker_id:
+                query = query.filter(Cost.worker_id == worker_id)
+
+            if start_date:
+                start_date_obj = datetime.strptime(start_date, '%Y-%m-%d').date()
+                query = query.filter(Cost.date >= start_date_obj)
+
+            if end_date:
+                end_date_obj = datetime.strptime(end_date, '%Y-%m-%d').date()
+                query = query.filter(Cost.date <= end_date_obj)
+
+            groups = query.group_by(group_column).order_by(group_column).all()
+            total = sum((amount or Decimal(0) for _, _, amount in groups), Decimal(0))
+
+            return jsonify({
+                'success': True,
+                'data': {
+                    'total': money_to_json(total),
+                    'count': sum(count for _, count, _ in groups),
+                    'group_by': group_by,
+                    'groups': [
+                        {
+                            'key': key.isoformat() if isinstance(key, date) else key,
+                            'count': count,
+                            'total': money_to_json(amount)
+                        }
+                        for key, count, amount in groups
+                    ]
+                }
+            }), 200
+        except Exception as e:
+            return jsonify({'success': False, 'error': str(e)}), 500
+
     @app.route('/api/costs/<int:cost_id>', methods=['GET'])
     def get_cost(cost_id):
         """Get a specific cost by ID"""
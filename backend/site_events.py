@@ -0,0 +1,220 @@
+import json
+import queue
+import threading
+import time
+from collections import deque
+from flask import Response, g, request, jsonify, current_app
+from sqlalchemy import event, select
+from extensions import db
+from models import Site, Worker, Attendance, DailyActivity, Cost
+
+# Model -> event name prefix; attendance has no site_id column and goes through its worker
+_PUBLISHED = {Attendance: 'attendance', DailyActivity: 'activity', Cost: 'cost'}
+
+STREAM_HEADERS = {'Cache-Control': 'no-cache', 'X-Accel-Buffering': 'no'}
+STREAM_PREAMBLE = 'retry: 3000\n\n'
+
+
+class Subscriber:
+    """One SSE client: a bounded queue, closed instead of blocking the publisher when it fills up"""
+
+    def __init__(self, channel, max_size):
+        self.channel = channel
+        self.queue = queue.Queue(maxsize=max_size)
+        self.overflowed = False
+        # Set by async consumers, which wait on an event loop instead of queue.get()
+        self.wakeup = None
+
+    def offer(self, item):
+        try:
+            self.queue.put_nowait(item)
+        except queue.Full:
+            # The client reconnects with Last-Event-ID and catches up from history
+            self.overflowed = True
+        if self.wakeup is not None:
+            self.wakeup()
+
+
+class EventBus:
+    """In-process pub/sub of site activity with a replay buffer for resuming clients"""
+
+    def __init__(self, history_size, queue_size, max_subscribers):
+        # Event ids restart with the process; the epoch lets clients notice
+        self.epoch = format(int(time.time()), 'x')
+        self.queue_size = queue_size
+        self.max_subscribers = max_subscribers
+        self.history = deque(maxlen=history_size)
+        self.subscribers = {}
+        self._seq = 0
+        self._lock = threading.Lock()
+
+    def publish(self, channel, event_type, data):
+        with self._lock:
+            self._seq += 1
+            item = (self._seq, channel, event_type, data)
+            self.history.append(item)
+            for subscriber in self.subscribers.get(channel, ()):
+                subscriber.offer(item)
+
+    def _parse_last_event_id(self, last_event_id):
+        epoch, _, seq = (last_event_id or '').partition('-')
+        if epoch != self.epoch or not seq.isdigit():
+            return None
+        return int(seq)
+
+    def subscribe(self, channel, last_event_id=None):
+        """Register a subscriber, queueing the events it missed after `last_event_id`.
+
+        Returns (subscriber, reset_id); reset_id is set when the missed events
+        are no longer available and the client has to reload instead.
+        """
+        with self._lock:
+            if sum(len(subscribers) for subscribers in self.subscribers.values()) >= self.max_subscribers:
+                return None, None
+            subscriber = Subscriber(channel, self.queue_size)
+            reset_id = None
+            if last_event_id:
+                last_seq = self._parse_last_event_id(last_event_id)
+                oldest = self.history[0][0] if self.history else self._seq + 1
+                missed = [] if last_seq is None else [
+                    item for item in self.history if item[0] > last_seq and item[1] == channel
+                ]
+                if (last_seq is None or last_seq > self._seq or last_seq < oldest - 1
+                        or len(missed) > self.queue_size):
+                    reset_id = f'{self.epoch}-{self._seq}'
+                else:
+                    for item in missed:
+                        subscriber.offer(item)
+            self.subscribers.setdefault(channel, set()).add(subscriber)
+            return subscriber, reset_id
+
+    def unsubscribe(self, subscriber):
+        with self._lock:
+            subscribers = self.subscribers.get(subscriber.channel)
+            if subscribers is not None:
+                subscribers.discard(subscriber)
+                if not subscribers:
+                    del self.subscribers[subscriber.channel]
+
+    def format(self, item):
+        seq, _, event_type, data = item
+        return f'id: {self.epoch}-{seq}\nevent: {event_type}\ndata: {json.dumps(data)}\n\n'
+
+    def format_reset(self, reset_id):
+        # Missed events are gone; the client should reload the site's data
+        return f'id: {reset_id}\nevent: reset\ndata: {{}}\n\n'
+
+
+def site_channel(site_id):
+    """Bus channel of a site; site ids repeat across tenant databases"""
+    return g.get('tenant'), site_id
+
+
+def publish_site_event(site_id, event_type, data):
+    """Publish straight to the bus (for writes that bypass the ORM; call after commit)"""
+    bus = current_app.extensions.get('site_events')
+    if bus is not None:
+        bus.publish(site_channel(site_id), event_type, data)
+
+
+def _collect_events(session, flush_context):
+    """Note which attendance, activity and cost rows a flush changed"""
+    changed = []
+    for obj in session.new:
+        if type(obj) in _PUBLISHED:
+            changed.append((obj, 'created'))
+    for obj in session.dirty:
+        if type(obj) in _PUBLISHED and session.is_modified(obj):
+            changed.append((obj, 'updated'))
+    for obj in session.deleted:
+        if type(obj) in _PUBLISHED:
+            changed.append((obj, 'deleted'))
+    if not changed:
+        return
+
+    worker_ids = {obj.worker_id for obj, _ in changed if isinstance(obj, Attendance)}
+    worker_sites = dict(session.connection().execute(
+        select(Worker.id, Worker.site_id).where(Worker.id.in_(worker_ids))
+    ).all()) if worker_ids else {}
+
+    flushed = session.info.setdefault('site_events_flushed', [])
+    for obj, action in changed:
+        site_id = worker_sites.get(obj.worker_id) if isinstance(obj, Attendance) else obj.site_id
+        if site_id is not None:
+            flushed.append((site_id, f'{_PUBLISHED[type(obj)]}.{action}', obj, action == 'deleted'))
+
+
+def _serialize_events(session, flush_context):
+    """Serialize once the flush is done (new rows can load their relationships
+    by then); events are published only when the transaction commits"""
+    flushed = session.info.pop('site_events_flushed', None)
+    if flushed:
+        session.info.setdefault('site_events', []).extend(
+            (site_id, event_type, {'id': obj.id} if deleted else obj.to_dict())
+            for site_id, event_type, obj, deleted in flushed
+        )
+
+
+def _publish_committed(session):
+    events = session.info.pop('site_events', None)
+    if events:
+        for site_id, event_type, data in events:
+            publish_site_event(site_id, event_type, data)
+
+
+def _discard_events(session):
+    session.info.pop('site_events_flushed', None)
+    session.info.pop('site_events', None)
+
+
+def register_site_events(app):
+    app.config.setdefault('SITE_EVENTS_HISTORY_SIZE', 1000)
+    app.config.setdefault('SITE_EVENTS_QUEUE_SIZE', 100)
+    app.config.setdefault('SITE_EVENTS_MAX_SUBSCRIBERS', 200)
+    app.config.setdefault('SITE_EVENTS_HEARTBEAT_SECONDS', 15)
+    bus = EventBus(app.config['SITE_EVENTS_HISTORY_SIZE'], app.config['SITE_EVENTS_QUEUE_SIZE'],
+                   app.config['SITE_EVENTS_MAX_SUBSCRIBERS'])
+    app.extensions['site_events'] = bus
+    event.listen(db.session, 'after_flush', _collect_events)
+    event.listen(db.session, 'after_flush_postexec', _serialize_events)
+    event.listen(db.session, 'after_commit', _publish_committed)
+    event.listen(db.session, 'after_rollback', _discard_events)
+
+    # Site Event Routes
+    @app.route('/api/sites/<int:site_id>/events', methods=['GET'])
+    def stream_site_events(site_id):
+        """Stream attendance, activity and cost changes of a site as Server-Sent Events"""
+        try:
+            if db.session.get(Site, site_id) is None:
+                return jsonify({'success': False, 'error': 'Site not found'}), 404
+            # EventSource sends Last-Event-ID on reconnect; the query parameter is for polyfills
+            last_event_id = request.headers.get('Last-Event-ID') or request.args.get('last_event_id')
+            subscriber, reset_id = bus.subscribe(site_channel(site_id), last_event_id)
+            if subscriber is None:
+                response = jsonify({'success': False, 'error': 'Too many event subscribers'})
+                response.headers['Retry-After'] = '30'
+                return response, 503
+        except Exception as e:
+            return jsonify({'success': False, 'error': str(e)}), 500
+        finally:
+            # The stream can stay open for hours; do not hold a connection for it
+            db.session.remove()
+
+        heartbeat = app.config['SITE_EVENTS_HEARTBEAT_SECONDS']
+
+        def stream():
+            try:
+                yield STREAM_PREAMBLE
+                if reset_id:
+                    yield bus.format_reset(reset_id)
+                while not subscriber.overflowed:
+                    try:
+                        item = subscriber.queue.get(timeout=heartbeat)
+                    except queue.Empty:
+                        yield ': keep-alive\n\n'
+                        continue
+                    yield bus.format(item)
+            finally:
+                bus.unsubscribe(subscriber)
+
+        return Response(stream(), mimetype='text/event-stream', headers=STREAM_HEADERS)
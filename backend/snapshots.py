@@ -0,0 +1,148 @@
+import hashlib
+import json
+import os
+import uuid
+from urllib.parse import quote
+import click
+from sqlalchemy import inspect, select
+from extensions import db
+from models import Service, Project, BlogPost, TeamMember, Testimonial, CompanyStat, Certification, Award
+from tenants import tenant_scope
+
+# Static export of the public marketing API. Each URL is written to
+# <output><path>.json; category lists (?category=X) to
+# <output><path>/category/<X>.json. manifest.json maps every URL to its
+# file, for CDN uploads or an nginx config like:
+#
+#   location /api/ {
+#       if ($arg_category) { rewrite ^(.*)$ $1/category/$arg_category; }
+#       try_files $uri.json @backend;
+#   }
+
+# Collection routes and the models whose rows they show
+_COLLECTIONS = [
+    ('/api/home/stats', (CompanyStat,)),
+    ('/api/home/testimonials', (Testimonial,)),
+    ('/api/home/services', (Service,)),
+    ('/api/services', (Service,)),
+    ('/api/projects', (Project,)),
+    ('/api/blog/posts', (BlogPost,)),
+    ('/api/blog/categories', (BlogPost,)),
+    ('/api/about/team', (TeamMember,)),
+    ('/api/about/certifications', (Certification,)),
+    ('/api/about/awards', (Award,)),
+    ('/api/public/bundle', (CompanyStat, Testimonial, Service, TeamMember, Certification, Award)),
+]
+
+# Routes with a /<id> detail view, re-rendered per row when its updated_at moves
+_DETAILS = [('/api/services', Service), ('/api/projects', Project), ('/api/blog/posts', BlogPost)]
+
+# Routes filtered with ?category=
+_CATEGORY_LISTS = [('/api/projects', Project), ('/api/blog/posts', BlogPost)]
+
+_MANIFEST = 'manifest.json'
+
+
+def _signature(model):
+    """Hash of a table's (id, updated_at) pairs; whole rows for tables without updated_at"""
+    columns = [model.id, model.updated_at] if hasattr(model, 'updated_at') else list(inspect(model).columns)
+    digest = hashlib.sha1()
+    for row in db.session.execute(select(*columns).order_by(model.id)):
+        digest.update(repr(tuple(row)).encode('utf-8'))
+    return digest.hexdigest()
+
+
+def _write_atomically(path, data):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp_path = f'{path}.{uuid.uuid4().hex}.tmp'
+    try:
+        with open(tmp_path, 'wb') as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+    finally:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+
+def export_snapshot(app, output, tenant=None, full=False):
+    """Render the public GET routes to JSON files under `output`.
+
+    Collections are re-rendered when a model they show changed, details
+    when their row's updated_at changed; files of rows or categories that
+    are gone are removed. Returns (rendered, removed).
+    """
+    manifest_path = os.path.join(output, _MANIFEST)
+    previous = {'signatures': {}, 'files': {}, 'updated_at': {}}
+    if not full and os.path.exists(manifest_path):
+        with open(manifest_path) as f:
+            previous = json.load(f)
+
+    with tenant_scope(tenant):
+        models = {model for _, models in _COLLECTIONS for model in models}
+        signatures = {model.__name__: _signature(model) for model in models | {Project, BlogPost}}
+        details = {
+            prefix: db.session.execute(select(model.id, model.updated_at).order_by(model.id)).all()
+            for prefix, model in _DETAILS
+        }
+        categories = {
+            prefix: db.session.execute(select(model.category).distinct().order_by(model.category)).scalars().all()
+            for prefix, model in _CATEGORY_LISTS
+        }
+        db.session.remove()
+    changed = {name for name, signature in signatures.items() if previous['signatures'].get(name) != signature}
+
+    files, updated_at, pending = {}, {}, []
+    for url, shown in _COLLECTIONS:
+        files[url] = url.lstrip('/') + '.json'
+        if any(model.__name__ in changed for model in shown):
+            pending.append(url)
+    for prefix, rows in details.items():
+        for row_id, stamp in rows:
+            url = f'{prefix}/{row_id}'
+            files[url] = url.lstrip('/') + '.json'
+            updated_at[url] = stamp.isoformat() if stamp else None
+            if url not in previous['updated_at'] or previous['updated_at'][url] != updated_at[url]:
+                pending.append(url)
+    for prefix, model in _CATEGORY_LISTS:
+        for category in categories[prefix]:
+            url = f"{prefix}?category={quote(category, safe='')}"
+            files[url] = f"{prefix.lstrip('/')}/category/{quote(category, safe='')}.json"
+            if model.__name__ in changed:
+                pending.append(url)
+    # Files deleted by hand are rendered again
+    queued = set(pending)
+    pending.extend(url for url, path in files.items()
+                   if url not in queued and not os.path.exists(os.path.join(output, path)))
+
+    client = app.test_client()
+    headers = {app.config['TENANT_HEADER']: tenant} if tenant else {}
+    for url in pending:
+        response = client.get(url, headers=headers)
+        if response.status_code != 200:
+            raise click.ClickException(f'GET {url} returned {response.status_code}')
+        _write_atomically(os.path.join(output, files[url]), response.get_data())
+
+    removed = 0
+    for url, path in previous['files'].items():
+        if url not in files and os.path.exists(os.path.join(output, path)):
+            os.remove(os.path.join(output, path))
+            removed += 1
+
+    _write_atomically(manifest_path, json.dumps(
+        {'signatures': signatures, 'files': files, 'updated_at': updated_at}, indent=2, sort_keys=True
+    ).encode('utf-8'))
+    return len(pending), removed
+
+
+def register_snapshots(app):
+    app.config.setdefault('SNAPSHOT_FOLDER', os.path.join(app.instance_path, 'snapshot'))
+
+    @app.cli.command('export-static')
+    @click.option('--output', default=None, help='Directory to write to (default SNAPSHOT_FOLDER).')
+    @click.option('--tenant', default=None, help='Tenant to export (multi-tenant deployments).')
+    @click.option('--full', is_flag=True, help='Re-render everything instead of only what changed.')
+    def export_static_command(output, tenant, full):
+        """Render the public API to static JSON files, incrementally."""
+        output = output or app.config['SNAPSHOT_FOLDER']
+        rendered, removed = export_snapshot(app, output, tenant, full)
+        click.echo(f'Rendered {rendered} files, removed {removed} into {output}')
@@ -0,0 +1,345 @@
+from collections import defaultdict
+from datetime import datetime, timedelta
+import click
+from flask import request, jsonify, current_app
+from sqlalchemy import event, select, update
+from extensions import db
+from batch import BatchOperationError
+from models import Site, Worker, Attendance, DailyActivity, ActivityWorker, Cost, SyncTombstone
+from tenants import command_tenants, tenant_option, tenant_scope
+
+
+def _parse_date(value):
+    return datetime.strptime(value, '%Y-%m-%d').date() if value else None
+
+
+def _parse_time(value):
+    return datetime.strptime(value, '%H:%M').time() if value else None
+
+
+# Entity name -> (model, {JSON key: parser}); keys match the site-management routes
+_ENTITIES = {
+    'site': (Site, {
+        'name': None, 'location': None, 'description': None,
+        'start_date': _parse_date, 'end_date': _parse_date, 'status': None
+    }),
+    'worker': (Worker, {
+        'name': None, 'phone': None, 'email': None, 'position': None,
+        'daily_price': None, 'site_id': None, 'is_active': None
+    }),
+    'attendance': (Attendance, {
+        'worker_id': None, 'date': _parse_date, 'check_in_time': _parse_time,
+        'check_out_time': _parse_time, 'hours_worked': None, 'is_present': None, 'notes': None
+    }),
+    'daily_activity': (DailyActivity, {
+        'site_id': None, 'date': _parse_date, 'activity_name': None, 'description': None,
+        'quantity': None, 'unit_price': None
+    }),
+    'cost': (Cost, {
+        'site_id': None, 'worker_id': None, 'daily_activity_id': None, 'cost_type': None,
+        'description': None, 'amount': None, 'date': _parse_date, 'category': None
+    }),
+}
+_ENTITY_NAMES = {model: name for name, (model, _) in _ENTITIES.items()}
+
+
+def _load_options(entity):
+    """Relationships read by to_dict(), loaded with the rows instead of one query each"""
+    return {
+        'worker': [db.joinedload(Worker.site)],
+        'attendance': [db.joinedload(Attendance.worker).joinedload(Worker.site)],
+        'daily_activity': [db.joinedload(DailyActivity.site)],
+        'cost': [db.joinedload(Cost.site), db.joinedload(Cost.worker), db.joinedload(Cost.daily_activity)],
+    }.get(entity, [])
+
+
+def _insert_tombstones(connection, deleted, deleted_at):
+    rows = [
+        {'entity': entity, 'entity_id': entity_id, 'deleted_at': deleted_at}
+        for entity, ids in deleted.items() for entity_id in sorted(ids)
+    ]
+    if rows:
+        connection.execute(SyncTombstone.__table__.insert(), rows)
+
+
+def record_tombstones(entity, ids):
+    """Report rows removed outside the ORM (bulk deletes) to sync clients"""
+    _insert_tombstones(db.session.connection(), {entity: set(ids)}, datetime.utcnow())
+
+
+def _record_deletes(session, flush_context, instances):
+    """Write tombstones for deleted rows, including the ones ON DELETE CASCADE
+    will remove inside the database without the session seeing them"""
+    deleted = defaultdict(set)
+    for obj in session.deleted:
+        entity = _ENTITY_NAMES.get(type(obj))
+        if entity is not None:
+            deleted[entity].add(obj.id)
+    if not deleted:
+        return
+
+    connection = session.connection()
+    now = datetime.utcnow()
+    if deleted['site']:
+        site_ids = deleted['site']
+        deleted['worker'].update(connection.execute(select(Worker.id).where(Worker.site_id.in_(site_ids))).scalars())
+        deleted['daily_activity'].update(
+            connection.execute(select(DailyActivity.id).where(DailyActivity.site_id.in_(site_ids))).scalars()
+        )
+        deleted['cost'].update(connection.execute(select(Cost.id).where(Cost.site_id.in_(site_ids))).scalars())
+    if deleted['worker']:
+        worker_ids = deleted['worker']
+        deleted['attendance'].update(
+            connection.execute(select(Attendance.id).where(Attendance.worker_id.in_(worker_ids))).scalars()
+        )
+        deleted['cost'].update(connection.execute(select(Cost.id).where(Cost.worker_id.in_(worker_ids))).scalars())
+        # Dropping their activity links changes workers_involved on those activities
+        connection.execute(
+            update(DailyActivity.__table__)
+            .where(DailyActivity.__table__.c.id.in_(
+                select(ActivityWorker.activity_id).where(ActivityWorker.worker_id.in_(worker_ids))
+            ))
+            .values(updated_at=now)
+        )
+    if deleted['daily_activity']:
+        # ON DELETE SET NULL detaches their costs
+        connection.execute(
+            update(Cost.__table__)
+            .where(Cost.__table__.c.daily_activity_id.in_(deleted['daily_activity']))
+            .values(updated_at=now)
+        )
+    _insert_tombstones(connection, deleted, now)
+
+
+def prune_tombstones(retention_days):
+    """Delete tombstones older than the retention window; returns rows removed"""
+    cutoff = datetime.utcnow() - timedelta(days=retention_days)
+    removed = db.session.execute(
+        SyncTombstone.__table__.delete().where(SyncTombstone.__table__.c.deleted_at < cutoff)
+    ).rowcount
+    db.session.commit()
+    return removed
+
+
+def _pull(since):
+    """Rows changed and ids deleted at or after `since` (everything when None)"""
+    changes, deleted = {}, {entity: [] for entity in _ENTITIES}
+    for entity, (model, _) in _ENTITIES.items():
+        query = model.query.options(*_load_options(entity))
+        if model is Worker:
+            # Workers of a soft-deleted site are hidden with it, as in get_workers
+            query = query.join(Site, Site.id == Worker.site_id).filter(Site.deleted_at.is_(None))
+        if since is not None:
+            query = query.filter(model.updated_at >= since)
+        rows = query.order_by(model.updated_at, model.id).all()
+        if model is Site:
+            # A soft-deleted site is a deletion as far as clients are concerned
+            if since is not None:
+                deleted['site'].extend(site.id for site in rows if site.deleted_at is not None)
+                if deleted['site']:
+                    deleted['worker'].extend(db.session.execute(
+                        select(Worker.id).where(Worker.site_id.in_(deleted['site'])).order_by(Worker.id)
+                    ).scalars())
+            rows = [site for site in rows if site.deleted_at is None]
+        changes[entity] = [row.to_dict() for row in rows]
+
+    if since is not None:
+        for entity, entity_id in db.session.execute(
+            select(SyncTombstone.entity, SyncTombstone.entity_id)
+            .where(SyncTombstone.deleted_at >= since)
+            .order_by(SyncTombstone.id)
+        ):
+            deleted[entity].append(entity_id)
+    return changes, deleted
+
+
+class SyncConflict(BatchOperationError):
+    """The row was changed or deleted on the server after the client last pulled it"""
+
+    def __init__(self, message, current=None):
+        super().__init__(message, 409)
+        self.current = current
+
+
+def _get(model, change):
+    if 'id' not in change:
+        raise BatchOperationError("Missing 'id'")
+    instance = db.session.get(model, change['id'])
+    if instance is None or (model is Site and instance.deleted_at is not None):
+        return None
+    return instance
+
+
+def _check_version(entity, instance, change):
+    base = change.get('base_updated_at')
+    if not base:
+        raise BatchOperationError("Missing 'base_updated_at'")
+    if instance.updated_at is not None and instance.updated_at > datetime.fromisoformat(base):
+        raise SyncConflict(f'{entity} {instance.id} was changed on the server', instance.to_dict())
+
+
+def _check_attendance_key(worker_id, date, instance_id=None):
+    """One attendance row per worker and day; a clash is a conflict, not a constraint error"""
+    existing = Attendance.query.filter_by(worker_id=worker_id, date=date).first()
+    if existing is not None and existing.id != instance_id:
+        raise SyncConflict(f'attendance for worker {existing.worker_id} on {existing.date} already exists',
+                           existing.to_dict())
+
+
+def _apply_change(change):
+    """Apply one offline edit to the session and return its result entry"""
+    entity = change.get('entity')
+    if entity not in _ENTITIES:
+        raise BatchOperationError(f'Unknown entity {entity}')
+    model, fields = _ENTITIES[entity]
+    action = change.get('op')
+    data = change.get('data') or {}
+    values = {key: parse(data[key]) if parse else data[key] for key, parse in fields.items() if key in data}
+    result = {'op': action, 'entity': entity, 'client_id': change.get('client_id')}
+
+    if action == 'create':
+        missing = [key for key in fields if key not in data and not model.__table__.c[key].nullable]
+        if missing:
+            raise BatchOperationError(f"Missing field(s): {', '.join(missing)}")
+        if entity == 'attendance':
+            _check_attendance_key(values['worker_id'], values['date'])
+        instance = model(**values)
+        db.session.add(instance)
+        status = 201
+    elif action == 'update':
+        instance = _get(model, change)
+        if instance is None:
+            raise SyncConflict(f"{entity} {change['id']} was deleted on the server")
+        _check_version(entity, instance, change)
+        if entity == 'attendance' and ('worker_id' in values or 'date' in values):
+            _check_attendance_key(values.get('worker_id', instance.worker_id), values.get('date', instance.date),
+                                  instance.id)
+        for key, value in values.items():
+            setattr(instance, key, value)
+        status = 200
+    elif action == 'delete':
+        instance = _get(model, change)
+        if instance is None:
+            return dict(result, id=change['id'], status=200)
+        _check_version(entity, instance, change)
+        if model is Site:
+            instance.deleted_at = datetime.utcnow()
+            result['archive_site'] = instance.id
+        else:
+            db.session.delete(instance)
+        db.session.flush()
+        return dict(result, id=instance.id, status=200)
+    else:
+        raise BatchOperationError(f'Unknown op {action}')
+
+    if entity == 'daily_activity' and 'workers_involved' in data:
+        instance.set_worker_ids(data['workers_involved'])
+    # Flush per change so constraint errors point at the change that caused them
+    db.session.flush()
+    return dict(result, id=instance.id, status=status, instance=instance)
+
+
+def register_sync(app):
+    app.config.setdefault('SYNC_MAX_CHANGES', 500)
+    # Rows committed while a pull was running can carry a slightly older updated_at
+    app.config.setdefault('SYNC_OVERLAP_SECONDS', 5)
+    app.config.setdefault('SYNC_TOMBSTONE_RETENTION_DAYS', 30)
+    event.listen(db.session, 'before_flush', _record_deletes)
+
+    @app.cli.command('prune-sync-tombstones')
+    @tenant_option
+    def prune_sync_tombstones_command(tenant):
+        """Delete sync tombstones older than SYNC_TOMBSTONE_RETENTION_DAYS."""
+        for name in command_tenants(tenant):
+            with tenant_scope(name):
+                removed = prune_tombstones(app.config['SYNC_TOMBSTONE_RETENTION_DAYS'])
+            click.echo(f'Removed {removed} sync tombstones')
+
+    # Sync Routes
+    @app.route('/api/sync', methods=['GET'])
+    def pull_changes():
+        """Get sites, workers, attendance, activities and costs changed since a sync token"""
+        try:
+            token = datetime.utcnow()
+            since = request.args.get('since')
+            if since:
+                try:
+                    since = datetime.fromisoformat(since) - timedelta(seconds=app.config['SYNC_OVERLAP_SECONDS'])
+                except ValueError:
+                    return jsonify({'success': False, 'error': 'Invalid sync token'}), 400
+                # Tombstones older than the retention window are gone, so start over
+                if since < token - timedelta(days=app.config['SYNC_TOMBSTONE_RETENTION_DAYS']):
+                    since = None
+            else:
+                since = None
+
+            changes, deleted = _pull(since)
+            return jsonify({
+                'success': True,
+                'data': {
+                    'token': token.isoformat(),
+                    # Clients replace their local copy on reset, else apply `deleted` then `changes`
+                    'reset': since is None,
+                    'changes': changes,
+                    'deleted': deleted
+                }
+            }), 200
+        except Exception as e:
+            return jsonify({'success': False, 'error': str(e)}), 500
+
+    @app.route('/api/sync', methods=['POST'])
+    def push_changes():
+        """Apply queued offline edits in one transaction, rejecting them all on a conflict"""
+        changes = (request.get_json(silent=True) or {}).get('changes')
+        if not isinstance(changes, list) or not changes:
+            return jsonify({'success': False, 'error': "'changes' must be a non-empty list"}), 400
+        if len(changes) > current_app.config['SYNC_MAX_CHANGES']:
+            return jsonify({
+                'success': False,
+                'error': f"At most {current_app.config['SYNC_MAX_CHANGES']} changes per push"
+            }), 400
+
+        results = []
+        try:
+            for index, change in enumerate(changes):
+                try:
+                    results.append(_apply_change(change if isinstance(change, dict) else {}))
+                except Exception as e:
+                    db.session.rollback()
+                    status = e.status if isinstance(e, BatchOperationError) else 400
+                    change = change if isinstance(change, dict) else {}
+                    failed = {'op': change.get('op'), 'entity': change.get('entity'), 'id': change.get('id'),
+                              'client_id': change.get('client_id'), 'status': status, 'error': str(e)}
+                    if isinstance(e, SyncConflict):
+                        failed['current'] = e.current
+                    results.append(failed)
+                    # Nothing was written; earlier changes are reported as rolled back
+                    for result in results[:-1]:
+                        result.pop('instance', None)
+                        result.pop('archive_site', None)
+                        result['status'] = 'rolled_back'
+                        if result['op'] == 'create':
+                            result['id'] = None
+                    return jsonify({
+                        'success': False,
+                        'error': f'Change {index} failed: {e}',
+                        'failed_index': index,
+                        'data': results
+                    }), status
+
+            db.session.commit()
+            for result in results:
+                site_id = result.pop('archive_site', None)
+                if site_id is not None:
+                    app.extensions['archive_worker'].enqueue(site_id)
+                instance = result.pop('instance', None)
+                if instance is not None:
+                    result['data'] = instance.to_dict()
+            return jsonify({
+                'success': True,
+                'data': results,
+                'message': f'{len(results)} changes applied successfully'
+            }), 200
+        except Exception as e:
+            db.session.rollback()
+            return jsonify({'success': False, 'error': str(e)}), 500
@@ -0,0 +1,239 @@
+import os
+import re
+import threading
+import time
+from collections import OrderedDict
+from contextlib import contextmanager
+import click
+from flask import g, request, jsonify, current_app
+from flask_migrate import stamp, upgrade
+from sqlalchemy import create_engine
+from extensions import db, enable_sqlite_foreign_keys
+
+# Tenant names become file names, so keep them to a safe alphabet
+_TENANT_NAME = re.compile(r'^[a-z0-9][a-z0-9_-]{0,62}$')
+
+
+class UnknownTenant(Exception):
+    pass
+
+
+class TenantsBusy(Exception):
+    pass
+
+
+class TenantEngineCache:
+    """LRU of per-tenant SQLite engines.
+
+    At most TENANT_MAX_CONNECTIONS // TENANT_POOL_SIZE engines are open at
+    once, each with a fixed pool, which bounds the total number of
+    connections however many tenants exist. Engines unused for
+    TENANT_IDLE_SECONDS are disposed, and a full cache evicts the least
+    recently used engine that no request is holding.
+    """
+
+    def __init__(self, app):
+        self.directory = app.config['TENANT_DATABASE_DIR']
+        self.pool_size = app.config['TENANT_POOL_SIZE']
+        self.pool_timeout = app.config['TENANT_POOL_TIMEOUT']
+        self.max_engines = max(1, app.config['TENANT_MAX_CONNECTIONS'] // self.pool_size)
+        self.idle_seconds = app.config['TENANT_IDLE_SECONDS']
+        # tenant -> [engine, leases, last released]
+        self.entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def path(self, tenant):
+        if not _TENANT_NAME.match(tenant or ''):
+            raise UnknownTenant(tenant)
+        return os.path.join(self.directory, f'{tenant}.db')
+
+    def tenants(self):
+        return sorted(name[:-3] for name in os.listdir(self.directory)
+                      if name.endswith('.db') and _TENANT_NAME.match(name[:-3]))
+
+    def _create_engine(self, tenant):
+        engine = create_engine('sqlite:///' + self.path(tenant), pool_size=self.pool_size,
+                               max_overflow=0, pool_timeout=self.pool_timeout)
+        enable_sqlite_foreign_keys(engine)
+        return engine
+
+    def _evict_idle(self, now):
+        for tenant, (engine, leases, released_at) in list(self.entries.items()):
+            if leases == 0 and now - released_at > self.idle_seconds:
+                del self.entries[tenant]
+                engine.dispose()
+
+    def _evict_least_recent(self):
+        for tenant, (engine, leases, _) in list(self.entries.items()):
+            if leases == 0:
+                del self.entries[tenant]
+                engine.dispose()
+                return True
+        return False
+
+    def acquire(self, tenant, create=False):
+        """Lease the engine of a tenant; release() it when the work is done"""
+        path = self.path(tenant)
+        with self._lock:
+            self._evict_idle(time.monotonic())
+            entry = self.entries.get(tenant)
+            if entry is None:
+                if not create and not os.path.exists(path):
+                    raise UnknownTenant(tenant)
+                if len(self.entries) >= self.max_engines and not self._evict_least_recent():
+                    raise TenantsBusy(tenant)
+                entry = self.entries[tenant] = [self._create_engine(tenant), 0, 0.0]
+            self.entries.move_to_end(tenant)
+            entry[1] += 1
+            return entry[0]
+
+    def release(self, tenant):
+        with self._lock:
+            entry = self.entries.get(tenant)
+            if entry is not None:
+                entry[1] -= 1
+                entry[2] = time.monotonic()
+
+    def stats(self):
+        with self._lock:
+            return {
+                'engines': len(self.entries),
+                'max_engines': self.max_engines,
+                'leases': sum(leases for _, leases, _ in self.entries.values())
+            }
+
+
+def current_tenant():
+    """Tenant the current app context is bound to (None without multi-tenancy)"""
+    return g.get('tenant')
+
+
+def _bind(tenant, engine):
+    # A new session picks up the engine; see RoutingSession.get_bind
+    db.session.remove()
+    g.tenant, g.tenant_engine = tenant, engine
+
+
+@contextmanager
+def tenant_scope(tenant, create=False):
+    """Bind db.session to a tenant's database for the duration of the block.
+
+    Background jobs capture current_tenant() when they are queued and run
+    inside tenant_scope(); with tenant None the block runs unchanged.
+    """
+    if tenant is None:
+        yield None
+        return
+    cache = current_app.extensions['tenants']
+    engine = cache.acquire(tenant, create=create)
+    previous = g.get('tenant'), g.get('tenant_engine')
+    _bind(tenant, engine)
+    try:
+        yield engine
+    finally:
+        _bind(*previous)
+        cache.release(tenant)
+
+
+# --tenant for maintenance commands that loop over command_tenants()
+tenant_option = click.option('--tenant', default=None, help='Only this tenant (default: every tenant).')
+
+
+def command_tenants(tenant=None):
+    """Tenants a maintenance command runs for, each to be entered with tenant_scope().
+
+    Yields `tenant` when given, otherwise every tenant, echoing each name
+    so the command's output can be told apart. Without multi-tenancy it
+    yields None once, i.e. the default database.
+    """
+    cache = current_app.extensions.get('tenants')
+    if cache is None:
+        if tenant:
+            raise click.ClickException('--tenant requires TENANT_DATABASE_DIR')
+        yield None
+        return
+    if tenant:
+        try:
+            known = os.path.exists(cache.path(tenant))
+        except UnknownTenant:
+            known = False
+        if not known:
+            raise click.ClickException(f'Unknown tenant {tenant!r}')
+    for name in [tenant] if tenant else cache.tenants():
+        click.echo(f'Tenant {name}')
+        yield name
+
+
+def register_tenants(app):
+    app.config.setdefault('TENANT_DATABASE_DIR', None)
+    app.config.setdefault('TENANT_HEADER', 'X-Tenant')
+    # e.g. '.peakstart.app' serves acme.peakstart.app from the 'acme' database
+    app.config.setdefault('TENANT_HOST_SUFFIX', None)
+    app.config.setdefault('TENANT_MAX_CONNECTIONS', 64)
+    app.config.setdefault('TENANT_POOL_SIZE', 2)
+    app.config.setdefault('TENANT_POOL_TIMEOUT', 10)
+    app.config.setdefault('TENANT_IDLE_SECONDS', 300)
+    if not app.config['TENANT_DATABASE_DIR']:
+        return
+
+    os.makedirs(app.config['TENANT_DATABASE_DIR'], exist_ok=True)
+    cache = TenantEngineCache(app)
+    app.extensions['tenants'] = cache
+
+    @app.cli.command('create-tenant')
+    @click.argument('name')
+    def create_tenant_command(name):
+        """Create the database of a new tenant."""
+        try:
+            if os.path.exists(cache.path(name)):
+                raise click.ClickException(f'Tenant {name} already exists')
+        except UnknownTenant:
+            raise click.ClickException(f'Invalid tenant name {name!r}')
+        with tenant_scope(name, create=True) as engine:
+            db.metadata.create_all(engine)
+            stamp()
+        click.echo(f'Created tenant {name}')
+
+    @app.cli.command('upgrade-tenants')
+    def upgrade_tenants_command():
+        """Bring every tenant database up to the migration head."""
+        for name in cache.tenants():
+            with tenant_scope(name):
+                upgrade()
+            click.echo(f'Upgraded tenant {name}')
+
+    def _resolve_tenant():
+        tenant = request.headers.get(app.config['TENANT_HEADER'])
+        suffix = app.config['TENANT_HOST_SUFFIX']
+        if not tenant and suffix:
+            host = request.host.split(':', 1)[0].lower()
+            if host.endswith(suffix):
+                tenant = host[:-len(suffix)]
+        return tenant.lower() if tenant else None
+
+    @app.before_request
+    def bind_tenant_database():
+        if not request.path.startswith('/api/'):
+            return None
+        tenant = _resolve_tenant()
+        if tenant is None:
+            return jsonify({'success': False, 'error': 'Tenant required'}), 400
+        try:
+            engine = cache.acquire(tenant)
+        except UnknownTenant:
+            return jsonify({'success': False, 'error': 'Unknown tenant'}), 404
+        except TenantsBusy:
+            response = jsonify({'success': False, 'error': 'Too many active tenants'})
+            response.headers['Retry-After'] = '5'
+            return response, 503
+        g.tenant_lease = tenant
+        _bind(tenant, engine)
+        return None
+
+    @app.teardown_request
+    def release_tenant_database(exc):
+        tenant = g.pop('tenant_lease', None)
+        if tenant is not None:
+            # Return the connection before the engine becomes evictable
+            db.session.remove()
+            cache.release(tenant)
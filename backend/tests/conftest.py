@@ -0,0 +1,30 @@
+import os
+import sys
+import tempfile
+import pytest
+
+# app.py reads its database URLs at import time, so point them at scratch
+# files first. The replica bind is configured so replica routing can be
+# tested; requests only read from it under REPLICA_READ_PATHS.
+_scratch = tempfile.mkdtemp(prefix='peakstart-tests-')
+os.environ['DATABASE_URL'] = 'sqlite:///' + os.path.join(_scratch, 'primary.db')
+os.environ['DATABASE_REPLICA_URL'] = 'sqlite:///' + os.path.join(_scratch, 'replica.db')
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app import app as flask_app  # noqa: E402
+from extensions import db  # noqa: E402
+
+
+@pytest.fixture
+def app():
+    with flask_app.app_context():
+        yield flask_app
+        db.session.remove()
+        for table in reversed(db.metadata.sorted_tables):
+            db.session.execute(table.delete())
+        db.session.commit()
+
+
+@pytest.fixture
+def client(app):
+    return app.test_client()
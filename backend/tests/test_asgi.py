@@ -0,0 +1,45 @@
+import asyncio
+from asgi import AsgiApp
+from extensions import db
+from models import Site
+
+
+def _start_message(app, path, headers):
+    """Run a GET through the ASGI app and return its http.response.start message"""
+    scope = {
+        'type': 'http', 'method': 'GET', 'path': path, 'query_string': b'', 'http_version': '1.1',
+        'headers': [(name.lower().encode('latin-1'), value.encode('latin-1')) for name, value in headers.items()]
+    }
+    sent = []
+
+    async def run():
+        started = asyncio.Event()
+
+        async def receive():
+            await started.wait()
+            return {'type': 'http.disconnect'}
+
+        async def send(message):
+            sent.append(message)
+            started.set()
+
+        await asyncio.wait_for(AsgiApp(app)(scope, receive, send), timeout=5)
+
+    asyncio.run(run())
+    return sent[0]
+
+
+def test_native_event_stream_runs_after_request_hooks(app):
+    site = Site(name='Tower', location='Downtown', status='active')
+    db.session.add(site)
+    db.session.commit()
+
+    start = _start_message(app, f'/api/sites/{site.id}/events', {'Origin': 'http://localhost:5173'})
+
+    headers = dict(start['headers'])
+    assert start['status'] == 200
+    assert headers[b'content-type'] == b'text/event-stream; charset=utf-8'
+    assert headers[b'cache-control'] == b'no-cache'
+    assert headers[b'access-control-allow-origin'] == b'http://localhost:5173'
+    assert b'x-read-primary-until' in headers[b'access-control-expose-headers'].lower()
+    assert b'content-length' not in headers
@@ -0,0 +1,66 @@
+from datetime import date
+from decimal import Decimal
+from sqlalchemy import insert, update
+from extensions import db
+from models import Site, DailyActivity, SiteDailyTotal
+
+
+def _site():
+    site = Site(name='Tower', location='Downtown', status='active')
+    db.session.add(site)
+    db.session.commit()
+    return site
+
+
+def _activity(site, quantity, unit_price, day=date(2031, 1, 1)):
+    activity = DailyActivity(site_id=site.id, date=day, activity_name='Pour',
+                             quantity=quantity, unit_price=unit_price)
+    db.session.add(activity)
+    db.session.commit()
+    return activity
+
+
+def _revenue(site, day=date(2031, 1, 1)):
+    return SiteDailyTotal.query.filter_by(site_id=site.id, date=day).one().revenue
+
+
+def test_bulk_update_filtering_on_changed_column(app):
+    site = _site()
+    activity = _activity(site, 2, 10)
+
+    db.session.execute(update(DailyActivity).where(DailyActivity.quantity == 2).values(quantity=5))
+    db.session.commit()
+
+    assert db.session.get(DailyActivity, activity.id).total_price == Decimal('50.00')
+
+
+def test_bulk_update_keeps_site_daily_total(app):
+    site = _site()
+    activity = _activity(site, 2, 10)
+    assert _revenue(site) == Decimal('20.00')
+
+    db.session.execute(update(DailyActivity).where(DailyActivity.id == activity.id).values(quantity=7))
+    db.session.commit()
+    assert _revenue(site) == Decimal('70.00')
+
+    # Moving the row to another day moves its revenue
+    db.session.execute(update(DailyActivity), [{'id': activity.id, 'date': date(2031, 1, 2)}])
+    db.session.commit()
+    assert _revenue(site) == Decimal('0.00')
+    assert _revenue(site, date(2031, 1, 2)) == Decimal('70.00')
+
+
+def test_bulk_insert_keeps_site_daily_total(app):
+    site = _site()
+    db.session.execute(insert(DailyActivity), [
+        {'site_id': site.id, 'date': date(2031, 1, 1), 'activity_name': 'A', 'quantity': 1.115, 'unit_price': 3},
+        {'site_id': site.id, 'date': date(2031, 1, 1), 'activity_name': 'B', 'quantity': 2, 'unit_price': 4},
+    ])
+    db.session.execute(insert(DailyActivity), {
+        'site_id': site.id, 'date': date(2031, 1, 1), 'activity_name': 'C', 'quantity': 1, 'unit_price': 5
+    })
+    db.session.commit()
+
+    totals = sorted(a.total_price for a in DailyActivity.query.all())
+    assert totals == [Decimal('3.35'), Decimal('5.00'), Decimal('8.00')]
+    assert _revenue(site) == Decimal('16.35')
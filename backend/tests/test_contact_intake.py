@@ -0,0 +1,95 @@
+import threading
+from datetime import datetime
+from sqlalchemy.exc import OperationalError
+from contact_intake import ContactIntake, message_hash
+from models import ContactSubmission
+
+
+def _row(email):
+    now = datetime.utcnow()
+    return {
+        'first_name': 'Ada', 'last_name': 'Lovelace', 'email': email, 'phone': None,
+        'project_type': None, 'message': f'Hello from {email}', 'budget': None, 'status': 'new',
+        'message_hash': message_hash(f'Hello from {email}'), 'created_at': now, 'updated_at': now
+    }
+
+
+def _emails():
+    return sorted(email for (email,) in ContactSubmission.query.with_entities(ContactSubmission.email))
+
+
+def _failing(intake, failures):
+    """Make the first `failures` writes fail as SQLite does under write contention"""
+    write_batch = intake.write_batch
+    calls = []
+
+    def flaky(batch):
+        calls.append(len(batch))
+        if len(calls) <= failures:
+            raise OperationalError('INSERT', {}, Exception('database is locked'))
+        return write_batch(batch)
+    intake.write_batch = flaky
+    return calls
+
+
+def test_locked_database_is_retried(app, monkeypatch):
+    monkeypatch.setitem(app.config, 'CONTACT_RETRY_SECONDS', 0)
+    intake = ContactIntake(app)
+    calls = _failing(intake, 2)
+
+    assert intake.submit(_row('a@example.com'))
+    intake.queue.join()
+    assert _emails() == ['a@example.com']
+    assert len(calls) == 3
+
+
+def test_batch_outlasting_its_retries_is_kept_for_the_next_round(app, monkeypatch):
+    monkeypatch.setitem(app.config, 'CONTACT_RETRY_SECONDS', 0)
+    monkeypatch.setitem(app.config, 'CONTACT_WRITE_ATTEMPTS', 2)
+    intake = ContactIntake(app)
+    _failing(intake, 5)
+
+    assert intake.submit(_row('a@example.com'))
+    assert intake.submit(_row('b@example.com'))
+    intake.queue.join()
+    assert _emails() == ['a@example.com', 'b@example.com']
+
+
+def test_bad_row_does_not_sink_its_batch(app):
+    intake = ContactIntake(app)
+    write_batch = intake.write_batch
+
+    def reject_bad(batch):
+        if any(row['email'] == 'bad@example.com' for row in batch):
+            raise ValueError('bad row')
+        return write_batch(batch)
+    intake.write_batch = reject_bad
+
+    unwritten = intake.write_queued([(None, _row('a@example.com')), (None, _row('bad@example.com')),
+                                     (None, _row('c@example.com'))])
+    assert unwritten == []
+    assert _emails() == ['a@example.com', 'c@example.com']
+
+
+def test_flush_writes_the_in_flight_batch(app):
+    intake = ContactIntake(app)
+    write_batch = intake.write_batch
+    writing, release = threading.Event(), threading.Event()
+
+    def slow(batch):
+        writing.set()
+        release.wait(5)
+        return write_batch(batch)
+    intake.write_batch = slow
+
+    assert intake.submit(_row('a@example.com'))
+    assert writing.wait(5)
+    # Queued while the first batch is being written
+    assert intake.submit(_row('b@example.com'))
+    flusher = threading.Thread(target=intake.flush)
+    flusher.start()
+    release.set()
+    flusher.join(10)
+
+    assert not intake._thread.is_alive()
+    assert _emails() == ['a@example.com', 'b@example.com']
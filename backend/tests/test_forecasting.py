@@ -0,0 +1,15 @@
+from datetime import datetime
+from extensions import db
+from models import Site
+
+
+def test_forecast_of_soft_deleted_site_is_not_found(client):
+    site = Site(name='Tower', location='Downtown', status='active')
+    db.session.add(site)
+    db.session.commit()
+    assert client.get(f'/api/sites/{site.id}/forecast').status_code == 200
+
+    site.deleted_at = datetime.utcnow()
+    db.session.commit()
+
+    assert client.get(f'/api/sites/{site.id}/forecast').status_code == 404
@@ -0,0 +1,57 @@
+from extensions import db
+from replicas import copy_sqlite_database
+
+# The SPA is served from another origin and fetch() does not send cookies
+# there, so these requests carry no cookie jar.
+ORIGIN = {'Origin': 'http://localhost:5173'}
+
+
+def _copy_replica():
+    db.engines['replica'].dispose()
+    copy_sqlite_database(db.engines[None].url, db.engines['replica'].url)
+
+
+def _cost_descriptions(response):
+    return [cost['description'] for cost in response.get_json()['data']]
+
+
+def test_echoed_header_keeps_cross_origin_reads_on_primary(app, monkeypatch):
+    monkeypatch.setitem(app.config, 'REPLICA_LAG_CHECK_SECONDS', 0)
+    client = app.test_client(use_cookies=False)
+    site = client.post('/api/sites', headers=ORIGIN, json={
+        'name': 'Replica site', 'location': 'Here', 'status': 'active', 'start_date': '2030-01-01'
+    }).get_json()['data']
+    _copy_replica()
+    assert client.get('/api/costs', headers=ORIGIN).headers['X-Read-Source'] == 'replica'
+
+    written = client.post('/api/costs', headers=ORIGIN, json={
+        'site_id': site['id'], 'cost_type': 'other', 'description': 'Written after the copy',
+        'amount': 120, 'date': '2030-01-02'
+    })
+    assert written.status_code == 201
+    until = written.headers['X-Read-Primary-Until']
+    assert 'X-Read-Primary-Until' in written.headers['Access-Control-Expose-Headers']
+
+    echoed = client.get('/api/costs', headers={**ORIGIN, 'X-Read-Primary-Until': until})
+    assert echoed.headers['X-Read-Source'] == 'primary'
+    assert 'Written after the copy' in _cost_descriptions(echoed)
+
+    plain = client.get('/api/costs', headers=ORIGIN)
+    assert plain.headers['X-Read-Source'] == 'replica'
+    assert 'Written after the copy' not in _cost_descriptions(plain)
+
+
+def test_far_future_header_is_ignored(app, monkeypatch):
+    monkeypatch.setitem(app.config, 'REPLICA_LAG_CHECK_SECONDS', 0)
+    _copy_replica()
+    client = app.test_client(use_cookies=False)
+    response = client.get('/api/costs', headers={**ORIGIN, 'X-Read-Primary-Until': '99999999999'})
+    assert response.headers['X-Read-Source'] == 'replica'
+
+
+def test_preflight_allows_the_header(client):
+    response = client.options('/api/costs', headers={
+        **ORIGIN, 'Access-Control-Request-Method': 'GET',
+        'Access-Control-Request-Headers': 'X-Read-Primary-Until'
+    })
+    assert 'x-read-primary-until' in response.headers['Access-Control-Allow-Headers'].lower()
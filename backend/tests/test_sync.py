@@ -0,0 +1,64 @@
+from datetime import date, datetime, timedelta
+from extensions import db
+from models import Site, Worker, Attendance
+
+
+def _worker(site_name='Tower'):
+    site = Site(name=site_name, location='Downtown', status='active')
+    db.session.add(site)
+    db.session.flush()
+    worker = Worker(name='Ana', position='Mason', daily_price=100, site_id=site.id)
+    db.session.add(worker)
+    db.session.commit()
+    return worker
+
+
+def _attendance(worker, day):
+    attendance = Attendance(worker_id=worker.id, date=day, hours_worked=8.0)
+    db.session.add(attendance)
+    db.session.commit()
+    return attendance
+
+
+def test_update_onto_existing_attendance_day_is_a_conflict(client):
+    worker = _worker()
+    taken = _attendance(worker, date(2031, 1, 1))
+    moved = _attendance(worker, date(2031, 1, 2))
+
+    response = client.post('/api/sync', json={'changes': [{
+        'op': 'update', 'entity': 'attendance', 'id': moved.id,
+        'base_updated_at': moved.updated_at.isoformat(), 'data': {'date': '2031-01-01'}
+    }]})
+
+    assert response.status_code == 409
+    failed = response.get_json()['data'][0]
+    assert failed['status'] == 409
+    assert failed['current']['id'] == taken.id
+
+
+def test_update_keeping_its_own_attendance_day_is_allowed(client):
+    attendance = _attendance(_worker(), date(2031, 1, 1))
+
+    response = client.post('/api/sync', json={'changes': [{
+        'op': 'update', 'entity': 'attendance', 'id': attendance.id,
+        'base_updated_at': attendance.updated_at.isoformat(),
+        'data': {'date': '2031-01-01', 'hours_worked': 6.0}
+    }]})
+
+    assert response.status_code == 200
+    assert response.get_json()['data'][0]['data']['hours_worked'] == 6.0
+
+
+def test_pull_hides_workers_of_soft_deleted_sites(client):
+    kept = _worker('Kept')
+    gone = _worker('Gone')
+    since = (datetime.utcnow() - timedelta(minutes=1)).isoformat()
+    gone.site.deleted_at = datetime.utcnow()
+    db.session.commit()
+
+    full = client.get('/api/sync').get_json()['data']
+    assert [worker['id'] for worker in full['changes']['worker']] == [kept.id]
+
+    incremental = client.get('/api/sync', query_string={'since': since}).get_json()['data']
+    assert [worker['id'] for worker in incremental['changes']['worker']] == [kept.id]
+    assert incremental['deleted']['worker'] == [gone.id]
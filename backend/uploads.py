@@ -0,0 +1,267 @@
+import hashlib
+import json
+import logging
+import os
+import uuid
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+import click
+from flask import request, jsonify, current_app
+from PIL import Image
+from sqlalchemy.exc import IntegrityError
+from extensions import db
+from models import Upload
+from tenants import command_tenants, current_tenant, tenant_option, tenant_scope
+
+logger = logging.getLogger(__name__)
+
+_CHUNK_SIZE = 64 * 1024
+
+# PIL format -> (content type, file extension) of accepted originals
+_ORIGINAL_FORMATS = {
+    'PNG': ('image/png', 'png'),
+    'JPEG': ('image/jpeg', 'jpg'),
+    'WEBP': ('image/webp', 'webp'),
+    'GIF': ('image/gif', 'gif')
+}
+
+# Encodings produced for every variant width: (PIL format, extension, save options)
+_VARIANT_FORMATS = [
+    ('WEBP', 'webp', {'quality': 80, 'method': 4}),
+    ('JPEG', 'jpg', {'quality': 82, 'optimize': True, 'progressive': True})
+]
+
+
+class UploadError(Exception):
+    def __init__(self, message, status=400):
+        super().__init__(message)
+        self.status = status
+
+
+def upload_url(path):
+    return f"{current_app.config['UPLOAD_URL_PREFIX']}/{path}"
+
+
+def _write_atomically(folder, path, save):
+    """Write through a temp file and rename, so readers never see a partial file"""
+    full_path = os.path.join(folder, path)
+    os.makedirs(os.path.dirname(full_path), exist_ok=True)
+    tmp_path = f'{full_path}.{uuid.uuid4().hex}.tmp'
+    try:
+        save(tmp_path)
+        os.replace(tmp_path, full_path)
+    finally:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+    return os.path.getsize(full_path)
+
+
+def _stream_to_disk(stream, folder):
+    """Copy an upload stream to a temp file chunk by chunk, hashing as it goes"""
+    tmp_dir = os.path.join(folder, 'tmp')
+    os.makedirs(tmp_dir, exist_ok=True)
+    tmp_path = os.path.join(tmp_dir, uuid.uuid4().hex)
+    max_bytes = current_app.config['UPLOAD_MAX_BYTES']
+
+    digest = hashlib.sha256()
+    size = 0
+    try:
+        with open(tmp_path, 'wb') as f:
+            while True:
+                chunk = stream.read(_CHUNK_SIZE)
+                if not chunk:
+                    break
+                size += len(chunk)
+                if size > max_bytes:
+                    raise UploadError(f'File is larger than {max_bytes} bytes', 413)
+                digest.update(chunk)
+                f.write(chunk)
+    except Exception:
+        os.remove(tmp_path)
+        raise
+    return tmp_path, digest.hexdigest(), size
+
+
+def store_upload(stream, original_name=None):
+    """Store an image by content hash; returns (upload, created)"""
+    folder = current_app.config['UPLOAD_FOLDER']
+    tmp_path, digest, size = _stream_to_disk(stream, folder)
+    try:
+        existing = Upload.query.filter_by(hash=digest).first()
+        if existing and os.path.exists(os.path.join(folder, existing.path)):
+            return existing, False
+
+        try:
+            with Image.open(tmp_path) as image:
+                image_format = image.format
+                width, height = image.size
+                image.verify()
+        except Exception:
+            raise UploadError('File is not a readable image', 415)
+        if image_format not in _ORIGINAL_FORMATS:
+            raise UploadError(f'Unsupported image format {image_format}', 415)
+
+        content_type, extension = _ORIGINAL_FORMATS[image_format]
+        path = f'originals/{digest[:2]}/{digest}.{extension}'
+        full_path = os.path.join(folder, path)
+        os.makedirs(os.path.dirname(full_path), exist_ok=True)
+        os.replace(tmp_path, full_path)
+    finally:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+    upload = existing or Upload(hash=digest)
+    upload.original_name = original_name
+    upload.content_type = content_type
+    upload.path = path
+    upload.size = size
+    upload.width = width
+    upload.height = height
+    upload.status = 'pending'
+    upload.variants = None
+    db.session.add(upload)
+    try:
+        db.session.commit()
+    except IntegrityError:
+        # The same file was uploaded concurrently and the other request won
+        db.session.rollback()
+        return Upload.query.filter_by(hash=digest).one(), False
+    return upload, True
+
+
+def _variant_widths(width, configured):
+    widths = {w for w in configured if w < width}
+    if width <= max(configured):
+        widths.add(width)
+    return sorted(widths)
+
+
+def generate_variants(upload):
+    """Write resized WebP and JPEG copies of an upload and record them"""
+    folder = current_app.config['UPLOAD_FOLDER']
+    variants = []
+    with Image.open(os.path.join(folder, upload.path)) as original:
+        original.load()
+        has_alpha = original.mode in ('RGBA', 'LA', 'PA') or 'transparency' in original.info
+        base = original.convert('RGBA' if has_alpha else 'RGB')
+
+    for width in _variant_widths(base.width, current_app.config['UPLOAD_VARIANT_WIDTHS']):
+        height = max(1, round(base.height * width / base.width))
+        resized = base if width == base.width else base.resize((width, height), Image.LANCZOS)
+        for image_format, extension, options in _VARIANT_FORMATS:
+            image = resized
+            if image_format == 'JPEG' and image.mode != 'RGB':
+                # JPEG has no alpha channel; flatten onto white
+                image = Image.new('RGB', resized.size, (255, 255, 255))
+                image.paste(resized, mask=resized.getchannel('A'))
+            path = f'variants/{upload.hash[:2]}/{upload.hash}/{width}.{extension}'
+            size = _write_atomically(folder, path, lambda p: image.save(p, image_format, **options))
+            variants.append({'width': width, 'format': extension, 'path': path, 'size': size})
+
+    upload.variants = json.dumps(variants)
+    upload.status = 'ready'
+    db.session.commit()
+    return variants
+
+
+def _generate_variants_job(app, tenant, upload_id):
+    with app.app_context(), tenant_scope(tenant):
+        try:
+            upload = db.session.get(Upload, upload_id)
+            if upload is not None:
+                generate_variants(upload)
+        except Exception:
+            db.session.rollback()
+            logger.exception(f"Generating variants for upload {upload_id} failed")
+            upload = db.session.get(Upload, upload_id)
+            if upload is not None:
+                upload.status = 'failed'
+                db.session.commit()
+        finally:
+            db.session.remove()
+
+
+def upload_manifest(upload):
+    """Upload details plus srcset strings for each variant format"""
+    data = upload.to_dict()
+    data['url'] = upload_url(upload.path)
+
+    by_format = defaultdict(list)
+    for variant in data['variants']:
+        by_format[variant['format']].append(variant)
+    data['srcset'] = {
+        extension: ', '.join(f"{upload_url(v['path'])} {v['width']}w"
+                             for v in sorted(variants, key=lambda v: v['width']))
+        for extension, variants in by_format.items()
+    }
+    # Largest JPEG for browsers that ignore srcset; the original until variants exist
+    jpegs = sorted(by_format.get('jpg', []), key=lambda v: v['width'])
+    data['src'] = upload_url(jpegs[-1]['path']) if jpegs else data['url']
+    return data
+
+
+def register_upload_routes(app):
+    app.config.setdefault('UPLOAD_FOLDER', os.path.join(app.root_path, 'static', 'uploads'))
+    app.config.setdefault('UPLOAD_URL_PREFIX', '/media')  # served by media.py
+    app.config.setdefault('UPLOAD_MAX_BYTES', 20 * 1024 * 1024)
+    app.config.setdefault('UPLOAD_VARIANT_WIDTHS', (320, 640, 960, 1280, 1920))
+    app.config.setdefault('UPLOAD_WORKERS', 2)
+    app.extensions['upload_pool'] = ThreadPoolExecutor(
+        max_workers=app.config['UPLOAD_WORKERS'], thread_name_prefix='upload-variants'
+    )
+
+    @app.cli.command('generate-upload-variants')
+    @click.option('--all', 'regenerate_all', is_flag=True, help='Also regenerate uploads that are ready.')
+    @tenant_option
+    def generate_upload_variants_command(regenerate_all, tenant):
+        """Generate resized variants for pending or failed uploads."""
+        for name in command_tenants(tenant):
+            with tenant_scope(name):
+                query = Upload.query
+                if not regenerate_all:
+                    query = query.filter(Upload.status != 'ready')
+                uploads = query.order_by(Upload.id).all()
+                for upload in uploads:
+                    generate_variants(upload)
+            click.echo(f'Generated variants for {len(uploads)} uploads')
+
+    # Upload Routes
+    @app.route('/api/uploads', methods=['POST'])
+    def create_upload():
+        """Store an image (multipart 'file' field or raw image body) and queue its variants"""
+        try:
+            if 'file' in request.files:
+                file = request.files['file']
+                stream, original_name = file.stream, file.filename
+            elif request.mimetype.startswith('image/'):
+                # Raw bodies are read straight off the socket, never buffered whole
+                stream, original_name = request.stream, request.args.get('filename')
+            else:
+                return jsonify({'success': False, 'error': "Send a 'file' field or an image/* body"}), 400
+
+            upload, created = store_upload(stream, original_name)
+            if created:
+                app.extensions['upload_pool'].submit(_generate_variants_job, app, current_tenant(), upload.id)
+            return jsonify({
+                'success': True,
+                'data': upload_manifest(upload),
+                'message': 'Upload stored successfully' if created else 'Upload already exists'
+            }), 201 if created else 200
+        except UploadError as e:
+            db.session.rollback()
+            return jsonify({'success': False, 'error': str(e)}), e.status
+        except Exception as e:
+            db.session.rollback()
+            return jsonify({'success': False, 'error': str(e)}), 500
+
+    @app.route('/api/uploads/<string:upload_hash>', methods=['GET'])
+    def get_upload(upload_hash):
+        """Get an upload with its variant srcset manifest"""
+        try:
+            upload = Upload.query.filter_by(hash=upload_hash).first_or_404()
+            return jsonify({
+                'success': True,
+                'data': upload_manifest(upload)
+            }), 200
+        except Exception as e:
+            return jsonify({'success': False, 'error': str(e)}), 500
@@ -1,11 +1,11 @@
 import React, { useState, useEffect } from 'react';
-import { createBlogPost, getBlogPosts, updateBlogPost, deleteBlogPost } from '../../services/api';
+import { createBlogPost, getBlogPosts, getBlogPostById, updateBlogPost, deleteBlogPost } from '../../services/api';
 
 interface BlogPost {
   id: number;
   title: string;
   excerpt: string;
-  content: string;
+  content?: string; // only on the single-post endpoint
   author: string;
   publishDate: string;
   category: string;
@@ -122,12 +122,20 @@ const BlogPostForm: React.FC = () => {
     }
   };
 
-  const handleEdit = (blogPost: BlogPost) => {
+  const handleEdit = async (summary: BlogPost) => {
+    // The list leaves out content, so load the full post before editing
+    const response = await getBlogPostById(summary.id);
+    if (!response.success || !response.data) {
+      setIsError(true);
+      setMessage(response.error || 'Failed to load blog post.');
+      return;
+    }
+    const blogPost: BlogPost = response.data;
     setEditingBlogPostId(blogPost.id);
     setFormData({
       title: blogPost.title,
       excerpt: blogPost.excerpt,
-      content: blogPost.content,
+      content: blogPost.content || '',
       author: blogPost.author,
       publishDate: blogPost.publishDate,
       category: blogPost.category,
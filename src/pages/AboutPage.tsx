@@ -1,7 +1,7 @@
 import React, { useEffect, useState } from 'react';
 import { Link } from 'react-router-dom';
 import { Award, Users, Clock, CheckCircle, Target, Eye, Heart } from 'lucide-react';
-import { getHomeStats, getTeamMembers, getCertifications, getAwards } from '../services/api';
+import { getPublicBundle } from '../services/api';
 
 interface TeamMember {
   id: number;
@@ -44,41 +44,19 @@ const AboutPage: React.FC = () => {
       setLoading(true);
       setError(null);
       try {
-        // Fetch stats
-        const statsResponse = await getHomeStats();
-        if (statsResponse.success) {
-          setStats(statsResponse.data?.map((stat: any) => ({
+        // Stats, team, certifications and awards come from one shared bundle
+        const bundleResponse = await getPublicBundle();
+        if (bundleResponse.success && bundleResponse.data) {
+          setStats(bundleResponse.data.stats.map((stat: any) => ({
             ...stat,
             icon: stat.icon_name === "Clock" ? Clock : stat.icon_name === "CheckCircle" ? CheckCircle : stat.icon_name === "Users" ? Users : Award
-          })) || []);
+          })));
+          setTeamMembers(bundleResponse.data.team);
+          setCertifications(bundleResponse.data.certifications);
+          setAwards(bundleResponse.data.awards);
         } else {
-          console.error('Failed to fetch stats:', statsResponse.error);
+          console.error('Failed to fetch about page content:', bundleResponse.error);
         }
-
-        // Fetch team members
-        const teamResponse = await getTeamMembers();
-        if (teamResponse.success) {
-          setTeamMembers(teamResponse.data || []);
-        } else {
-          console.error('Failed to fetch team members:', teamResponse.error);
-        }
-
-        // Fetch certifications
-        const certResponse = await getCertifications();
-        if (certResponse.success) {
-          setCertifications(certResponse.data || []);
-        } else {
-          console.error('Failed to fetch certifications:', certResponse.error);
-        }
-
-        // Fetch awards
-        const awardsResponse = await getAwards();
-        if (awardsResponse.success) {
-          setAwards(awardsResponse.data || []);
-        } else {
-          console.error('Failed to fetch awards:', awardsResponse.error);
-        }
-
       } catch (err: any) {
         setError(err.message || 'An unexpected error occurred');
       } finally {
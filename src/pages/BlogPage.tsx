@@ -7,7 +7,6 @@ interface BlogPost {
   id: number;
   title: string;
   excerpt: string;
-  content: string;
   author: string;
   publishDate: string;
   category: string;
@@ -1,5 +1,10 @@
 import React, { useState, useEffect } from 'react';
-import { getContactSubmissions, deleteContactSubmission } from '../services/api';
+import {
+  getContactSubmissions,
+  getContactSubmissionCounts,
+  updateContactSubmissionStatus,
+  deleteContactSubmission
+} from '../services/api';
 
 interface ContactSubmission {
   id: number;
@@ -10,39 +15,109 @@ interface ContactSubmission {
   projectType?: string;
   message: string;
   budget?: string;
-  submissionDate: string; // Assuming the backend provides this
+  status: string;
+  created_at: string;
 }
 
+const STATUSES = ['new', 'contacted', 'quoted', 'closed'];
+
 const ContactSubmissionsPage: React.FC = () => {
   const [submissions, setSubmissions] = useState<ContactSubmission[]>([]);
+  const [nextCursor, setNextCursor] = useState<string | null>(null);
+  const [statusFilter, setStatusFilter] = useState<string>('All');
+  const [counts, setCounts] = useState<Record<string, number>>({});
+  const [selectedIds, setSelectedIds] = useState<number[]>([]);
+  const [bulkStatus, setBulkStatus] = useState<string>('contacted');
   const [loading, setLoading] = useState(true);
+  const [loadingMore, setLoadingMore] = useState(false);
   const [error, setError] = useState<string | null>(null);
   const [message, setMessage] = useState<string | null>(null);
   const [isError, setIsError] = useState(false);
 
+  const fetchCounts = async () => {
+    const response = await getContactSubmissionCounts();
+    if (response.success && response.data) {
+      setCounts(response.data);
+    }
+  };
+
   const fetchSubmissions = async () => {
     setLoading(true);
     setError(null);
-    const response = await getContactSubmissions();
+    setSelectedIds([]);
+    const response = await getContactSubmissions(statusFilter);
     if (response.success && response.data) {
       setSubmissions(response.data);
+      setNextCursor(response.next_cursor || null);
     } else {
       setError(response.error || "Failed to fetch contact submissions.");
     }
     setLoading(false);
   };
 
+  const loadMore = async () => {
+    if (!nextCursor) return;
+    setLoadingMore(true);
+    const response = await getContactSubmissions(statusFilter, nextCursor);
+    if (response.success && response.data) {
+      setSubmissions([...submissions, ...response.data]);
+      setNextCursor(response.next_cursor || null);
+    } else {
+      setIsError(true);
+      setMessage(response.error || 'Failed to load more contact submissions.');
+    }
+    setLoadingMore(false);
+  };
+
+  const refresh = () => {
+    fetchSubmissions();
+    fetchCounts();
+  };
+
   useEffect(() => {
     fetchSubmissions();
+  }, [statusFilter]);
+
+  useEffect(() => {
+    fetchCounts();
   }, []);
 
+  const toggleSelected = (submissionId: number) => {
+    setSelectedIds(selectedIds.includes(submissionId)
+      ? selectedIds.filter((id) => id !== submissionId)
+      : [...selectedIds, submissionId]);
+  };
+
+  const toggleAll = () => {
+    setSelectedIds(selectedIds.length === submissions.length ? [] : submissions.map((submission) => submission.id));
+  };
+
+  const handleBulkStatus = async () => {
+    if (selectedIds.length === 0) return;
+    try {
+      const response = await updateContactSubmissionStatus(selectedIds, bulkStatus);
+      if (response.success) {
+        setIsError(false);
+        setMessage(response.message || 'Contact submissions updated successfully!');
+        refresh();
+      } else {
+        setIsError(true);
+        setMessage(response.error || 'Failed to update contact submissions.');
+      }
+    } catch (err: any) {
+      setIsError(true);
+      setMessage(err.message || 'An unexpected error occurred.');
+    }
+  };
+
   const handleDelete = async (submissionId: number) => {
     if (window.confirm('Are you sure you want to delete this contact submission?')) {
       try {
         const response = await deleteContactSubmission(submissionId);
         if (response.success) {
+          setIsError(false);
           setMessage(response.message || 'Contact submission deleted successfully!');
-          fetchSubmissions(); // Refresh the list
+          refresh();
         } else {
           setIsError(true);
           setMessage(response.error || 'Failed to delete contact submission.');
@@ -54,6 +129,8 @@ const ContactSubmissionsPage: React.FC = () => {
     }
   };
 
+  const totalCount = STATUSES.reduce((total, status) => total + (counts[status] || 0), 0);
+
   return (
     <div className="bg-white p-8 rounded-lg shadow-md">
       <h2 className="text-2xl font-bold text-gray-800 mb-6">Contact Submissions</h2>
@@ -62,6 +139,36 @@ const ContactSubmissionsPage: React.FC = () => {
           {message}
         </div>
       )}
+      <div className="flex flex-wrap gap-2 mb-4">
+        {['All', ...STATUSES].map((status) => (
+          <button
+            key={status}
+            onClick={() => setStatusFilter(status)}
+            className={`px-4 py-2 rounded-md text-sm font-medium capitalize ${
+              statusFilter === status ? 'bg-blue-600 text-white' : 'bg-gray-100 text-gray-700 hover:bg-gray-200'
+            }`}
+          >
+            {status} ({status === 'All' ? totalCount : counts[status] || 0})
+          </button>
+        ))}
+      </div>
+      {selectedIds.length > 0 && (
+        <div className="flex items-center gap-3 mb-4 p-3 bg-gray-50 rounded-md">
+          <span className="text-sm text-gray-700">{selectedIds.length} selected</span>
+          <select
+            value={bulkStatus}
+            onChange={(e) => setBulkStatus(e.target.value)}
+            className="px-3 py-2 border border-gray-300 rounded-md focus:outline-none focus:ring-2 focus:ring-blue-500 capitalize"
+          >
+            {STATUSES.map((status) => (
+              <option key={status} value={status}>{status}</option>
+            ))}
+          </select>
+          <button onClick={handleBulkStatus} className="px-4 py-2 bg-blue-600 text-white rounded-md hover:bg-blue-700 text-sm">
+            Change status
+          </button>
+        </div>
+      )}
       {loading ? (
         <p>Loading submissions...</p>
       ) : error ? (
@@ -73,6 +180,9 @@ const ContactSubmissionsPage: React.FC = () => {
           <table className="min-w-full divide-y divide-gray-200">
             <thead className="bg-gray-50">
               <tr>
+                <th scope="col" className="px-6 py-3 text-left">
+                  <input type="checkbox" checked={selectedIds.length === submissions.length} onChange={toggleAll} />
+                </th>
                 <th scope="col" className="px-6 py-3 text-left text-xs font-medium text-gray-500 uppercase tracking-wider">Date</th>
                 <th scope="col" className="px-6 py-3 text-left text-xs font-medium text-gray-500 uppercase tracking-wider">Name</th>
                 <th scope="col" className="px-6 py-3 text-left text-xs font-medium text-gray-500 uppercase tracking-wider">Email</th>
@@ -80,19 +190,28 @@ const ContactSubmissionsPage: React.FC = () => {
                 <th scope="col" className="px-6 py-3 text-left text-xs font-medium text-gray-500 uppercase tracking-wider">Project Type</th>
                 <th scope="col" className="px-6 py-3 text-left text-xs font-medium text-gray-500 uppercase tracking-wider">Message</th>
                 <th scope="col" className="px-6 py-3 text-left text-xs font-medium text-gray-500 uppercase tracking-wider">Budget</th>
+                <th scope="col" className="px-6 py-3 text-left text-xs font-medium text-gray-500 uppercase tracking-wider">Status</th>
                 <th scope="col" className="px-6 py-3 text-left text-xs font-medium text-gray-500 uppercase tracking-wider">Actions</th>
               </tr>
             </thead>
             <tbody className="bg-white divide-y divide-gray-200">
               {submissions.map((submission) => (
                 <tr key={submission.id}>
-                  <td className="px-6 py-4 whitespace-nowrap text-sm font-medium text-gray-900">{new Date(submission.submissionDate).toLocaleDateString()}</td>
+                  <td className="px-6 py-4">
+                    <input
+                      type="checkbox"
+                      checked={selectedIds.includes(submission.id)}
+                      onChange={() => toggleSelected(submission.id)}
+                    />
+                  </td>
+                  <td className="px-6 py-4 whitespace-nowrap text-sm font-medium text-gray-900">{new Date(submission.created_at).toLocaleDateString()}</td>
                   <td className="px-6 py-4 whitespace-nowrap text-sm text-gray-500">{submission.firstName} {submission.lastName}</td>
                   <td className="px-6 py-4 whitespace-nowrap text-sm text-gray-500">{submission.email}</td>
                   <td className="px-6 py-4 whitespace-nowrap text-sm text-gray-500">{submission.phone || 'N/A'}</td>
                   <td className="px-6 py-4 whitespace-nowrap text-sm text-gray-500">{submission.projectType || 'N/A'}</td>
                   <td className="px-6 py-4 whitespace-nowrap text-sm text-gray-500 max-w-xs overflow-hidden text-ellipsis">{submission.message.substring(0, 50)}...</td>
                   <td className="px-6 py-4 whitespace-nowrap text-sm text-gray-500">{submission.budget || 'N/A'}</td>
+                  <td className="px-6 py-4 whitespace-nowrap text-sm text-gray-500 capitalize">{submission.status}</td>
                   <td className="px-6 py-4 whitespace-nowrap text-right text-sm font-medium">
                     <button onClick={() => handleDelete(submission.id)} className="text-red-600 hover:text-red-900">Delete</button>
                   </td>
@@ -100,6 +219,17 @@ const ContactSubmissionsPage: React.FC = () => {
               ))}
             </tbody>
           </table>
+          {nextCursor && (
+            <div className="mt-4 text-center">
+              <button
+                onClick={loadMore}
+                disabled={loadingMore}
+                className="px-4 py-2 bg-gray-100 text-gray-700 rounded-md hover:bg-gray-200 text-sm disabled:opacity-50"
+              >
+                {loadingMore ? 'Loading...' : 'Load more'}
+              </button>
+            </div>
+          )}
         </div>
       )}
     </div>
@@ -1,7 +1,7 @@
 import React, { useEffect, useState } from 'react';
 import { Link } from 'react-router-dom';
 import { ArrowRight, CheckCircle, Users, Award, Clock } from 'lucide-react';
-import { getHomeStats, getHomeTestimonials, getHomeServices } from '../services/api';
+import { getPublicBundle } from '../services/api';
 
 interface Service {
   id: number;
@@ -54,31 +54,18 @@ const HomePage: React.FC = () => {
 
   useEffect(() => {
     const fetchData = async () => {
-      // Fetch services
-      const servicesResponse = await getHomeServices();
-      if (servicesResponse.success) {
-        setServices(servicesResponse.data || []);
-      } else {
-        console.error('Error fetching services:', servicesResponse.error);
-      }
-
-      // Fetch stats
-      const statsResponse = await getHomeStats();
-      if (statsResponse.success) {
-        setStats(statsResponse.data?.map((stat: any) => ({
+      // Services, stats and testimonials come from one shared bundle
+      const bundleResponse = await getPublicBundle();
+      if (bundleResponse.success && bundleResponse.data) {
+        // The bundle has every service; the homepage features the first three
+        setServices(bundleResponse.data.services.slice(0, 3));
+        setStats(bundleResponse.data.stats.map((stat: any) => ({
           ...stat,
           icon: stat.icon_name === "CheckCircle" ? CheckCircle : stat.icon_name === "Clock" ? Clock : stat.icon_name === "Users" ? Users : Award
-        })) || []);
-      } else {
-        console.error('Error fetching stats:', statsResponse.error);
-      }
-
-      // Fetch testimonials
-      const testimonialsResponse = await getHomeTestimonials();
-      if (testimonialsResponse.success) {
-        setTestimonials(testimonialsResponse.data || []);
+        })));
+        setTestimonials(bundleResponse.data.testimonials);
       } else {
-        console.error('Error fetching testimonials:', testimonialsResponse.error);
+        console.error('Error fetching home content:', bundleResponse.error);
       }
     };
 
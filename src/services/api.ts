@@ -65,6 +65,15 @@ interface Award {
   year: string;
 }
 
+interface PublicBundle {
+  stats: CompanyStat[];
+  testimonials: Testimonial[];
+  services: Service[];
+  team: TeamMember[];
+  certifications: Certification[];
+  awards: Award[];
+}
+
 interface ContactFormData {
   firstName: string;
   lastName: string;
@@ -82,12 +91,35 @@ interface ApiResponse<T> {
   message?: string;
 }
 
+// Keyset-paged lists: pass next_cursor back to get the following page (null on the last one)
+interface PagedApiResponse<T> extends ApiResponse<T[]> {
+  next_cursor?: string | null;
+}
+
 const API_BASE_URL = 'http://localhost:5000';
 
+// Deadline from the last write's X-Read-Primary-Until header. Echoing it
+// keeps reads on the primary until the replica has caught up; the
+// equivalent cookie is not sent on cross-origin fetch().
+let readPrimaryUntil: string | null = null;
+
+const apiFetch = async (url: string, init: RequestInit = {}): Promise<Response> => {
+  const headers = new Headers(init.headers);
+  if (readPrimaryUntil && Number(readPrimaryUntil) * 1000 > Date.now()) {
+    headers.set('X-Read-Primary-Until', readPrimaryUntil);
+  }
+  const response = await fetch(url, { ...init, headers });
+  const until = response.headers.get('X-Read-Primary-Until');
+  if (until) {
+    readPrimaryUntil = until;
+  }
+  return response;
+};
+
 // Home Page APIs
 export const getHomeStats = async (): Promise<ApiResponse<any[]>> => {
   try {
-    const response = await fetch(`${API_BASE_URL}/api/home/stats`);
+    const response = await apiFetch(`${API_BASE_URL}/api/home/stats`);
     return response.json();
   } catch (error: any) {
     console.error("Error fetching home stats:", error);
@@ -97,7 +129,7 @@ export const getHomeStats = async (): Promise<ApiResponse<any[]>> => {
 
 export const getHomeTestimonials = async (): Promise<ApiResponse<any[]>> => {
   try {
-    const response = await fetch(`${API_BASE_URL}/api/home/testimonials`);
+    const response = await apiFetch(`${API_BASE_URL}/api/home/testimonials`);
     return response.json();
   } catch (error: any) {
     console.error("Error fetching home testimonials:", error);
@@ -107,7 +139,7 @@ export const getHomeTestimonials = async (): Promise<ApiResponse<any[]>> => {
 
 export const getHomeServices = async (): Promise<ApiResponse<any[]>> => {
   try {
-    const response = await fetch(`${API_BASE_URL}/api/home/services`);
+    const response = await apiFetch(`${API_BASE_URL}/api/home/services`);
     return response.json();
   } catch (error: any) {
     console.error("Error fetching home services:", error);
@@ -115,10 +147,21 @@ export const getHomeServices = async (): Promise<ApiResponse<any[]>> => {
   }
 };
 
+// Home and About content in one cached response; the browser revalidates it with If-None-Match
+export const getPublicBundle = async (): Promise<ApiResponse<PublicBundle>> => {
+  try {
+    const response = await apiFetch(`${API_BASE_URL}/api/public/bundle`);
+    return response.json();
+  } catch (error: any) {
+    console.error("Error fetching public content:", error);
+    return { success: false, error: error.message || "An unexpected error occurred" };
+  }
+};
+
 // Services Page APIs
 export const getAllServices = async (): Promise<ApiResponse<any[]>> => {
   try {
-    const response = await fetch(`${API_BASE_URL}/api/services`);
+    const response = await apiFetch(`${API_BASE_URL}/api/services`);
     return response.json();
   } catch (error: any) {
     console.error("Error fetching all services:", error);
@@ -128,7 +171,7 @@ export const getAllServices = async (): Promise<ApiResponse<any[]>> => {
 
 export const getServiceById = async (id: number): Promise<ApiResponse<any>> => {
   try {
-    const response = await fetch(`${API_BASE_URL}/api/services/${id}`);
+    const response = await apiFetch(`${API_BASE_URL}/api/services/${id}`);
     return response.json();
   } catch (error: any) {
     console.error(`Error fetching service with ID ${id}:`, error);
@@ -138,7 +181,7 @@ export const getServiceById = async (id: number): Promise<ApiResponse<any>> => {
 
 export const createService = async (serviceData: any): Promise<ApiResponse<any>> => {
   try {
-    const response = await fetch(`${API_BASE_URL}/api/services`, {
+    const response = await apiFetch(`${API_BASE_URL}/api/services`, {
     method: 'POST',
       headers: {
         'Content-Type': 'application/json',
@@ -154,7 +197,7 @@ export const createService = async (serviceData: any): Promise<ApiResponse<any>>
 
 export const updateService = async (id: number, serviceData: any): Promise<ApiResponse<any>> => {
   try {
-    const response = await fetch(`${API_BASE_URL}/api/services/${id}`, {
+    const response = await apiFetch(`${API_BASE_URL}/api/services/${id}`, {
       method: 'PUT',
       headers: {
         'Content-Type': 'application/json',
@@ -170,7 +213,7 @@ export const updateService = async (id: number, serviceData: any): Promise<ApiRe
 
 export const deleteService = async (id: number): Promise<ApiResponse<any>> => {
   try {
-    const response = await fetch(`${API_BASE_URL}/api/services/${id}`, {
+    const response = await apiFetch(`${API_BASE_URL}/api/services/${id}`, {
       method: 'DELETE',
     });
     return response.json();
@@ -184,7 +227,7 @@ export const deleteService = async (id: number): Promise<ApiResponse<any>> => {
 export const getAllProjects = async (category?: string): Promise<ApiResponse<any[]>> => {
   try {
     const url = category && category !== 'All' ? `${API_BASE_URL}/api/projects?category=${category}` : `${API_BASE_URL}/api/projects`;
-    const response = await fetch(url);
+    const response = await apiFetch(url);
     return response.json();
   } catch (error: any) {
     console.error("Error fetching projects:", error);
@@ -194,7 +237,7 @@ export const getAllProjects = async (category?: string): Promise<ApiResponse<any
 
 export const getProjectById = async (id: number): Promise<ApiResponse<any>> => {
   try {
-    const response = await fetch(`${API_BASE_URL}/api/projects/${id}`);
+    const response = await apiFetch(`${API_BASE_URL}/api/projects/${id}`);
     return response.json();
   } catch (error: any) {
     console.error(`Error fetching project with ID ${id}:`, error);
@@ -204,7 +247,7 @@ export const getProjectById = async (id: number): Promise<ApiResponse<any>> => {
 
 export const createProject = async (projectData: any): Promise<ApiResponse<any>> => {
   try {
-    const response = await fetch(`${API_BASE_URL}/api/projects`, {
+    const response = await apiFetch(`${API_BASE_URL}/api/projects`, {
     method: 'POST',
       headers: {
         'Content-Type': 'application/json',
@@ -220,7 +263,7 @@ export const createProject = async (projectData: any): Promise<ApiResponse<any>>
 
 export const updateProject = async (id: number, projectData: any): Promise<ApiResponse<any>> => {
   try {
-    const response = await fetch(`${API_BASE_URL}/api/projects/${id}`, {
+    const response = await apiFetch(`${API_BASE_URL}/api/projects/${id}`, {
       method: 'PUT',
       headers: {
         'Content-Type': 'application/json',
@@ -236,7 +279,7 @@ export const updateProject = async (id: number, projectData: any): Promise<ApiRe
 
 export const deleteProject = async (id: number): Promise<ApiResponse<any>> => {
   try {
-    const response = await fetch(`${API_BASE_URL}/api/projects/${id}`, {
+    const response = await apiFetch(`${API_BASE_URL}/api/projects/${id}`, {
       method: 'DELETE',
     });
     return response.json();
@@ -260,7 +303,7 @@ export const getBlogPosts = async (category?: string, searchTerm?: string): Prom
     if (params.toString()) {
       url += `?${params.toString()}`;
     }
-    const response = await fetch(url);
+    const response = await apiFetch(url);
     return response.json();
   } catch (error: any) {
     console.error("Error fetching blog posts:", error);
@@ -270,7 +313,7 @@ export const getBlogPosts = async (category?: string, searchTerm?: string): Prom
 
 export const getBlogPostById = async (id: number): Promise<ApiResponse<any>> => {
   try {
-    const response = await fetch(`${API_BASE_URL}/api/blog/posts/${id}`);
+    const response = await apiFetch(`${API_BASE_URL}/api/blog/posts/${id}`);
     return response.json();
   } catch (error: any) {
     console.error(`Error fetching blog post with ID ${id}:`, error);
@@ -280,7 +323,7 @@ export const getBlogPostById = async (id: number): Promise<ApiResponse<any>> =>
 
 export const getBlogCategories = async (): Promise<ApiResponse<string[]>> => {
   try {
-    const response = await fetch(`${API_BASE_URL}/api/blog/categories`);
+    const response = await apiFetch(`${API_BASE_URL}/api/blog/categories`);
     return response.json();
   } catch (error: any) {
     console.error("Error fetching blog categories:", error);
@@ -290,7 +333,7 @@ export const getBlogCategories = async (): Promise<ApiResponse<string[]>> => {
 
 export const createBlogPost = async (blogPostData: any): Promise<ApiResponse<any>> => {
   try {
-    const response = await fetch(`${API_BASE_URL}/api/blog/posts`, {
+    const response = await apiFetch(`${API_BASE_URL}/api/blog/posts`, {
       method: 'POST',
       headers: {
         'Content-Type': 'application/json',
@@ -306,7 +349,7 @@ export const createBlogPost = async (blogPostData: any): Promise<ApiResponse<any
 
 export const updateBlogPost = async (id: number, blogPostData: any): Promise<ApiResponse<any>> => {
   try {
-    const response = await fetch(`${API_BASE_URL}/api/blog/posts/${id}`, {
+    const response = await apiFetch(`${API_BASE_URL}/api/blog/posts/${id}`, {
       method: 'PUT',
       headers: {
         'Content-Type': 'application/json',
@@ -322,7 +365,7 @@ export const updateBlogPost = async (id: number, blogPostData: any): Promise<Api
 
 export const deleteBlogPost = async (id: number): Promise<ApiResponse<any>> => {
   try {
-    const response = await fetch(`${API_BASE_URL}/api/blog/posts/${id}`, {
+    const response = await apiFetch(`${API_BASE_URL}/api/blog/posts/${id}`, {
       method: 'DELETE',
     });
     return response.json();
@@ -335,7 +378,7 @@ export const deleteBlogPost = async (id: number): Promise<ApiResponse<any>> => {
 // About Page APIs
 export const getTeamMembers = async (): Promise<ApiResponse<any[]>> => {
   try {
-    const response = await fetch(`${API_BASE_URL}/api/about/team`);
+    const response = await apiFetch(`${API_BASE_URL}/api/about/team`);
     return response.json();
   } catch (error: any) {
     console.error("Error fetching team members:", error);
@@ -345,7 +388,7 @@ export const getTeamMembers = async (): Promise<ApiResponse<any[]>> => {
 
 export const createTeamMember = async (teamMemberData: any): Promise<ApiResponse<any>> => {
   try {
-    const response = await fetch(`${API_BASE_URL}/api/about/team`, {
+    const response = await apiFetch(`${API_BASE_URL}/api/about/team`, {
       method: 'POST',
       headers: {
         'Content-Type': 'application/json',
@@ -361,7 +404,7 @@ export const createTeamMember = async (teamMemberData: any): Promise<ApiResponse
 
 export const updateTeamMember = async (id: number, teamMemberData: any): Promise<ApiResponse<any>> => {
   try {
-    const response = await fetch(`${API_BASE_URL}/api/about/team/${id}`, {
+    const response = await apiFetch(`${API_BASE_URL}/api/about/team/${id}`, {
       method: 'PUT',
       headers: {
         'Content-Type': 'application/json',
@@ -377,7 +420,7 @@ export const updateTeamMember = async (id: number, teamMemberData: any): Promise
 
 export const deleteTeamMember = async (id: number): Promise<ApiResponse<any>> => {
   try {
-    const response = await fetch(`${API_BASE_URL}/api/about/team/${id}`, {
+    const response = await apiFetch(`${API_BASE_URL}/api/about/team/${id}`, {
       method: 'DELETE',
     });
     return response.json();
@@ -389,7 +432,7 @@ export const deleteTeamMember = async (id: number): Promise<ApiResponse<any>> =>
 
 export const getCertifications = async (): Promise<ApiResponse<any[]>> => {
   try {
-    const response = await fetch(`${API_BASE_URL}/api/about/certifications`);
+    const response = await apiFetch(`${API_BASE_URL}/api/about/certifications`);
     return response.json();
   } catch (error: any) {
     console.error("Error fetching certifications:", error);
@@ -399,7 +442,7 @@ export const getCertifications = async (): Promise<ApiResponse<any[]>> => {
 
 export const createCertification = async (certificationData: any): Promise<ApiResponse<any>> => {
   try {
-    const response = await fetch(`${API_BASE_URL}/api/about/certifications`, {
+    const response = await apiFetch(`${API_BASE_URL}/api/about/certifications`, {
       method: 'POST',
       headers: {
         'Content-Type': 'application/json',
@@ -415,7 +458,7 @@ export const createCertification = async (certificationData: any): Promise<ApiRe
 
 export const updateCertification = async (id: number, certificationData: any): Promise<ApiResponse<any>> => {
   try {
-    const response = await fetch(`${API_BASE_URL}/api/about/certifications/${id}`, {
+    const response = await apiFetch(`${API_BASE_URL}/api/about/certifications/${id}`, {
       method: 'PUT',
       headers: {
         'Content-Type': 'application/json',
@@ -431,7 +474,7 @@ export const updateCertification = async (id: number, certificationData: any): P
 
 export const deleteCertification = async (id: number): Promise<ApiResponse<any>> => {
   try {
-    const response = await fetch(`${API_BASE_URL}/api/about/certifications/${id}`, {
+    const response = await apiFetch(`${API_BASE_URL}/api/about/certifications/${id}`, {
       method: 'DELETE',
     });
     return response.json();
@@ -443,7 +486,7 @@ export const deleteCertification = async (id: number): Promise<ApiResponse<any>>
 
 export const getAwards = async (): Promise<ApiResponse<any[]>> => {
   try {
-    const response = await fetch(`${API_BASE_URL}/api/about/awards`);
+    const response = await apiFetch(`${API_BASE_URL}/api/about/awards`);
     return response.json();
   } catch (error: any) {
     console.error("Error fetching awards:", error);
@@ -453,7 +496,7 @@ export const getAwards = async (): Promise<ApiResponse<any[]>> => {
 
 export const createAward = async (awardData: any): Promise<ApiResponse<any>> => {
   try {
-    const response = await fetch(`${API_BASE_URL}/api/about/awards`, {
+    const response = await apiFetch(`${API_BASE_URL}/api/about/awards`, {
       method: 'POST',
       headers: {
         'Content-Type': 'application/json',
@@ -469,7 +512,7 @@ export const createAward = async (awardData: any): Promise<ApiResponse<any>> =>
 
 export const updateAward = async (id: number, awardData: any): Promise<ApiResponse<any>> => {
   try {
-    const response = await fetch(`${API_BASE_URL}/api/about/awards/${id}`, {
+    const response = await apiFetch(`${API_BASE_URL}/api/about/awards/${id}`, {
       method: 'PUT',
       headers: {
         'Content-Type': 'application/json',
@@ -485,7 +528,7 @@ export const updateAward = async (id: number, awardData: any): Promise<ApiRespon
 
 export const deleteAward = async (id: number): Promise<ApiResponse<any>> => {
   try {
-    const response = await fetch(`${API_BASE_URL}/api/about/awards/${id}`, {
+    const response = await apiFetch(`${API_BASE_URL}/api/about/awards/${id}`, {
       method: 'DELETE',
     });
     return response.json();
@@ -497,7 +540,7 @@ export const deleteAward = async (id: number): Promise<ApiResponse<any>> => {
 
 export const createCompanyStat = async (companyStatData: any): Promise<ApiResponse<any>> => {
   try {
-    const response = await fetch(`${API_BASE_URL}/api/home/stats`, {
+    const response = await apiFetch(`${API_BASE_URL}/api/home/stats`, {
       method: 'POST',
       headers: {
         'Content-Type': 'application/json',
@@ -513,7 +556,7 @@ export const createCompanyStat = async (companyStatData: any): Promise<ApiRespon
 
 export const updateCompanyStat = async (id: number, companyStatData: any): Promise<ApiResponse<any>> => {
   try {
-    const response = await fetch(`${API_BASE_URL}/api/home/stats/${id}`, {
+    const response = await apiFetch(`${API_BASE_URL}/api/home/stats/${id}`, {
       method: 'PUT',
       headers: {
         'Content-Type': 'application/json',
@@ -529,7 +572,7 @@ export const updateCompanyStat = async (id: number, companyStatData: any): Promi
 
 export const deleteCompanyStat = async (id: number): Promise<ApiResponse<any>> => {
   try {
-    const response = await fetch(`${API_BASE_URL}/api/home/stats/${id}`, {
+    const response = await apiFetch(`${API_BASE_URL}/api/home/stats/${id}`, {
       method: 'DELETE',
     });
     return response.json();
@@ -541,7 +584,7 @@ export const deleteCompanyStat = async (id: number): Promise<ApiResponse<any>> =
 
 export const createTestimonial = async (testimonialData: any): Promise<ApiResponse<any>> => {
   try {
-    const response = await fetch(`${API_BASE_URL}/api/testimonials`, {
+    const response = await apiFetch(`${API_BASE_URL}/api/testimonials`, {
       method: 'POST',
       headers: {
         'Content-Type': 'application/json',
@@ -557,7 +600,7 @@ export const createTestimonial = async (testimonialData: any): Promise<ApiRespon
 
 export const updateTestimonial = async (id: number, testimonialData: any): Promise<ApiResponse<any>> => {
   try {
-    const response = await fetch(`${API_BASE_URL}/api/testimonials/${id}`, {
+    const response = await apiFetch(`${API_BASE_URL}/api/testimonials/${id}`, {
       method: 'PUT',
       headers: {
         'Content-Type': 'application/json',
@@ -573,7 +616,7 @@ export const updateTestimonial = async (id: number, testimonialData: any): Promi
 
 export const deleteTestimonial = async (id: number): Promise<ApiResponse<any>> => {
   try {
-    const response = await fetch(`${API_BASE_URL}/api/testimonials/${id}`, {
+    const response = await apiFetch(`${API_BASE_URL}/api/testimonials/${id}`, {
       method: 'DELETE',
     });
     return response.json();
@@ -586,7 +629,7 @@ export const deleteTestimonial = async (id: number): Promise<ApiResponse<any>> =
 // Contact Page APIs
 export const submitContactForm = async (formData: any): Promise<ApiResponse<any>> => {
   try {
-    const response = await fetch(`${API_BASE_URL}/api/contact/submit`, {
+    const response = await apiFetch(`${API_BASE_URL}/api/contact/submit`, {
     method: 'POST',
       headers: {
         'Content-Type': 'application/json',
@@ -600,9 +643,23 @@ export const submitContactForm = async (formData: any): Promise<ApiResponse<any>
   }
 };
 
-export const getContactSubmissions = async (): Promise<ApiResponse<any[]>> => {
+export const getContactSubmissions = async (status?: string, cursor?: string | null, limit?: number): Promise<PagedApiResponse<any>> => {
   try {
-    const response = await fetch(`${API_BASE_URL}/api/contact/submissions`);
+    let url = `${API_BASE_URL}/api/contact/submissions`;
+    const params = new URLSearchParams();
+    if (status && status !== 'All') {
+      params.append('status', status);
+    }
+    if (cursor) {
+      params.append('cursor', cursor);
+    }
+    if (limit) {
+      params.append('limit', limit.toString());
+    }
+    if (params.toString()) {
+      url += `?${params.toString()}`;
+    }
+    const response = await apiFetch(url);
     return response.json();
   } catch (error: any) {
     console.error("Error fetching contact submissions:", error);
@@ -610,9 +667,35 @@ export const getContactSubmissions = async (): Promise<ApiResponse<any[]>> => {
   }
 };
 
+export const getContactSubmissionCounts = async (): Promise<ApiResponse<Record<string, number>>> => {
+  try {
+    const response = await apiFetch(`${API_BASE_URL}/api/contact/submissions/counts`);
+    return response.json();
+  } catch (error: any) {
+    console.error("Error fetching contact submission counts:", error);
+    return { success: false, error: error.message || "An unexpected error occurred" };
+  }
+};
+
+export const updateContactSubmissionStatus = async (ids: number[], status: string): Promise<ApiResponse<{ updated: number }>> => {
+  try {
+    const response = await apiFetch(`${API_BASE_URL}/api/contact/submissions/status`, {
+      method: 'PUT',
+      headers: {
+        'Content-Type': 'application/json',
+      },
+      body: JSON.stringify({ ids, status }),
+    });
+    return response.json();
+  } catch (error: any) {
+    console.error("Error updating contact submission status:", error);
+    return { success: false, error: error.message || "An unexpected error occurred" };
+  }
+};
+
 export const deleteContactSubmission = async (id: number): Promise<ApiResponse<any>> => {
   try {
-    const response = await fetch(`${API_BASE_URL}/api/contact/submissions/${id}`, {
+    const response = await apiFetch(`${API_BASE_URL}/api/contact/submissions/${id}`, {
       method: 'DELETE',
     });
     return response.json();
@@ -640,7 +723,7 @@ export const getSites = async (status?: string, startDate?: string, endDate?: st
     if (params.toString()) {
       url += `?${params.toString()}`;
     }
-    const response = await fetch(url);
+    const response = await apiFetch(url);
     return response.json();
   } catch (error: any) {
     console.error("Error fetching sites:", error);
@@ -650,7 +733,7 @@ export const getSites = async (status?: string, startDate?: string, endDate?: st
 
 export const getSiteById = async (id: number): Promise<ApiResponse<any>> => {
   try {
-    const response = await fetch(`${API_BASE_URL}/api/sites/${id}`);
+    const response = await apiFetch(`${API_BASE_URL}/api/sites/${id}`);
     return response.json();
   } catch (error: any) {
     console.error(`Error fetching site with ID ${id}:`, error);
@@ -660,7 +743,7 @@ export const getSiteById = async (id: number): Promise<ApiResponse<any>> => {
 
 export const createSite = async (siteData: any): Promise<ApiResponse<any>> => {
   try {
-    const response = await fetch(`${API_BASE_URL}/api/sites`, {
+    const response = await apiFetch(`${API_BASE_URL}/api/sites`, {
       method: 'POST',
       headers: {
         'Content-Type': 'application/json',
@@ -676,7 +759,7 @@ export const createSite = async (siteData: any): Promise<ApiResponse<any>> => {
 
 export const updateSite = async (id: number, siteData: any): Promise<ApiResponse<any>> => {
   try {
-    const response = await fetch(`${API_BASE_URL}/api/sites/${id}`, {
+    const response = await apiFetch(`${API_BASE_URL}/api/sites/${id}`, {
       method: 'PUT',
       headers: {
         'Content-Type': 'application/json',
@@ -692,7 +775,7 @@ export const updateSite = async (id: number, siteData: any): Promise<ApiResponse
 
 export const deleteSite = async (id: number): Promise<ApiResponse<any>> => {
   try {
-    const response = await fetch(`${API_BASE_URL}/api/sites/${id}`, {
+    const response = await apiFetch(`${API_BASE_URL}/api/sites/${id}`, {
       method: 'DELETE',
     });
     return response.json();
@@ -716,7 +799,7 @@ export const getWorkers = async (siteId?: number, isActive?: boolean): Promise<A
     if (params.toString()) {
       url += `?${params.toString()}`;
     }
-    const response = await fetch(url);
+    const response = await apiFetch(url);
     return response.json();
   } catch (error: any) {
     console.error("Error fetching workers:", error);
@@ -726,7 +809,7 @@ export const getWorkers = async (siteId?: number, isActive?: boolean): Promise<A
 
 export const getWorkerById = async (id: number): Promise<ApiResponse<any>> => {
   try {
-    const response = await fetch(`${API_BASE_URL}/api/workers/${id}`);
+    const response = await apiFetch(`${API_BASE_URL}/api/workers/${id}`);
     return response.json();
   } catch (error: any) {
     console.error(`Error fetching worker with ID ${id}:`, error);
@@ -736,7 +819,7 @@ export const getWorkerById = async (id: number): Promise<ApiResponse<any>> => {
 
 export const createWorker = async (workerData: any): Promise<ApiResponse<any>> => {
   try {
-    const response = await fetch(`${API_BASE_URL}/api/workers`, {
+    const response = await apiFetch(`${API_BASE_URL}/api/workers`, {
       method: 'POST',
       headers: {
         'Content-Type': 'application/json',
@@ -752,7 +835,7 @@ export const createWorker = async (workerData: any): Promise<ApiResponse<any>> =
 
 export const updateWorker = async (id: number, workerData: any): Promise<ApiResponse<any>> => {
   try {
-    const response = await fetch(`${API_BASE_URL}/api/workers/${id}`, {
+    const response = await apiFetch(`${API_BASE_URL}/api/workers/${id}`, {
       method: 'PUT',
       headers: {
         'Content-Type': 'application/json',
@@ -768,7 +851,7 @@ export const updateWorker = async (id: number, workerData: any): Promise<ApiResp
 
 export const deleteWorker = async (id: number): Promise<ApiResponse<any>> => {
   try {
-    const response = await fetch(`${API_BASE_URL}/api/workers/${id}`, {
+    const response = await apiFetch(`${API_BASE_URL}/api/workers/${id}`, {
       method: 'DELETE',
     });
     return response.json();
@@ -798,7 +881,7 @@ export const getDailyActivities = async (siteId?: number, startDate?: string, en
     if (params.toString()) {
       url += `?${params.toString()}`;
     }
-    const response = await fetch(url);
+    const response = await apiFetch(url);
     return response.json();
   } catch (error: any) {
     console.error("Error fetching daily activities:", error);
@@ -808,7 +891,7 @@ export const getDailyActivities = async (siteId?: number, startDate?: string, en
 
 export const getDailyActivityById = async (id: number): Promise<ApiResponse<any>> => {
   try {
-    const response = await fetch(`${API_BASE_URL}/api/daily-activities/${id}`);
+    const response = await apiFetch(`${API_BASE_URL}/api/daily-activities/${id}`);
     return response.json();
   } catch (error: any) {
     console.error(`Error fetching daily activity with ID ${id}:`, error);
@@ -818,7 +901,7 @@ export const getDailyActivityById = async (id: number): Promise<ApiResponse<any>
 
 export const createDailyActivity = async (activityData: any): Promise<ApiResponse<any>> => {
   try {
-    const response = await fetch(`${API_BASE_URL}/api/daily-activities`, {
+    const response = await apiFetch(`${API_BASE_URL}/api/daily-activities`, {
       method: 'POST',
       headers: {
         'Content-Type': 'application/json',
@@ -834,7 +917,7 @@ export const createDailyActivity = async (activityData: any): Promise<ApiRespons
 
 export const updateDailyActivity = async (id: number, activityData: any): Promise<ApiResponse<any>> => {
   try {
-    const response = await fetch(`${API_BASE_URL}/api/daily-activities/${id}`, {
+    const response = await apiFetch(`${API_BASE_URL}/api/daily-activities/${id}`, {
       method: 'PUT',
       headers: {
         'Content-Type': 'application/json',
@@ -850,7 +933,7 @@ export const updateDailyActivity = async (id: number, activityData: any): Promis
 
 export const deleteDailyActivity = async (id: number): Promise<ApiResponse<any>> => {
   try {
-    const response = await fetch(`${API_BASE_URL}/api/daily-activities/${id}`, {
+    const response = await apiFetch(`${API_BASE_URL}/api/daily-activities/${id}`, {
       method: 'DELETE',
     });
     return response.json();
@@ -889,7 +972,7 @@ export const getCosts = async (siteId?: number, workerId?: number, costType?: st
     if (params.toString()) {
       url += `?${params.toString()}`;
     }
-    const response = await fetch(url);
+    const response = await apiFetch(url);
     return response.json();
   } catch (error: any) {
     console.error("Error fetching costs:", error);
@@ -899,7 +982,7 @@ export const getCosts = async (siteId?: number, workerId?: number, costType?: st
 
 export const getCostById = async (id: number): Promise<ApiResponse<any>> => {
   try {
-    const response = await fetch(`${API_BASE_URL}/api/costs/${id}`);
+    const response = await apiFetch(`${API_BASE_URL}/api/costs/${id}`);
     return response.json();
   } catch (error: any) {
     console.error(`Error fetching cost with ID ${id}:`, error);
@@ -909,7 +992,7 @@ export const getCostById = async (id: number): Promise<ApiResponse<any>> => {
 
 export const createCost = async (costData: any): Promise<ApiResponse<any>> => {
   try {
-    const response = await fetch(`${API_BASE_URL}/api/costs`, {
+    const response = await apiFetch(`${API_BASE_URL}/api/costs`, {
       method: 'POST',
       headers: {
         'Content-Type': 'application/json',
@@ -925,7 +1008,7 @@ export const createCost = async (costData: any): Promise<ApiResponse<any>> => {
 
 export const updateCost = async (id: number, costData: any): Promise<ApiResponse<any>> => {
   try {
-    const response = await fetch(`${API_BASE_URL}/api/costs/${id}`, {
+    const response = await apiFetch(`${API_BASE_URL}/api/costs/${id}`, {
       method: 'PUT',
       headers: {
         'Content-Type': 'application/json',
@@ -941,7 +1024,7 @@ export const updateCost = async (id: number, costData: any): Promise<ApiResponse
 
 export const deleteCost = async (id: number): Promise<ApiResponse<any>> => {
   try {
-    const response = await fetch(`${API_BASE_URL}/api/costs/${id}`, {
+    const response = await apiFetch(`${API_BASE_URL}/api/costs/${id}`, {
       method: 'DELETE',
     });
     return response.json();
@@ -954,11 +1037,11 @@ export const deleteCost = async (id: number): Promise<ApiResponse<any>> => {
 // Generic API client for axios-like usage
 export const api = {
   get: async (url: string) => {
-    const response = await fetch(`${API_BASE_URL}/api${url}`);
+    const response = await apiFetch(`${API_BASE_URL}/api${url}`);
     return { data: await response.json() };
   },
   post: async (url: string, data: any) => {
-    const response = await fetch(`${API_BASE_URL}/api${url}`, {
+    const response = await apiFetch(`${API_BASE_URL}/api${url}`, {
       method: 'POST',
       headers: {
         'Content-Type': 'application/json',
@@ -968,7 +1051,7 @@ export const api = {
     return { data: await response.json() };
   },
   put: async (url: string, data: any) => {
-    const response = await fetch(`${API_BASE_URL}/api${url}`, {
+    const response = await apiFetch(`${API_BASE_URL}/api${url}`, {
       method: 'PUT',
       headers: {
         'Content-Type': 'application/json',
@@ -978,7 +1061,7 @@ export const api = {
     return { data: await response.json() };
   },
   delete: async (url: string) => {
-    const response = await fetch(`${API_BASE_URL}${url}`, {
+    const response = await apiFetch(`${API_BASE_URL}${url}`, {
       method: 'DELETE',
     });
     return { data: await response.json() };